@@ -0,0 +1,125 @@
+"""Compare sync and async read views under uvicorn.
+
+The catalog is seeded in the test database, then a single worker uvicorn is
+started per stack, with ASYNC_VIEWS off and on. Concurrent readers sharing one
+logged in session cycle through the home, catalog and entity pages. Requests per
+second, mean latency and the resident memory of the worker after the load are
+printed, so both stacks are compared with the same process count.
+
+Usage: ``python -m benchmarks.asgi [--readers N] [--requests N]``.
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks import common
+
+MEGABYTE = 1024 * 1024
+REQUEST_TIMEOUT = 60
+
+
+async def read_pages(client, urls, requests_amount, latencies):
+    """Read pages one after another like a single reader.
+
+    Args:
+        client: HTTP client.
+        urls (list[str]): pages to cycle through.
+        requests_amount (int): requests to send.
+        latencies (list[float]): storage for seconds per request.
+    """
+    for index in range(requests_amount):
+        start = time.perf_counter()
+        response = await client.get(urls[index % len(urls)])
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+
+
+async def load(base_url, session_id, urls, args):
+    """Warm the server up, then send requests of concurrent readers.
+
+    Args:
+        base_url (str): server address.
+        session_id (str): session cookie of the logged in user.
+        urls (list[str]): pages to cycle through.
+        args: parsed command line arguments.
+
+    Returns:
+        tuple[float, float]: requests per second and mean latency in milliseconds.
+    """
+    import httpx
+
+    latencies = []
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        cookies={'sessionid': session_id},
+        limits=httpx.Limits(max_connections=args.readers),
+        timeout=REQUEST_TIMEOUT,
+    ) as client:
+        await read_pages(client, urls, len(urls), [])
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            read_pages(client, urls, args.requests, latencies) for _ in range(args.readers)
+        ))
+        seconds = time.perf_counter() - start
+    mean_latency = sum(latencies) / len(latencies)
+    return round(len(latencies) / seconds), round(mean_latency * 1000, 1)
+
+
+def measure(session_id, urls, async_views, args):
+    """Serve one stack and load it.
+
+    Args:
+        session_id (str): session cookie of the logged in user.
+        urls (list[str]): pages to cycle through.
+        async_views (bool): whether read pages use the async views.
+        args: parsed command line arguments.
+
+    Returns:
+        str: requests per second, mean latency and RSS of the worker.
+    """
+    import psutil
+
+    with common.uvicorn_server(ASYNC_VIEWS=str(async_views).lower()) as (base_url, server):
+        speed, latency = asyncio.run(load(base_url, session_id, urls, args))
+        rss = psutil.Process(server.pid).memory_info().rss
+    return f'{speed} requests/s, {latency} ms mean latency, {round(rss / MEGABYTE, 1)} MB RSS'
+
+
+def seed():
+    """Seed the catalog and log a user in.
+
+    Returns:
+        tuple[str, list[str]]: session cookie and pages to read.
+    """
+    from django.contrib.auth.models import User
+    from django.test.client import Client
+
+    link = common.seed_catalog(10, 20, 2000)[0]
+    client = Client()
+    client.force_login(User.objects.create(username='benchmark'))
+    urls = [
+        '/', '/competitions/', '/sports/', '/stages/',
+        f'/competition/?id={link.competition_id.pk}',
+        f'/sport/?id={link.sport_id.pk}',
+    ]
+    return client.cookies['sessionid'].value, urls
+
+
+def main():
+    """Seed the test database and print throughput of both stacks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--readers', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=50)
+    args = parser.parse_args()
+    common.setup()
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    with common.test_database():
+        session_id, urls = seed()
+        for name, async_views in (('sync', False), ('async', True)):
+            print(f'{name}: {measure(session_id, urls, async_views, args)}')
+
+
+if __name__ == '__main__':
+    main()
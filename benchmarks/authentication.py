@@ -0,0 +1,63 @@
+"""Compare API throughput with and without the token cache.
+
+A token authenticated client requests a small flat page of sports through the
+whole Django stack, once with TOKEN_CACHE_TTL disabled and once enabled.
+
+Usage: ``python -m benchmarks.authentication [--requests N]``.
+"""
+import argparse
+import time
+
+from benchmarks import common
+
+URL = '/api/sports/?mode=flat&page_size=10'
+
+
+def measure(client, requests_amount):
+    """Send requests and count queries.
+
+    Args:
+        client: authenticated API client.
+        requests_amount (int): requests to send.
+
+    Returns:
+        tuple[float, float]: requests per second and queries per request.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    client.get(URL)
+    queries = CaptureQueriesContext(connection)
+    start = time.perf_counter()
+    with queries:
+        for _ in range(requests_amount):
+            client.get(URL)
+    seconds = time.perf_counter() - start
+    return round(requests_amount / seconds), len(queries) / requests_amount
+
+
+def main():
+    """Seed the test database and print throughput of both modes."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+    common.setup()
+    from django.contrib.auth.models import User
+    from django.test.utils import override_settings, setup_test_environment
+    from rest_framework.authtoken.models import Token
+    from rest_framework.test import APIClient
+
+    setup_test_environment()
+    with common.test_database():
+        common.seed_catalog(10, 20, 100)
+        token = Token.objects.create(user=User.objects.create(username='benchmark'))
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        for name, ttl in (('uncached', 0), ('cached', 300)):
+            with override_settings(TOKEN_CACHE_TTL=ttl):
+                speed, queries = measure(client, args.requests)
+            print(f'{name}: {speed} requests/s, {queries} queries per request')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""Common helpers for benchmarks.
+
+Benchmarks run against a throwaway test database created by the project test runner,
+so they never touch real data. Run them from the repository root, e.g.
+``python -m benchmarks.explain_indexes``.
+"""
+import os
+import socket
+import subprocess  # noqa: S404
+import sys
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import django
+
+SETTINGS_MODULE = 'competitions.settings'
+BASE_YEAR = 2030
+COMPETITION_DAYS = 30
+ODDS_SEED = 0
+SERVER_HOST = '127.0.0.1'
+SERVER_STARTUP_SECONDS = 30
+SERVER_POLL_SECONDS = 0.1
+
+
+def setup():
+    """Configure Django for a standalone benchmark script."""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', SETTINGS_MODULE)
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    """Create the test database for the duration of the block.
+
+    Yields:
+        None: database is ready to use.
+    """
+    from tests.runner import PostgresSchemaRunner
+
+    runner = PostgresSchemaRunner(verbosity=0, interactive=False)
+    old_config = runner.setup_databases()
+    try:
+        yield
+    finally:
+        runner.teardown_databases(old_config)
+
+
+def get_free_port() -> int:
+    """Pick a free local port.
+
+    Returns:
+        int: port number.
+    """
+    with socket.socket() as probe:
+        probe.bind((SERVER_HOST, 0))
+        return probe.getsockname()[1]
+
+
+def wait_for_port(port) -> bool:
+    """Wait until a local port accepts connections.
+
+    Args:
+        port (int): port number.
+
+    Returns:
+        bool: whether the port accepts connections in time.
+    """
+    deadline = time.monotonic() + SERVER_STARTUP_SECONDS
+    while time.monotonic() < deadline:
+        with socket.socket() as probe:
+            if not probe.connect_ex((SERVER_HOST, port)):
+                return True
+        time.sleep(SERVER_POLL_SECONDS)
+    return False
+
+
+@contextmanager
+def uvicorn_server(**env):
+    """Serve the project with a single worker uvicorn against the test database.
+
+    Args:
+        env: environment variables overriding settings of the server.
+
+    Raises:
+        RuntimeError: if the server does not start in time.
+
+    Yields:
+        tuple[str, Popen]: server address and process.
+    """
+    from django.db import connection
+
+    port = get_free_port()
+    server = subprocess.Popen(  # noqa: S603
+        [
+            sys.executable, '-m', 'uvicorn', 'competitions.asgi:application', '--host',
+            SERVER_HOST, '--port', str(port), '--workers', '1', '--log-level', 'warning',
+        ],
+        env=dict(os.environ, PG_DBNAME=connection.settings_dict['NAME'], **env),
+    )
+    if not wait_for_port(port):
+        server.kill()
+        raise RuntimeError('uvicorn did not start')
+    try:
+        yield f'http://{SERVER_HOST}:{port}', server
+    finally:
+        server.terminate()
+        server.wait()
+
+
+@contextmanager
+def timer(timings, name):
+    """Measure wall time of the block.
+
+    Args:
+        timings (dict): storage for measured seconds.
+        name (str): measurement name.
+
+    Yields:
+        None: measurement is running.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = time.perf_counter() - start
+
+
+def seed_catalog(competitions_amount, sports_amount, stages_amount, batch_size=5000):
+    """Bulk create a catalog where every competition holds every sport.
+
+    Stages are spread round-robin over competition sports and dated inside their
+    competition bounds, their coefficients come from a seeded generator.
+
+    Args:
+        competitions_amount (int): competitions to create.
+        sports_amount (int): sports to create.
+        stages_amount (int): stages to create.
+        batch_size (int): rows per INSERT.
+
+    Returns:
+        list[CompetitionsSports]: created competition sports links.
+    """
+    from competitions_app.models import Competition, CompetitionsSports, Sport, Stage
+    from competitions_app.odds import OddsGenerator
+
+    start = date(BASE_YEAR, 1, 1)
+    competitions = [
+        Competition(
+            name=f'competition {index}',
+            competition_start=start + timedelta(days=index),
+            competition_end=start + timedelta(days=index + COMPETITION_DAYS),
+        )
+        for index in range(competitions_amount)
+    ]
+    Competition.objects.bulk_create(competitions, batch_size=batch_size)
+    sports = [Sport(name=f'sport {index}') for index in range(sports_amount)]
+    Sport.objects.bulk_create(sports, batch_size=batch_size)
+    links = [
+        CompetitionsSports(competition_id=competition, sport_id=sport)
+        for competition in competitions
+        for sport in sports
+    ]
+    CompetitionsSports.objects.bulk_create(links, batch_size=batch_size)
+    odds_generator = OddsGenerator(ODDS_SEED)
+    batch = []
+    for index in range(stages_amount):
+        link = links[index % len(links)]
+        batch.append(Stage(
+            name=f'stage {index}',
+            comp_sport=link,
+            stage_date=link.competition_id.competition_start + timedelta(
+                days=index % COMPETITION_DAYS,
+            ),
+        ))
+        if len(batch) >= batch_size:
+            Stage.objects.bulk_create(batch, odds_generator=odds_generator)
+            batch = []
+    Stage.objects.bulk_create(batch, odds_generator=odds_generator)
+    return links
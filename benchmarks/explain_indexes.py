@@ -0,0 +1,136 @@
+"""Capture EXPLAIN ANALYZE plans before and after the ordering indexes migration.
+
+Usage: ``python -m benchmarks.explain_indexes [--stages N] [--competitions N] [--sports N]``.
+"""
+import argparse
+
+from benchmarks import common
+
+BEFORE = '0002_remove_competition_check_start_date_and_more'
+AFTER = '0003_ordering_indexes_and_constraints'
+APP = 'competitions_app'
+DEEP_PAGE = 1000
+
+
+def get_queries():
+    """Build queries following the catalog and bet access paths.
+
+    Only columns existing on both migration states are selected.
+
+    Returns:
+        dict[str, QuerySet]: named querysets to explain.
+    """
+    from competitions_app.models import Competition, CompetitionsSports, Sport, Stage
+    from competitions_app.models import StageClient
+    from competitions_app.pagination import get_keyset_ordering, get_nullable_fields
+    from competitions_app.pagination import keyset_filter
+
+    stage_ordering = get_keyset_ordering(Stage)
+    boundary = Stage.objects.order_by(*stage_ordering).values_list(
+        *stage_ordering,
+    )[DEEP_PAGE]
+    link = CompetitionsSports.objects.values_list('competition_id', 'sport_id').first()
+    bet = StageClient.objects.values_list('client_id', 'stages_id').first()
+    page = slice(0, 11)
+    return {
+        'competitions first page': Competition.objects.order_by(
+            *get_keyset_ordering(Competition),
+        ).values_list('id', 'name')[page],
+        'sports first page': Sport.objects.order_by(
+            *get_keyset_ordering(Sport),
+        ).values_list('id', 'name')[page],
+        'stages deep keyset page': Stage.objects.filter(
+            keyset_filter(
+                stage_ordering,
+                list(boundary),
+                forward=True,
+                nullable=get_nullable_fields(Stage, stage_ordering),
+            ),
+        ).order_by(*stage_ordering).values_list('id', 'name')[page],
+        'competition sport lookup': CompetitionsSports.objects.filter(
+            competition_id=link[0], sport_id=link[1],
+        ).values_list('id'),
+        'stages of competition sport': Stage.objects.filter(
+            comp_sport__sport_id=link[1],
+        ).order_by('stage_date').values_list('id', 'name')[page],
+        'bet exists': StageClient.objects.filter(client_id=bet[0], stages_id=bet[1]).values('id'),
+    }
+
+
+def seed_bets(clients_amount, bets_per_client):
+    """Create clients with bets on the first stages.
+
+    Args:
+        clients_amount (int): clients to create.
+        bets_per_client (int): bets of every client.
+    """
+    from django.contrib.auth.models import User
+
+    from competitions_app.models import Client, Stage, StageClient
+
+    users = User.objects.bulk_create([
+        User(username=f'bench {index}') for index in range(clients_amount)
+    ])
+    clients = Client.objects.bulk_create([Client(user=user) for user in users])
+    stage_ids = list(Stage.objects.values_list('id', flat=True)[:bets_per_client])
+    bets = [
+        StageClient(client=client, stages_id=stage_id)
+        for client in clients
+        for stage_id in stage_ids
+    ]
+    StageClient.objects.bulk_create(bets, batch_size=5000)
+
+
+def explain_all():
+    """Explain every query.
+
+    Returns:
+        dict[str, str]: plans by query name.
+    """
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    return {
+        name: queryset.explain(analyze=True)
+        for name, queryset in get_queries().items()
+    }
+
+
+def parse_args():
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: dataset sizes.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--competitions', type=int, default=200)
+    parser.add_argument('--sports', type=int, default=20)
+    parser.add_argument('--stages', type=int, default=200000)
+    parser.add_argument('--clients', type=int, default=200)
+    parser.add_argument('--bets', type=int, default=200)
+    return parser.parse_args()
+
+
+def main():
+    """Seed the test database, migrate between states and print plans."""
+    args = parse_args()
+    common.setup()
+    from django.core.management import call_command
+
+    with common.test_database():
+        common.seed_catalog(args.competitions, args.sports, args.stages)
+        seed_bets(args.clients, args.bets)
+        plans = {}
+        for state in (BEFORE, AFTER):
+            call_command('migrate', APP, state, verbosity=0)
+            plans[state] = explain_all()
+        for name in plans[BEFORE]:
+            for state_name, state_plans in plans.items():
+                print(f'===== {name} [{state_name}]')
+                print(state_plans[name])
+            print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Compare peak Python memory of the streaming export and the API list.
+
+Usage: ``python -m benchmarks.export_memory [--stages N]``.
+"""
+import argparse
+import tracemalloc
+
+from benchmarks import common
+
+MEGABYTE = 1024 * 1024
+
+
+def measure(api_client, url):
+    """Read the whole response tracing allocations.
+
+    Args:
+        api_client (APIClient): authenticated client.
+        url (str): endpoint.
+
+    Returns:
+        tuple[int, float]: response size in bytes and peak traced memory in megabytes.
+    """
+    tracemalloc.start()
+    response = api_client.get(url)
+    if response.streaming:
+        size = sum(len(chunk) for chunk in response.streaming_content)
+    else:
+        size = len(response.content)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size, peak / MEGABYTE
+
+
+def get_client():
+    """Create a user with a token.
+
+    Returns:
+        APIClient: authenticated client.
+    """
+    from django.contrib.auth.models import User
+    from rest_framework.authtoken.models import Token
+    from rest_framework.test import APIClient
+
+    api_client = APIClient()
+    token = Token.objects.create(user=User.objects.create(username='bench'))
+    api_client.credentials(HTTP_AUTHORIZATION=f'Token {token}')
+    return api_client
+
+
+def main():
+    """Seed the test database and print response sizes and memory peaks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--stages', type=int, default=50000)
+    parser.add_argument('--competitions', type=int, default=100)
+    parser.add_argument('--sports', type=int, default=10)
+    args = parser.parse_args()
+    common.setup()
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    with common.test_database():
+        common.seed_catalog(args.competitions, args.sports, args.stages)
+        api_client = get_client()
+        urls = (
+            '/api/export/stages.ndjson',
+            '/api/export/stages.csv',
+            '/api/stages/?pagination=off',
+        )
+        for url in urls:
+            size, peak = measure(api_client, url)
+            size /= MEGABYTE
+            print(f'{url}: {size:.1f} MB sent, {peak:.1f} MB peak')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""Measure rendering of catalog and entity pages with cold and warm fragments.
+
+The template context of every page is built once, then the template renders with
+an empty cache and with its fragments cached.
+
+Usage: ``python -m benchmarks.fragments [--stages N] [--repeat N]``.
+"""
+import argparse
+import time
+
+from benchmarks import common
+
+
+def build_contexts(page_size):
+    """Build template contexts of the catalog and the sport pages.
+
+    Args:
+        page_size (int): catalog page size.
+
+    Returns:
+        list[tuple]: page name, template and context.
+    """
+    from competitions_app import caching, fragments, pagination
+    from competitions_app.models import Sport, Stage
+
+    page_obj = pagination.KeysetPaginator(Stage.objects.all(), page_size).get_page()
+    sport = Sport.objects.first()
+    sport_context = {'sport': sport, **caching.get_page_lists(sport)}
+    sport_context.update(fragments.get_entity_context(sport, sport_context))
+    return [
+        ('stages catalog', 'catalog/stages.html', {
+            'stages_list': page_obj, 'page_obj': page_obj, **fragments.get_context(page_obj),
+        }),
+        ('sport', 'entities/sport.html', sport_context),
+    ]
+
+
+def measure(template, context, repeat, cold):
+    """Render the template several times.
+
+    Args:
+        template: compiled template.
+        context (dict): template context.
+        repeat (int): renders.
+        cold (bool): whether the cache is cleared before every render.
+
+    Returns:
+        float: best render time in milliseconds.
+    """
+    from django.core.cache import cache
+
+    best = float('inf')
+    for _ in range(repeat):
+        if cold:
+            cache.clear()
+        start = time.perf_counter()
+        template.render(context)
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 3)
+
+
+def main():
+    """Seed the test database and print render times."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--stages', type=int, default=10000)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    common.setup()
+    from django.template.loader import get_template
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    with common.test_database():
+        common.seed_catalog(10, 5, args.stages)
+        for name, template_name, context in build_contexts(args.page_size):
+            template = get_template(template_name)
+            cold = measure(template, context, args.repeat, cold=True)
+            warm = measure(template, context, args.repeat, cold=False)
+            print(f'{name}: {cold} ms cold, {warm} ms warm')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""Measure import_fixtures on generated CSV files.
+
+Usage: ``python -m benchmarks.import_fixtures [--stages N] [--competitions N] [--sports N]``.
+"""
+import argparse
+import csv
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+from benchmarks import common
+
+
+def write_csv(path, header, rows):
+    """Write a CSV file row by row.
+
+    Args:
+        path (Path): file path.
+        header (list[str]): column names.
+        rows: rows iterable.
+    """
+    with open(path, 'w', newline='') as fixture:
+        writer = csv.writer(fixture)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def competition_rows(amount):
+    """Generate competition rows.
+
+    Args:
+        amount (int): competitions amount.
+
+    Yields:
+        list: name, start and end.
+    """
+    start = date(common.BASE_YEAR, 1, 1)
+    for index in range(amount):
+        first_day = start + timedelta(days=index)
+        yield [
+            f'competition {index}',
+            first_day,
+            first_day + timedelta(days=common.COMPETITION_DAYS),
+        ]
+
+
+def stage_rows(args):
+    """Generate stage rows spread over competitions and sports.
+
+    Args:
+        args (Namespace): dataset sizes.
+
+    Yields:
+        list: name, date, competition and sport.
+    """
+    start = date(common.BASE_YEAR, 1, 1)
+    for index in range(args.stages):
+        competition = index % args.competitions
+        yield [
+            f'stage {index}',
+            start + timedelta(days=competition + index % common.COMPETITION_DAYS),
+            f'competition {competition}',
+            f'sport {index % args.sports}',
+        ]
+
+
+def write_fixtures(directory, args):
+    """Write competitions, sports and stages CSV files.
+
+    Args:
+        directory (str): target directory.
+        args (Namespace): dataset sizes.
+
+    Returns:
+        dict[str, Path]: file paths by command option.
+    """
+    names = ('competitions', 'sports', 'stages')
+    paths = {name: Path(directory, f'{name}.csv') for name in names}
+    write_csv(
+        paths['competitions'],
+        ['name', 'competition_start', 'competition_end'],
+        competition_rows(args.competitions),
+    )
+    sport_rows = ([f'sport {index}'] for index in range(args.sports))
+    write_csv(paths['sports'], ['name'], sport_rows)
+    write_csv(
+        paths['stages'], ['name', 'stage_date', 'competition', 'sport'], stage_rows(args),
+    )
+    return paths
+
+
+def import_generated(directory, args):
+    """Generate fixtures and import them, printing timings.
+
+    Args:
+        directory (str): directory for the files.
+        args (Namespace): dataset sizes.
+    """
+    from django.core.management import call_command
+
+    timings = {}
+    with common.timer(timings, 'write files'):
+        paths = write_fixtures(directory, args)
+    with common.timer(timings, 'import'):
+        call_command(
+            'import_fixtures',
+            *(f'--{name}={path}' for name, path in paths.items()),
+            f'--chunk-size={args.chunk_size}',
+        )
+    for name, seconds in timings.items():
+        print(f'{name}: {seconds:.2f}s')
+
+
+def main():
+    """Generate fixtures, import them into the test database and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--competitions', type=int, default=200)
+    parser.add_argument('--sports', type=int, default=20)
+    parser.add_argument('--stages', type=int, default=1000000)
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    args = parser.parse_args()
+    common.setup()
+    with tempfile.TemporaryDirectory() as directory:
+        with common.test_database():
+            import_generated(directory, args)
+
+
+if __name__ == '__main__':
+    main()
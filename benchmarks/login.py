@@ -0,0 +1,80 @@
+"""Measure logins per second on one core.
+
+A client posts the login form and logs out in a loop. The time of a bare
+password check is printed alongside, a login costs about one of them plus the
+queries of the request.
+
+Usage: ``python -m benchmarks.login [--logins N]``.
+"""
+import argparse
+import time
+
+from benchmarks import common
+
+USERNAME = 'benchmark'
+PASSWORD = 'benchmark password'  # noqa: S105
+
+
+def measure_logins(logins_amount):
+    """Log in and out repeatedly.
+
+    Args:
+        logins_amount (int): logins to perform.
+
+    Returns:
+        tuple[float, float]: logins per second and password checks per login.
+    """
+    from unittest import mock
+
+    from django.contrib.auth import base_user
+    from django.test.client import Client
+
+    client = Client()
+    form = {'username': USERNAME, 'password': PASSWORD}
+    with mock.patch.object(
+        base_user, 'check_password', wraps=base_user.check_password,
+    ) as check_password:
+        start = time.perf_counter()
+        for _ in range(logins_amount):
+            client.post('/login/', form)
+            client.logout()
+        seconds = time.perf_counter() - start
+        checks = check_password.call_count
+    return round(logins_amount / seconds, 1), checks / logins_amount
+
+
+def measure_check(user, repeat):
+    """Time a bare password check.
+
+    Args:
+        user: user with the password.
+        repeat (int): checks to perform.
+
+    Returns:
+        float: milliseconds per check.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        user.check_password(PASSWORD)
+    return round((time.perf_counter() - start) / repeat * 1000, 1)
+
+
+def main():
+    """Create a user in the test database and print login throughput."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--logins', type=int, default=50)
+    args = parser.parse_args()
+    common.setup()
+    from django.contrib.auth.models import User
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    with common.test_database():
+        user = User.objects.create_user(USERNAME, password=PASSWORD)
+        print(f'password check: {measure_check(user, args.logins)} ms')
+        speed, checks = measure_logins(args.logins)
+        print(f'login: {speed} logins/s, {checks} password checks per login')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Compare request latency with and without the connection pool.
+
+A single worker uvicorn serves the test database once connecting per request
+(DB_POOL_MAX_SIZE=0) and once with the pool. One reader requests a small flat
+page of sports with an admin token, then the pool statistics of the worker are
+printed.
+
+Usage: ``python -m benchmarks.pool [--requests N]``.
+"""
+import argparse
+import statistics
+import time
+
+from benchmarks import common
+
+URL = '/api/sports/?mode=flat&page_size=10'
+STATS_URL = '/api/pool/'
+POOL_SIZE = 10
+
+
+def measure(token_key, pool_size, requests_amount):
+    """Serve the project and time sequential requests.
+
+    Args:
+        token_key (str): API token of an admin.
+        pool_size (int): maximum pool size, zero disables the pool.
+        requests_amount (int): requests to send.
+
+    Returns:
+        tuple[str, dict]: latency summary and pool statistics of the worker.
+    """
+    import httpx
+
+    latencies = []
+    headers = {'Authorization': f'Token {token_key}'}
+    with common.uvicorn_server(DB_POOL_MAX_SIZE=str(pool_size)) as (base_url, _):
+        with httpx.Client(base_url=base_url, headers=headers) as client:
+            client.get(URL).raise_for_status()
+            for _ in range(requests_amount):
+                start = time.perf_counter()
+                client.get(URL).raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+            stats = client.get(STATS_URL).json()['default']
+    median = round(statistics.median(latencies), 2)
+    return f'{median} ms median, {round(statistics.mean(latencies), 2)} ms mean', stats
+
+
+def main():
+    """Seed the test database and print latency of both modes."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+    common.setup()
+    from django.contrib.auth.models import User
+    from django.test.utils import setup_test_environment
+    from rest_framework.authtoken.models import Token
+
+    setup_test_environment()
+    with common.test_database():
+        common.seed_catalog(10, 20, 100)
+        user = User.objects.create(username='benchmark', is_staff=True)
+        token_key = Token.objects.create(user=user).key
+        for name, pool_size in (('per request', 0), ('pooled', POOL_SIZE)):
+            latency, stats = measure(token_key, pool_size, args.requests)
+            print(f'{name}: {latency}, pool {stats}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""Compare API renderers and response compression on a list of stages.
+
+Stages are serialized once with the flat and the hyperlinked serializers, then
+every renderer encodes the same data. Compression is measured on the orjson
+document of each representation.
+
+Usage: ``python -m benchmarks.renderers [--stages N] [--repeat N] [--brotli-quality N]``.
+"""
+import argparse
+import time
+from functools import partial
+
+from benchmarks import common
+
+
+def serialize(serializer_class):
+    """Serialize all stages as the list endpoint does without pagination.
+
+    Args:
+        serializer_class: stage serializer class.
+
+    Returns:
+        list: serialized stages.
+    """
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    request = Request(APIRequestFactory().get('/api/stages/'))
+    queryset = serializer_class.plan(serializer_class.Meta.model.objects.all())
+    return serializer_class(queryset, many=True, context={'request': request}).data
+
+
+def get_renderers():
+    """Build the compared renderers.
+
+    Returns:
+        list[tuple]: name and renderer instance.
+    """
+    from rest_framework.renderers import JSONRenderer
+
+    from competitions_app import renderers
+
+    return [
+        ('json', JSONRenderer()),
+        ('orjson', renderers.ORJSONRenderer()),
+        ('msgpack', renderers.MessagePackRenderer()),
+    ]
+
+
+def measure(function, repeat):
+    """Run the function several times.
+
+    Args:
+        function: measured callable.
+        repeat (int): runs.
+
+    Returns:
+        tuple: last result and the best time in seconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = function()
+        best = min(best, time.perf_counter() - start)
+    return output, best
+
+
+def report_renderers(name, serialized, repeat):
+    """Print rendering speed of every renderer.
+
+    Args:
+        name (str): representation name.
+        serialized (list): serialized stages.
+        repeat (int): runs per renderer.
+
+    Returns:
+        bytes: orjson document.
+    """
+    documents = {}
+    for renderer_name, renderer in get_renderers():
+        document, seconds = measure(partial(renderer.render, serialized), repeat)
+        documents[renderer_name] = document
+        speed = round(len(serialized) / seconds)
+        print(f'{name} {renderer_name}: {speed} stages/s, {len(document)} bytes')
+    return documents['orjson']
+
+
+def report_compression(name, document, args):
+    """Print compression time and ratio of an encoded document.
+
+    Args:
+        name (str): representation name.
+        document (bytes): encoded document.
+        args: command arguments with runs per codec and brotli quality.
+    """
+    import gzip
+
+    import brotli
+
+    codecs = (
+        ('gzip', partial(gzip.compress, document, compresslevel=6)),
+        ('brotli', partial(brotli.compress, document, quality=args.brotli_quality)),
+    )
+    for codec_name, compress in codecs:
+        compressed, seconds = measure(compress, args.repeat)
+        milliseconds = round(seconds * 1000, 1)
+        ratio = round(len(document) / len(compressed), 1)
+        print(f'{name} {codec_name}: {milliseconds} ms, {ratio}x smaller')
+
+
+def main():
+    """Seed the test database and print rendering and compression speed."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--stages', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--brotli-quality', type=int, default=4)
+    args = parser.parse_args()
+    common.setup()
+    from django.test.utils import setup_test_environment
+
+    from competitions_app import serializers
+
+    setup_test_environment()
+    with common.test_database():
+        common.seed_catalog(100, 20, args.stages)
+        representations = (
+            ('flat', serializers.FlatStageSerializer),
+            ('hyperlinked', serializers.StageSerializer),
+        )
+        for name, serializer_class in representations:
+            document = report_renderers(name, serialize(serializer_class), args.repeat)
+            report_compression(name, document, args)
+
+
+if __name__ == '__main__':
+    main()
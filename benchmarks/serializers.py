@@ -0,0 +1,95 @@
+"""Compare serialized rows per second of API serializers.
+
+``before`` is the hyperlinked serializer on a plain queryset, ``hyperlinked`` and
+``flat`` load related objects with the serializer query plans.
+
+Usage: ``python -m benchmarks.serializers [--stages N] [--competitions N] [--sports N]``.
+"""
+import argparse
+import time
+
+from benchmarks import common
+
+
+def get_cases():
+    """Build serializer cases for every model.
+
+    Returns:
+        list[tuple]: name, queryset, serializer class and whether to apply its plan.
+    """
+    from competitions_app import serializers
+    from competitions_app.models import Competition, Sport, Stage
+
+    models = (
+        (Competition, serializers.CompetitionSerializer, serializers.FlatCompetitionSerializer),
+        (Sport, serializers.SportSerializer, serializers.FlatSportSerializer),
+        (Stage, serializers.StageSerializer, serializers.FlatStageSerializer),
+    )
+    cases = []
+    for model_class, hyperlinked, flat in models:
+        name = model_class._meta.model_name
+        cases.append((f'{name} before', model_class.objects.all(), hyperlinked, False))
+        cases.append((f'{name} hyperlinked', model_class.objects.all(), hyperlinked, True))
+        cases.append((f'{name} flat', model_class.objects.all(), flat, True))
+    return cases
+
+
+def measure(queryset, serializer_class, planned):
+    """Serialize the queryset counting queries.
+
+    Args:
+        queryset (QuerySet): serialized rows.
+        serializer_class: serializer class.
+        planned (bool): whether to apply the serializer query plan.
+
+    Returns:
+        tuple[int, int, float]: rows, queries and seconds.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    request = Request(APIRequestFactory().get('/api/'))
+    if planned:
+        queryset = serializer_class.plan(queryset)
+    connection.queries_log.clear()
+    queries = CaptureQueriesContext(connection)
+    start = time.perf_counter()
+    with queries:
+        rows = serializer_class(queryset, many=True, context={'request': request}).data
+    return len(rows), len(queries), time.perf_counter() - start
+
+
+def report(name, rows, queries, seconds):
+    """Print a measurement.
+
+    Args:
+        name (str): case name.
+        rows (int): serialized rows.
+        queries (int): executed queries.
+        seconds (float): spent time.
+    """
+    speed = rows / seconds
+    print(f'{name}: {rows} rows, {queries} queries, {speed:.0f} rows/s')
+
+
+def main():
+    """Seed the test database and print serialization speed."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--competitions', type=int, default=100)
+    parser.add_argument('--sports', type=int, default=20)
+    parser.add_argument('--stages', type=int, default=20000)
+    args = parser.parse_args()
+    common.setup()
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    with common.test_database():
+        common.seed_catalog(args.competitions, args.sports, args.stages)
+        for name, queryset, serializer_class, planned in get_cases():
+            report(name, *measure(queryset, serializer_class, planned))
+
+
+if __name__ == '__main__':
+    main()
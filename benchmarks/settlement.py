@@ -0,0 +1,79 @@
+"""Measure bulk settlement of a stage with many bets.
+
+Usage: ``python -m benchmarks.settlement [--bets N]``.
+"""
+import argparse
+from decimal import Decimal
+
+from benchmarks import common
+
+STAKE = Decimal(100)
+ODDS = Decimal('1.75')
+
+
+def seed_bets(bets_amount, batch_size=5000):
+    """Create a stage with one bet of every new client.
+
+    Args:
+        bets_amount (int): bets to create.
+        batch_size (int): rows per INSERT.
+
+    Returns:
+        Stage: stage holding the bets.
+    """
+    from django.contrib.auth.models import User
+
+    from competitions_app.models import Client, Stage, StageClient
+
+    stage = Stage.objects.create(name='final', bet_coefficient=ODDS)
+    users = User.objects.bulk_create(
+        [User(username=f'bettor {index}') for index in range(bets_amount)],
+        batch_size=batch_size,
+    )
+    clients = Client.objects.bulk_create(
+        [Client(user=user) for user in users], batch_size=batch_size,
+    )
+    StageClient.objects.bulk_create(
+        [StageClient(client=client, stages=stage, stake=STAKE, odds=ODDS) for client in clients],
+        batch_size=batch_size,
+    )
+    return stage
+
+
+def settle(stage, timings):
+    """Settle the stage as won.
+
+    Args:
+        stage (Stage): stage to settle.
+        timings (dict): storage for measured seconds.
+    """
+    from django.db import connection
+
+    from competitions_app import bets
+    from competitions_app.models import StageOutcome
+
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    with common.timer(timings, 'settle'):
+        settled, credited = bets.settle_stage(stage.id, StageOutcome.WON)
+    print(f'bets settled: {settled}, clients credited: {credited}')
+
+
+def main():
+    """Seed the test database, settle the stage and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--bets', type=int, default=500000)
+    args = parser.parse_args()
+    common.setup()
+
+    with common.test_database():
+        timings = {}
+        with common.timer(timings, 'seed'):
+            stage = seed_bets(args.bets)
+        settle(stage, timings)
+        for name, seconds in timings.items():
+            print(f'{name}: {seconds:.2f}s')
+
+
+if __name__ == '__main__':
+    main()
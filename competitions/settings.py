@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 
 from os import getenv, path
 from pathlib import Path
+from urllib.parse import urlsplit
 
 from dotenv import load_dotenv
 
@@ -52,15 +53,23 @@ REST_FRAMEWORK = {
         # 'rest_framework.authentication.BasicAuthentication',
         'rest_framework.authentication.SessionAuthentication',
         'rest_framework.authentication.TokenAuthentication',
-    ]
+    ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'competitions_app.renderers.ORJSONRenderer',
+        'competitions_app.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'competitions_app.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'competitions_app.middleware.ReplicaMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'competitions_app.middleware.ClientMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -89,21 +98,52 @@ WSGI_APPLICATION = 'competitions.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
+# Pool of psycopg connections per process, a zero maximum size connects per request
+DB_POOL_MIN_SIZE = int(getenv('DB_POOL_MIN_SIZE', '2'))
+DB_POOL_MAX_SIZE = int(getenv('DB_POOL_MAX_SIZE', '10'))
+# Seconds to wait for a free pooled connection before failing the request
+DB_POOL_TIMEOUT = float(getenv('DB_POOL_TIMEOUT', '30'))
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'competitions_app.db',
         'NAME': getenv('PG_DBNAME'),
         'USER': getenv('PG_USER'),
         'PORT': getenv('PG_PORT'),
         'HOST': getenv('PG_HOST'),
         'PASSWORD': getenv('PG_PASSWORD'),
-        'OPTIONS': {'options': '-c search_path=public,crud_api'},
+        'OPTIONS': {
+            'options': '-c search_path=public,crud_api',
+            'pool': DB_POOL_MAX_SIZE and {
+                'min_size': min(DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE),
+                'max_size': DB_POOL_MAX_SIZE,
+                'timeout': DB_POOL_TIMEOUT,
+            },
+        },
+        'CONN_HEALTH_CHECKS': True,
         'TEST': {
             'NAME': 'test_db',
         },
     }
 }
 
+# Read replicas as comma separated host:port/name, missing parts are taken from the primary
+REPLICA_URLS = [urlsplit(f'//{replica}') for replica in getenv('PG_REPLICAS', '').split(',') if replica]
+DATABASES.update({
+    f'replica_{index}': {
+        **DATABASES['default'],
+        'HOST': url.hostname or DATABASES['default']['HOST'],
+        'PORT': url.port or DATABASES['default']['PORT'],
+        'NAME': url.path.lstrip('/') or DATABASES['default']['NAME'],
+        'TEST': {'MIRROR': 'default'},
+    }
+    for index, url in enumerate(REPLICA_URLS)
+})
+DATABASE_REPLICAS = tuple(alias for alias in DATABASES if alias != 'default')
+DATABASE_ROUTERS = ['competitions_app.routers.ReplicaRouter']
+# Seconds reads of a client stay on the primary after its write
+REPLICA_STICKY_SECONDS = int(getenv('REPLICA_STICKY_SECONDS', '5'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -149,3 +189,45 @@ LOCALE_PATH = 'competitions_app/locale'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 TEST_RUNNER = 'tests.runner.PostgresSchemaRunner'
+
+# Home page reads planner estimates from pg_class instead of maintained counters
+ENTITY_COUNTS_ESTIMATED = getenv('ENTITY_COUNTS_ESTIMATED', 'false').lower() == 'true'
+
+# Seed of the bet coefficients generator, unset for fresh entropy
+ODDS_SEED = int(getenv('ODDS_SEED')) if getenv('ODDS_SEED') else None
+
+# REST API list pages, ?page_size= is capped by the maximal size
+API_PAGE_SIZE = int(getenv('API_PAGE_SIZE', '100'))
+API_MAX_PAGE_SIZE = int(getenv('API_MAX_PAGE_SIZE', '1000'))
+
+# Items accepted by a single /api/<entities>/bulk/ request
+API_MAX_BULK_SIZE = int(getenv('API_MAX_BULK_SIZE', '1000'))
+
+# Responses from this size on are compressed, brotli quality trades ratio for speed
+COMPRESSION_MIN_SIZE = int(getenv('COMPRESSION_MIN_SIZE', '1024'))
+BROTLI_QUALITY = int(getenv('BROTLI_QUALITY', '4'))
+
+# Entity pages cache, a directory shares it between processes instead of local memory
+CACHE_LOCATION = getenv('CACHE_LOCATION')
+CACHES = {
+    'default': {
+        'BACKEND': (
+            'django.core.cache.backends.filebased.FileBasedCache' if CACHE_LOCATION
+            else 'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': CACHE_LOCATION or 'competitions',
+        'TIMEOUT': int(getenv('CACHE_TIMEOUT', '3600')),
+    },
+}
+
+# Seconds a versioned page fragment lives, a change moves the page to a new version anyway
+FRAGMENT_CACHE_TIMEOUT = int(getenv('FRAGMENT_CACHE_TIMEOUT', '86400'))
+
+# Seconds a resolved API token is cached, 0 disables the cache
+TOKEN_CACHE_TTL = int(getenv('TOKEN_CACHE_TTL', '300'))
+
+# Seconds the client of a session is cached by ClientMiddleware
+CLIENT_CACHE_TTL = int(getenv('CLIENT_CACHE_TTL', '60'))
+
+# Serve home, catalog and entity pages with async views, meant for ASGI servers
+ASYNC_VIEWS = getenv('ASYNC_VIEWS', 'false').lower() == 'true'
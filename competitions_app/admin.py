@@ -2,6 +2,7 @@
 from django.contrib import admin
 
 import competitions_app.models as models
+from competitions_app import odds
 
 
 class StageInline(admin.TabularInline):
@@ -94,3 +95,15 @@ class StageAdmin(admin.ModelAdmin):
     """
 
     model = models.Stage
+    actions = ('reprice',)
+
+    @admin.action(description='Reprice selected stages')
+    def reprice(self, request, queryset):
+        """Draw new bet coefficients for the selected stages.
+
+        Args:
+            request: request.
+            queryset (QuerySet): selected stages.
+        """
+        repriced = odds.reprice(queryset)
+        self.message_user(request, f'Stages repriced: {repriced}')
@@ -11,3 +11,22 @@ class CompetitionsAppConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'competitions_app'
+
+    def ready(self):
+        """Connect signal receivers.
+
+        Model receivers are connected per sender: a delete receiver without one
+        stops Django from fast deleting rows of every model, cascades included.
+        """
+        from django.db.models import signals
+
+        from . import authentication, caching, counters  # noqa: F401
+
+        for movable_model in caching.MOVABLE_MODELS:
+            signals.pre_save.connect(caching.invalidate_moved, sender=movable_model)
+        for cached_model in caching.CACHED_MODELS:
+            signals.post_save.connect(caching.invalidate_changed, sender=cached_model)
+            signals.post_delete.connect(caching.invalidate_changed, sender=cached_model)
+        for counted_model in counters.COUNTED_MODELS:
+            signals.post_save.connect(counters.count_created, sender=counted_model)
+            signals.post_delete.connect(counters.count_deleted, sender=counted_model)
@@ -0,0 +1,95 @@
+"""Module for asynchronous reads of the entity pages cache.
+
+Keys, generations and metrics are shared with caching, only the database loads
+run through the async ORM. Async views hold no transactions, so loaded values
+are always stored. Like the sync loads they read from the primary.
+"""
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+
+from . import caching, queries
+from .models import Competition, Sport
+
+
+async def aread_through(kind, pk, aload, variant=''):
+    """Return the cached value or load and store it asynchronously.
+
+    Args:
+        kind (str): model name or list name, metrics are counted by it.
+        pk: primary key of the object or of the list owner.
+        aload: coroutine function loading the value from the database.
+        variant (str): part of the value key not tracked by invalidation.
+
+    Returns:
+        cached or loaded value.
+    """
+    versioned_key, cached = caching.lookup(kind, pk, variant)
+    if cached is not caching.MISSING:
+        return cached
+    loaded = await aload()
+    await cache.aset(versioned_key, loaded)
+    return loaded
+
+
+async def aget_object(model_class, pk):
+    """Read a competition, a sport or a stage by primary key.
+
+    Args:
+        model_class: model class.
+        pk: primary key.
+
+    Returns:
+        Model: object.
+    """
+    primary = model_class.objects.using(DEFAULT_DB_ALIAS)
+    return await aread_through(model_class._meta.model_name, pk, lambda: primary.aget(pk=pk))
+
+
+async def aget_competition_sports(competition) -> list:
+    """Read sports of a competition.
+
+    Args:
+        competition (Competition): competition.
+
+    Returns:
+        list: sports.
+    """
+    async def aload():
+        sports = Sport.objects.using(DEFAULT_DB_ALIAS).filter(competitions=competition)
+        return [sport async for sport in sports]
+
+    return await aread_through(caching.COMPETITION_SPORTS, competition.pk, aload)
+
+
+async def aget_sport_stages(sport) -> list:
+    """Read upcoming stages of a sport grouped by competition.
+
+    Args:
+        sport (Sport): sport.
+
+    Returns:
+        list: pairs of a competition and its stages.
+    """
+    return await aread_through(
+        caching.SPORT_STAGES,
+        sport.pk,
+        lambda: queries.aget_upcoming_stages(sport),
+        variant=timezone.localdate().isoformat(),
+    )
+
+
+async def aget_page_lists(instance) -> dict:
+    """Read lists shown on the page of the object.
+
+    Args:
+        instance: competition, sport or stage.
+
+    Returns:
+        dict: template context with the lists.
+    """
+    if isinstance(instance, Competition):
+        return {caching.SPORTS: await aget_competition_sports(instance)}
+    if isinstance(instance, Sport):
+        return {caching.QUERY_STAGES: await aget_sport_stages(instance)}
+    return {}
@@ -0,0 +1,136 @@
+"""Module for asynchronous read views.
+
+Home, catalog and entity pages read the database through the async ORM, so an
+ASGI server serves other requests while their queries run. They replace the
+synchronous views in the URLs when the ASYNC_VIEWS setting is on. The request
+user is resolved with ``request.auser`` before rendering, templates must not
+touch the lazy synchronous one.
+"""
+import asyncio
+from functools import wraps
+
+from django.contrib.auth.views import redirect_to_login
+from django.shortcuts import render
+
+from competitions_app import config
+
+from . import async_caching, bets, counters, fragments, pagination
+from .models import Competition, Sport, Stage
+
+
+def login_required(view):
+    """Redirect anonymous users of an async view to the login page.
+
+    Args:
+        view: async view.
+
+    Returns:
+        view: async view checking the user.
+    """
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        return await view(request, *args, **kwargs)
+    return wrapper
+
+
+async def home_page(request):
+    """Return home page, the user and the counts are read concurrently.
+
+    Args:
+        request: HTTP request.
+
+    Returns:
+        HttpResponse: return an HttpResponse.
+    """
+    request.user, counts = await asyncio.gather(request.auser(), counters.aget_counts())
+    return render(
+        request,
+        'index.html',
+        {
+            'competitions': counts[Competition],
+            'sports': counts[Sport],
+            config.STAGES: counts[Stage],
+        },
+    )
+
+
+def create_list_view(model_class, plural_name, template):
+    """Create an async catalog page.
+
+    Args:
+        model_class: desired model class.
+        plural_name (str): models name in plural form.
+        template (str): path to html template.
+
+    Returns:
+        view: async view.
+    """
+    @login_required
+    async def view(request):
+        """Render a keyset page of the catalog.
+
+        Args:
+            request: HTTP request.
+
+        Returns:
+            HttpResponse: return an HttpResponse.
+        """
+        paginator = pagination.KeysetPaginator(
+            model_class.objects.all(), config.CATALOG_PAGE_SIZE,
+        )
+        page_obj = await paginator.aget_page(request.GET.get(config.CURSOR))
+        context = {
+            f'{plural_name}_list': page_obj,
+            'page_obj': page_obj,
+            'is_paginated': page_obj.has_next or page_obj.has_previous,
+        }
+        context.update(fragments.get_context(page_obj))
+        return render(request, template, context)
+    return view
+
+
+competition_list_view = create_list_view(Competition, 'competitions', 'catalog/competitions.html')
+sport_list_view = create_list_view(Sport, 'sports', 'catalog/sports.html')
+stage_list_view = create_list_view(Stage, config.STAGES, 'catalog/stages.html')
+
+
+def create_view(model_class, context_name, template):
+    """Create an async entity page.
+
+    Args:
+        model_class: desired model class.
+        context_name: working context.
+        template: path to http template
+
+    Returns:
+        view: async view.
+    """
+    @login_required
+    async def view(request):
+        """Render the entity with its lists.
+
+        Args:
+            request: HTTP request.
+
+        Returns:
+            HttpResponse: return an HttpResponse.
+        """
+        id_ = request.GET.get('id', None)
+        target = await async_caching.aget_object(model_class, id_) if id_ else None
+        context = {context_name: target}
+        if target is not None:
+            context.update(await async_caching.aget_page_lists(target))
+            context.update(fragments.get_entity_context(target, context))
+        if model_class == Stage and target is not None:
+            client = await request.aclient()
+            context['client_placed_bet'] = await bets.ahas_bet(client.id, target.id)
+        return render(request, template, context)
+    return view
+
+
+competition_view = create_view(Competition, 'competition', 'entities/competition.html')
+sport_view = create_view(Sport, 'sport', 'entities/sport.html')
+stage_view = create_view(Stage, config.STAGE, 'entities/stage.html')
@@ -0,0 +1,113 @@
+"""Module for the cached token authentication of the REST API.
+
+Resolved tokens are cached for TOKEN_CACHE_TTL seconds under a digest of their
+key, so steady API traffic skips the join of tokens with users. Users are cached
+without the password hash. Deleting a token and saving or deleting its user
+revoke the cached entries right away and once more on commit, the TTL bounds
+what hooks cannot see: queryset updates and other processes with the local
+memory backend. A zero TTL disables the cache.
+"""
+import hashlib
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import signals
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+LOGIN_FIELDS = frozenset(('last_login',))
+
+
+def get_cache_key(key) -> str:
+    """Build the cache key of a token without exposing it.
+
+    Args:
+        key (str): token key.
+
+    Returns:
+        str: cache key.
+    """
+    return f'token:{hashlib.sha256(key.encode()).hexdigest()}'
+
+
+def revoke(keys) -> None:
+    """Drop cached tokens now and again when the transaction commits.
+
+    Args:
+        keys (list[str]): token keys.
+    """
+    cache_keys = [get_cache_key(key) for key in keys]
+    cache.delete_many(cache_keys)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(partial(cache.delete_many, cache_keys))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Token authentication reading resolved tokens from the cache.
+
+    Args:
+        TokenAuthentication: DRF token authentication.
+    """
+
+    def authenticate_credentials(self, key) -> tuple:
+        """Resolve the token from the cache or the database.
+
+        Args:
+            key (str): token key.
+
+        Raises:
+            AuthenticationFailed: if the token is unknown or its user is inactive.
+
+        Returns:
+            tuple: user and token.
+        """
+        cache_key = get_cache_key(key)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        try:
+            token = Token.objects.select_related('user').defer('user__password').get(key=key)
+        except Token.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+        if settings.TOKEN_CACHE_TTL:
+            cache.set(cache_key, (token.user, token), timeout=settings.TOKEN_CACHE_TTL)
+        return token.user, token
+
+
+@receiver(signals.post_save, sender=Token)
+@receiver(signals.post_delete, sender=Token)
+def revoke_token(sender, instance, **kwargs):
+    """Revoke a saved or deleted token.
+
+    Args:
+        sender: token model class.
+        instance (Token): token.
+        kwargs: other signal arguments.
+    """
+    revoke([instance.key])
+
+
+@receiver(signals.post_save, sender=User)
+def revoke_user_tokens(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Revoke tokens of a saved user, e.g. deactivated or with changed permissions.
+
+    Deleted users need no hook, their tokens are deleted by the cascade. Logins
+    only touch last_login, which tokens do not depend on.
+
+    Args:
+        sender: user model class.
+        instance (User): user.
+        raw (bool): whether the instance is loaded from a fixture.
+        update_fields (frozenset): saved fields, None for all of them.
+        kwargs: other signal arguments.
+    """
+    if not raw and update_fields != LOGIN_FIELDS:
+        revoke(Token.objects.filter(user=instance).values_list('key', flat=True))
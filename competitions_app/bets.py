@@ -0,0 +1,208 @@
+"""Module for bet placement and settlement."""
+from types import MappingProxyType
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, transaction
+from django.utils.translation import gettext_lazy as _
+
+from .models import EntryKind, Stage, StageClient, StageOutcome, StageResult
+from .wallet import debit
+
+SHARE_STAGE_ODDS_SQL = """
+    SELECT bet_coefficient FROM crud_api.stage WHERE id = %s FOR SHARE
+"""
+
+LOCK_BETTORS_SQL = """
+    SELECT id FROM crud_api.client
+    WHERE id IN (
+        SELECT client_id FROM crud_api.stage_client WHERE stages_id = %s AND status = 'open'
+    )
+    ORDER BY id
+    FOR KEY SHARE
+"""
+
+SETTLE_BETS_SQL = """
+    WITH settled AS (
+        UPDATE crud_api.stage_client
+        SET status = %(outcome)s, settled = now(), modified = now()
+        WHERE stages_id = %(stage)s AND status = 'open'
+        RETURNING client_id, stake, odds
+    ), credits AS (
+        INSERT INTO crud_api.wallet_entry (client_id, amount, kind, created)
+        SELECT
+            client_id,
+            SUM(ROUND(stake * CASE WHEN %(outcome)s = 'won' THEN odds ELSE 1 END, 2)),
+            %(kind)s,
+            now()
+        FROM settled
+        WHERE %(outcome)s <> 'lost'
+        GROUP BY client_id
+        RETURNING client_id
+    )
+    SELECT (SELECT COUNT(*) FROM settled), (SELECT COUNT(*) FROM credits)
+"""
+
+CREDIT_KINDS = MappingProxyType({
+    StageOutcome.WON: EntryKind.PAYOUT,
+    StageOutcome.LOST: EntryKind.PAYOUT,
+    StageOutcome.VOID: EntryKind.REFUND,
+})
+
+
+class BetAlreadyPlaced(ValidationError):
+    """Client has already bet on the stage.
+
+    Args:
+        ValidationError: Django validation error.
+    """
+
+    def __init__(self):
+        """Initialize the error with its message."""
+        super().__init__(_('You have already placed a bet on this stage.'), code='bet_placed')
+
+
+class BettingClosed(ValidationError):
+    """Stage is settled and takes no more bets.
+
+    Args:
+        ValidationError: Django validation error.
+    """
+
+    def __init__(self):
+        """Initialize the error with its message."""
+        super().__init__(_('Betting on this stage is closed.'), code='betting_closed')
+
+
+class StageAlreadySettled(ValidationError):
+    """Stage is settled with another outcome.
+
+    Args:
+        ValidationError: Django validation error.
+    """
+
+    def __init__(self):
+        """Initialize the error with its message."""
+        super().__init__(_('Stage is already settled.'), code='stage_settled')
+
+
+def has_bet(client_id, stage_id) -> bool:
+    """Check bet existence with an indexed EXISTS.
+
+    Args:
+        client_id: client primary key.
+        stage_id: stage primary key.
+
+    Returns:
+        bool: whether the client has already bet on the stage.
+    """
+    return StageClient.objects.filter(client_id=client_id, stages_id=stage_id).exists()
+
+
+async def ahas_bet(client_id, stage_id) -> bool:
+    """Check bet existence with an indexed EXISTS asynchronously.
+
+    Args:
+        client_id: client primary key.
+        stage_id: stage primary key.
+
+    Returns:
+        bool: whether the client has already bet on the stage.
+    """
+    return await StageClient.objects.filter(client_id=client_id, stages_id=stage_id).aexists()
+
+
+def share_odds(stage_id):
+    """Read the stage odds locking them against changes until the transaction ends.
+
+    Args:
+        stage_id: stage primary key.
+
+    Raises:
+        DoesNotExist: if the stage does not exist.
+
+    Returns:
+        Decimal: stage odds.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SHARE_STAGE_ODDS_SQL, [stage_id])
+        row = cursor.fetchone()
+    if row is None:
+        raise Stage.DoesNotExist()
+    return row[0]
+
+
+def place_bet(client_id, stage_id, amount) -> StageClient:
+    """Place a bet debiting the stake in one transaction.
+
+    The bet keeps the stake and the stage odds at placement time. The odds are read
+    FOR SHARE in the bet transaction, so a concurrent reprice either waits for the
+    bet or is seen by it, and a concurrent settlement waits for the bet to commit.
+    The bet row is inserted next, so a concurrent bet on the same stage waits on the
+    unique index and fails. The stage result is checked after the insert, so no bet
+    lands on a settled stage. The debit checks the ledger balance under the client
+    lock, so concurrent bets cannot overdraw the balance: wallet.InsufficientFunds
+    propagates from the debit.
+
+    Args:
+        client_id: client primary key.
+        stage_id: stage primary key.
+        amount (Decimal): stake.
+
+    Raises:
+        BetAlreadyPlaced: if the client has already bet on the stage.
+        BettingClosed: if the stage is settled.
+
+    Returns:
+        StageClient: placed bet.
+    """
+    if has_bet(client_id, stage_id):
+        raise BetAlreadyPlaced()
+    try:
+        with transaction.atomic():
+            odds = share_odds(stage_id)
+            bet = StageClient.objects.create(
+                client_id=client_id, stages_id=stage_id, stake=amount, odds=odds,
+            )
+            if StageResult.objects.filter(stage_id=stage_id).exists():
+                raise BettingClosed()
+            debit(client_id, amount)
+    except IntegrityError as error:
+        raise BetAlreadyPlaced() from error
+    return bet
+
+
+def settle_stage(stage_id, outcome) -> tuple[int, int]:
+    """Record the stage result and settle its open bets with one statement.
+
+    The bets are updated in one UPDATE and the payouts are credited as one ledger
+    entry per client aggregated from the updated rows. The bettors are locked FOR KEY
+    SHARE before the statement, so wallet compaction cannot snapshot past the ids of
+    the credits while they are uncommitted. Settling again with the same
+    outcome settles only the bets left open, so it is safe to repeat.
+
+    Args:
+        stage_id: stage primary key.
+        outcome (StageOutcome): stage outcome for the bettors.
+
+    Raises:
+        StageAlreadySettled: if the stage is settled with another outcome.
+
+    Returns:
+        tuple[int, int]: amounts of settled bets and credited clients.
+    """
+    outcome = StageOutcome(outcome)
+    with transaction.atomic():
+        Stage.objects.select_for_update().values_list('pk').get(pk=stage_id)
+        stage_result, _ = StageResult.objects.get_or_create(
+            stage_id=stage_id, defaults={'outcome': outcome},
+        )
+        if stage_result.outcome != outcome:
+            raise StageAlreadySettled()
+        with connection.cursor() as cursor:
+            cursor.execute(LOCK_BETTORS_SQL, [stage_id])
+            cursor.execute(SETTLE_BETS_SQL, {
+                'stage': stage_id,
+                'outcome': outcome.value,
+                'kind': CREDIT_KINDS[outcome].value,
+            })
+            return cursor.fetchone()
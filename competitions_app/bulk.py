@@ -0,0 +1,344 @@
+"""Module for bulk writes of the REST API.
+
+``/api/<entities>/bulk/`` takes a list body: POST creates the items, PATCH updates
+the items keyed by id and DELETE removes the listed ids. The whole list is
+validated in one pass with related objects prefetched once, nothing is written if
+any record is invalid and the errors are listed in the order of the items. Unique
+field combinations are checked within the batch and against stored rows with one
+query per constraint. Valid lists are written with one bulk query in a transaction.
+"""
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from . import caching, serializers
+from .models import get_datetime
+
+ID = serializers.ID
+MODIFIED = 'modified'
+NOT_FOUND = _('Object does not exist.')
+DUPLICATE = _('Duplicate id.')
+NOT_UNIQUE = _('The fields {0} must make a unique set.')
+
+
+def get_items(request) -> list:
+    """Read the list body.
+
+    Args:
+        request: request.
+
+    Raises:
+        ValidationError: if the body is not a list of an allowed size.
+
+    Returns:
+        list: payload records.
+    """
+    payload = request.data
+    if not isinstance(payload, list) or not payload:
+        raise exceptions.ValidationError(_('Expected a non-empty list.'))
+    if len(payload) > settings.API_MAX_BULK_SIZE:
+        raise exceptions.ValidationError(
+            _('At most {0} items are allowed.').format(settings.API_MAX_BULK_SIZE),
+        )
+    return payload
+
+
+def get_context(viewset, payload) -> dict:
+    """Build serializer context with related objects of the whole batch.
+
+    Args:
+        viewset: bulk view set.
+        payload (list): payload records.
+
+    Returns:
+        dict: serializer context.
+    """
+    return {
+        **viewset.get_serializer_context(),
+        serializers.PREFETCHED: viewset.flat_serializer_class.prefetch(payload),
+    }
+
+
+def respond(viewset, instances, context, status_code) -> Response:
+    """Serialize written objects with their many-to-many keys prefetched once.
+
+    Args:
+        viewset: bulk view set.
+        instances (list): written objects.
+        context (dict): serializer context.
+        status_code (int): response status.
+
+    Returns:
+        Response: flat representation of the objects.
+    """
+    serializer_class = viewset.flat_serializer_class
+    models.prefetch_related_objects(instances, *serializer_class.prefetch_related)
+    return Response(
+        serializer_class(instances, many=True, context=context).data, status=status_code,
+    )
+
+
+def get_unique_fields(model_class) -> list[tuple]:
+    """List field combinations of unconditional unique constraints.
+
+    Args:
+        model_class: model class.
+
+    Returns:
+        list[tuple]: field names of every constraint.
+    """
+    return [
+        tuple(constraint.fields)
+        for constraint in model_class._meta.constraints
+        if isinstance(constraint, models.UniqueConstraint) and constraint.fields
+        and constraint.condition is None
+    ]
+
+
+def read_unique_values(fields, attrs, instance) -> tuple:
+    """Read a unique combination of a record, stored values fill partial updates.
+
+    Args:
+        fields (tuple): field names of the constraint.
+        attrs (dict): validated fields.
+        instance: updated object or None.
+
+    Returns:
+        tuple: primary keys or values of the fields.
+    """
+    field_values = (
+        attrs[name] if name in attrs else getattr(instance, name, None) for name in fields
+    )
+    return tuple(getattr(field_value, 'pk', field_value) for field_value in field_values)
+
+
+def read_stored(model_class, fields, combinations, excluded) -> set[tuple]:
+    """Read the given unique combinations which are already stored.
+
+    Args:
+        model_class: model class.
+        fields (tuple): field names of the constraint.
+        combinations (set[tuple]): combinations without NULL.
+        excluded (set): primary keys of stored rows the batch rewrites.
+
+    Returns:
+        set[tuple]: stored combinations.
+    """
+    if not combinations:
+        return set()
+    condition = reduce(
+        or_, (models.Q(**dict(zip(fields, combination))) for combination in combinations),
+    )
+    queryset = model_class.objects.exclude(pk__in=excluded).filter(condition)
+    return set(queryset.values_list(*fields))
+
+
+def check_unique(model_class, records, excluded=()) -> list[dict]:
+    """Find records repeating a unique combination of the batch or of stored rows.
+
+    Combinations holding NULL are skipped, PostgreSQL does not compare them.
+
+    Args:
+        model_class: model class.
+        records (list[tuple]): validated fields and updated object or None.
+        excluded (set): primary keys of stored rows the batch rewrites.
+
+    Returns:
+        list[dict]: errors in the order of the records.
+    """
+    errors = [{} for _ in records]
+    for fields in get_unique_fields(model_class):
+        combinations = [read_unique_values(fields, *record) for record in records]
+        complete = {combination for combination in combinations if None not in combination}
+        seen = read_stored(model_class, fields, complete, excluded)
+        for index, combination in enumerate(combinations):
+            if combination in seen:
+                errors[index].setdefault(api_settings.NON_FIELD_ERRORS_KEY, []).append(
+                    NOT_UNIQUE.format(', '.join(fields)),
+                )
+            elif None not in combination:
+                seen.add(combination)
+    return errors
+
+
+def bulk_create(viewset, payload) -> Response:
+    """Create all records with one insert.
+
+    Args:
+        viewset: bulk view set.
+        payload (list): payload records.
+
+    Raises:
+        ValidationError: if any record repeats a unique combination.
+
+    Returns:
+        Response: created objects.
+    """
+    context = get_context(viewset, payload)
+    serializer = viewset.flat_serializer_class(data=payload, many=True, context=context)
+    serializer.is_valid(raise_exception=True)
+    model_class = viewset.queryset.model
+    errors = check_unique(model_class, [(attrs, None) for attrs in serializer.validated_data])
+    if any(errors):
+        raise exceptions.ValidationError(errors)
+    instances = [model_class(**attrs) for attrs in serializer.validated_data]
+    with transaction.atomic():
+        model_class.objects.bulk_create(instances)
+        caching.invalidate(caching.get_keys(model_class, instances))
+    return respond(viewset, instances, context, status.HTTP_201_CREATED)
+
+
+def fetch_instances(viewset, keys) -> dict:
+    """Fetch updated objects with the related objects their validation reads.
+
+    Args:
+        viewset: bulk view set.
+        keys (list): primary keys, None for malformed ones.
+
+    Returns:
+        dict: objects by primary key.
+    """
+    queryset = viewset.queryset.model.objects.select_related(
+        *viewset.flat_serializer_class.write_related,
+    )
+    return queryset.in_bulk({key for key in keys if key is not None})
+
+
+def validate_updates(viewset, payload, context) -> tuple[list, list]:
+    """Validate partial updates of existing objects fetched with one query.
+
+    Args:
+        viewset: bulk view set.
+        payload (list): payload records with ids.
+        context (dict): serializer context.
+
+    Returns:
+        tuple[list, list]: validated serializers and errors in the order of the records.
+    """
+    keys = [
+        serializers.to_pk(viewset.queryset.model, record.get(ID))
+        if isinstance(record, dict) else None
+        for record in payload
+    ]
+    instances = fetch_instances(viewset, keys)
+    validated, errors, seen = [], [], set()
+    for key, record in zip(keys, payload):
+        if key not in instances:
+            errors.append({ID: [NOT_FOUND]})
+        elif key in seen:
+            errors.append({ID: [DUPLICATE]})
+        else:
+            seen.add(key)
+            serializer = viewset.flat_serializer_class(
+                instances[key], data=record, partial=True, context=context,
+            )
+            errors.append({} if serializer.is_valid() else serializer.errors)
+            validated.append(serializer)
+    return validated, errors
+
+
+def apply_updates(validated) -> tuple[list, set]:
+    """Set validated fields and the modification time on the objects.
+
+    Args:
+        validated (list): validated serializers.
+
+    Returns:
+        tuple[list, set]: updated objects and names of the changed fields.
+    """
+    fields, now = {MODIFIED}, get_datetime()
+    instances = []
+    for update in validated:
+        for name, field_value in update.validated_data.items():
+            setattr(update.instance, name, field_value)
+        update.instance.modified = now
+        fields.update(update.validated_data)
+        instances.append(update.instance)
+    return instances, fields
+
+
+def bulk_update(viewset, payload) -> Response:
+    """Update all records with one query.
+
+    Args:
+        viewset: bulk view set.
+        payload (list): payload records with ids.
+
+    Raises:
+        ValidationError: if any record is invalid or repeats a unique combination.
+
+    Returns:
+        Response: updated objects.
+    """
+    context = get_context(viewset, payload)
+    validated, errors = validate_updates(viewset, payload, context)
+    if any(errors):
+        raise exceptions.ValidationError(errors)
+    model_class = viewset.queryset.model
+    errors = check_unique(
+        model_class,
+        [(update.validated_data, update.instance) for update in validated],
+        {update.instance.pk for update in validated},
+    )
+    if any(errors):
+        raise exceptions.ValidationError(errors)
+    stale_keys = caching.get_keys(model_class, [update.instance for update in validated])
+    instances, fields = apply_updates(validated)
+    with transaction.atomic():
+        model_class.objects.bulk_update(instances, fields)
+        caching.invalidate(stale_keys | caching.get_keys(model_class, instances))
+    return respond(viewset, instances, context, status.HTTP_200_OK)
+
+
+def bulk_delete(viewset, payload) -> Response:
+    """Delete all listed ids with one query.
+
+    Args:
+        viewset: bulk view set.
+        payload (list): primary keys.
+
+    Raises:
+        ValidationError: if any id does not exist.
+
+    Returns:
+        Response: empty response.
+    """
+    model_class = viewset.queryset.model
+    keys = [serializers.to_pk(model_class, record) for record in payload]
+    existing = set(
+        model_class.objects.filter(
+            pk__in={key for key in keys if key is not None},
+        ).values_list('pk', flat=True),
+    )
+    errors = [{} if key in existing else {ID: [NOT_FOUND]} for key in keys]
+    if any(errors):
+        raise exceptions.ValidationError(errors)
+    with transaction.atomic():
+        model_class.objects.filter(pk__in=existing).delete()
+    return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class BulkMixin:
+    """View set mixin adding the bulk route, flat_serializer_class reads the records."""
+
+    flat_serializer_class = None
+
+    @action(detail=False, methods=['post', 'patch', 'delete'], url_path='bulk')
+    def bulk(self, request):
+        """Create, update or delete a list of objects at once.
+
+        Args:
+            request: request with a list body.
+
+        Returns:
+            Response: written objects or an empty response.
+        """
+        handlers = {'POST': bulk_create, 'PATCH': bulk_update, 'DELETE': bulk_delete}
+        return handlers[request.method](self, get_items(request))
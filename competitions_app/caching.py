@@ -0,0 +1,288 @@
+"""Module for the read-through cache of entity pages.
+
+Competitions, sports and stages are cached by primary key along with the lists
+their pages show: sports of a competition and upcoming stages of a sport. Every
+key has a generation stored in the cache and values live under the current one.
+Writes bump generations of exactly the keys they affect, right away and once more
+on commit, so a reader which loaded a row before a concurrent commit stores it
+under an outdated generation nobody reads again. Values read inside a transaction
+may be uncommitted and are not stored. Values are loaded from the primary, a
+lagging replica would store rows older than the generation under it.
+
+The local memory backend is private to a process, deployments with several
+worker processes set CACHE_LOCATION to share a file based cache.
+"""
+import time
+from collections import Counter
+from contextlib import suppress
+from functools import partial
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import signals
+from django.dispatch import receiver
+from django.utils import timezone
+
+from . import queries
+from .models import Competition, CompetitionsSports, Sport, Stage
+
+COMPETITION_SPORTS = 'competition_sports'
+SPORT_STAGES = 'sport_stages'
+SPORTS = 'sports'
+QUERY_STAGES = 'query_stages'
+HITS = 'hits'
+MISSES = 'misses'
+MISSING = object()
+CACHED_MODELS = (Competition, Sport, Stage, CompetitionsSports)
+MOVABLE_MODELS = (Stage, CompetitionsSports)
+M2M_ACTIONS = frozenset(('pre_clear', 'post_add', 'post_remove'))
+
+stats = Counter()
+
+
+def get_key(kind, pk) -> str:
+    """Build a cache key.
+
+    Args:
+        kind (str): model name or list name.
+        pk: primary key of the object or of the list owner.
+
+    Returns:
+        str: key without the generation.
+    """
+    return f'{kind}:{pk}'
+
+
+def get_generation(key) -> int:
+    """Read the key generation, starting it from the clock if missing.
+
+    Clock based starts keep an evicted generation from coming back to old values.
+
+    Args:
+        key (str): cache key.
+
+    Returns:
+        int: current generation.
+    """
+    generation_key = f'{key}:generation'
+    generation = cache.get(generation_key)
+    if generation is None:
+        cache.add(generation_key, time.time_ns(), timeout=None)
+        generation = cache.get(generation_key)
+    return generation
+
+
+def lookup(kind, pk, variant='') -> tuple:
+    """Find the value key and the cached value, counting a hit or a miss.
+
+    Args:
+        kind (str): model name or list name, metrics are counted by it.
+        pk: primary key of the object or of the list owner.
+        variant (str): part of the value key not tracked by invalidation.
+
+    Returns:
+        tuple: value key and cached value, MISSING on a miss.
+    """
+    key = get_key(kind, pk)
+    versioned_key = f'{key}:{get_generation(key)}:{variant}'
+    cached = cache.get(versioned_key, MISSING)
+    stats[kind, MISSES if cached is MISSING else HITS] += 1
+    return versioned_key, cached
+
+
+def read_through(kind, pk, load, variant=''):
+    """Return the cached value or load and store it.
+
+    Args:
+        kind (str): model name or list name, metrics are counted by it.
+        pk: primary key of the object or of the list owner.
+        load: callable loading the value from the database.
+        variant (str): part of the value key not tracked by invalidation.
+
+    Returns:
+        cached or loaded value.
+    """
+    versioned_key, cached = lookup(kind, pk, variant)
+    if cached is not MISSING:
+        return cached
+    loaded = load()
+    if not transaction.get_connection().in_atomic_block:
+        cache.set(versioned_key, loaded)
+    return loaded
+
+
+def get_object(model_class, pk):
+    """Read a competition, a sport or a stage by primary key.
+
+    Args:
+        model_class: model class.
+        pk: primary key.
+
+    Returns:
+        Model: object.
+    """
+    primary = model_class.objects.using(DEFAULT_DB_ALIAS)
+    return read_through(model_class._meta.model_name, pk, partial(primary.get, pk=pk))
+
+
+def get_competition_sports(competition) -> list:
+    """Read sports of a competition.
+
+    Args:
+        competition (Competition): competition.
+
+    Returns:
+        list: sports.
+    """
+    return read_through(
+        COMPETITION_SPORTS,
+        competition.pk,
+        lambda: list(Sport.objects.using(DEFAULT_DB_ALIAS).filter(competitions=competition)),
+    )
+
+
+def get_sport_stages(sport) -> list:
+    """Read upcoming stages of a sport grouped by competition.
+
+    The list depends on the current date, so the date is a part of the value key.
+
+    Args:
+        sport (Sport): sport.
+
+    Returns:
+        list: pairs of a competition and its stages.
+    """
+    return read_through(
+        SPORT_STAGES,
+        sport.pk,
+        partial(queries.get_upcoming_stages, sport),
+        variant=timezone.localdate().isoformat(),
+    )
+
+
+def get_page_lists(instance) -> dict:
+    """Read lists shown on the page of the object.
+
+    Args:
+        instance: competition, sport or stage.
+
+    Returns:
+        dict: template context with the lists.
+    """
+    if isinstance(instance, Competition):
+        return {SPORTS: get_competition_sports(instance)}
+    if isinstance(instance, Sport):
+        return {QUERY_STAGES: get_sport_stages(instance)}
+    return {}
+
+
+def get_keys(model_class, instances) -> set[str]:
+    """Find cache keys depending on the objects with one query at most.
+
+    Args:
+        model_class: model class of the objects.
+        instances: objects.
+
+    Returns:
+        set[str]: affected keys.
+    """
+    instances = list(instances)
+    pks = {instance.pk for instance in instances}
+    links = CompetitionsSports.objects.values_list('competition_id', 'sport_id')
+    if model_class is Competition:
+        keys = {get_key(COMPETITION_SPORTS, pk) for pk in pks}
+        links = links.filter(competition_id__in=pks)
+        keys.update(get_key(SPORT_STAGES, sport) for _, sport in links)
+    elif model_class is Sport:
+        keys = {get_key(SPORT_STAGES, pk) for pk in pks}
+        links = links.filter(sport_id__in=pks)
+        keys.update(get_key(COMPETITION_SPORTS, competition) for competition, _ in links)
+    elif model_class is Stage:
+        keys = set()
+        links = links.filter(pk__in={instance.comp_sport_id for instance in instances})
+        keys.update(get_key(SPORT_STAGES, sport) for _, sport in links)
+    else:
+        return {
+            key
+            for instance in instances
+            for key in (
+                get_key(COMPETITION_SPORTS, instance.competition_id_id),
+                get_key(SPORT_STAGES, instance.sport_id_id),
+            )
+        }
+    return keys | {get_key(model_class._meta.model_name, pk) for pk in pks}
+
+
+def bump(keys) -> None:
+    """Move the keys to new generations.
+
+    Args:
+        keys (set[str]): cache keys.
+    """
+    for key in keys:
+        with suppress(ValueError):
+            cache.incr(f'{key}:generation')
+
+
+def invalidate(keys) -> None:
+    """Invalidate the keys now and again when the transaction commits.
+
+    Args:
+        keys (set[str]): cache keys.
+    """
+    bump(keys)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(partial(bump, keys))
+
+
+def get_stats() -> dict:
+    """Report hits and misses of this process.
+
+    Returns:
+        dict: hits and misses amounts by key kind.
+    """
+    report = {}
+    for (kind, outcome), amount in stats.items():
+        report.setdefault(kind, {HITS: 0, MISSES: 0})[outcome] = amount
+    return report
+
+
+def invalidate_moved(sender, instance, raw=False, **kwargs):
+    """Invalidate lists holding the stored version of a stage or a link.
+
+    Args:
+        sender: saved model class.
+        instance: saved object.
+        raw (bool): whether the instance is loaded from a fixture.
+        kwargs: other signal arguments.
+    """
+    if not raw and not instance._state.adding:
+        invalidate(get_keys(sender, sender.objects.filter(pk=instance.pk)))
+
+
+def invalidate_changed(sender, instance, **kwargs):
+    """Invalidate keys of a saved or deleted object.
+
+    Args:
+        sender: model class.
+        instance: saved or deleted object.
+        kwargs: other signal arguments.
+    """
+    invalidate(get_keys(sender, [instance]))
+
+
+@receiver(signals.m2m_changed, sender=CompetitionsSports)
+def invalidate_linked(sender, instance, action, **kwargs):
+    """Invalidate both sides of links changed through the many to many managers.
+
+    Args:
+        sender: link model class.
+        instance: competition or sport whose links change.
+        action (str): manager action.
+        kwargs: other side model and primary keys, None on clear.
+    """
+    if action in M2M_ACTIONS:
+        model_class = kwargs['model']
+        keys = get_keys(type(instance), [instance])
+        keys.update(get_keys(model_class, [model_class(pk=pk) for pk in kwargs['pk_set'] or ()]))
+        invalidate(keys)
@@ -0,0 +1,166 @@
+"""Module for the incremental catalog change feed.
+
+Triggers of the catalog tables write a change log entry per changed row in the
+changing transaction, deletes are recorded as tombstones. The feed orders entries
+by transaction id and returns only entries of transactions older than the oldest
+running one, so a cursor never passes an entry which commits later. A page holds
+the latest entry of every changed object with its current flat representation.
+"""
+from types import MappingProxyType
+
+from django.db import DEFAULT_DB_ALIAS, connection
+from rest_framework import decorators, exceptions
+from rest_framework.response import Response
+
+from . import authentication, pagination, serializers
+from .models import Competition, CompetitionsSports, Sport, Stage
+from .views import MyPermission
+
+CHANGES_SQL = """
+    SELECT txid, id, entity, object_id, deleted
+    FROM crud_api.change_log
+    WHERE (txid, id) > (%s, %s)
+        AND txid < pg_snapshot_xmin(pg_current_snapshot())::text::bigint
+    ORDER BY txid, id
+    LIMIT %s
+"""
+
+ENTITIES = MappingProxyType({
+    'competition': ('competitions', Competition, serializers.FlatCompetitionSerializer),
+    'sport': ('sports', Sport, serializers.FlatSportSerializer),
+    'stage': ('stages', Stage, serializers.FlatStageSerializer),
+    'competitions_sports': (
+        'competitionssports', CompetitionsSports, serializers.FlatCompetitionsSportsSerializer,
+    ),
+})
+SINCE = 'since'
+CURSOR_SEPARATOR = '.'
+OPERATION = 'operation'
+
+
+def parse_cursor(request) -> tuple[int, int]:
+    """Read the feed position from the query.
+
+    Args:
+        request: request.
+
+    Raises:
+        ValidationError: if the cursor is malformed.
+
+    Returns:
+        tuple[int, int]: transaction id and entry id, zeros for the feed start.
+    """
+    since = request.query_params.get(SINCE)
+    if not since:
+        return 0, 0
+    txid, _, entry_id = since.partition(CURSOR_SEPARATOR)
+    try:
+        return int(txid), int(entry_id)
+    except ValueError:
+        raise exceptions.ValidationError({SINCE: 'Expected a cursor of the change feed.'})
+
+
+def read_entries(cursor, limit) -> list[tuple]:
+    """Read entries of finished transactions after the cursor.
+
+    Args:
+        cursor (tuple[int, int]): transaction id and entry id.
+        limit (int): maximal amount of entries.
+
+    Returns:
+        list[tuple]: transaction id, entry id, table, object id and deletion flag.
+    """
+    with connection.cursor() as db_cursor:
+        db_cursor.execute(CHANGES_SQL, [*cursor, limit])
+        return db_cursor.fetchall()
+
+
+def load_objects(keys) -> dict:
+    """Serialize current state of changed objects with a query per entity.
+
+    Objects are read from the primary like the change log, an object missing from
+    a lagging replica would be taken for a deleted one and its change skipped.
+
+    Args:
+        keys (list[tuple]): tables and ids of the objects.
+
+    Returns:
+        dict: flat representations by table and object id.
+    """
+    serialized = {}
+    for table, (_, model_class, serializer_class) in ENTITIES.items():
+        pks = [pk for entity, pk in keys if entity == table]
+        if pks:
+            queryset = serializer_class.plan(
+                model_class.objects.using(DEFAULT_DB_ALIAS).filter(pk__in=pks),
+            )
+            serialized.update(
+                ((table, instance.pk), serializer_class(instance).data) for instance in queryset
+            )
+    return serialized
+
+
+def get_change(key, deleted, serialized):
+    """Build an upsert or a tombstone.
+
+    Args:
+        key (tuple): table and object id.
+        deleted (bool): whether the latest change is a deletion.
+        serialized (dict): flat representations by table and object id.
+
+    Returns:
+        dict: change or None if the object is deleted meanwhile.
+    """
+    table, object_id = key
+    change = {'entity': ENTITIES[table][0], 'id': object_id}
+    if deleted:
+        return {**change, OPERATION: 'delete'}
+    if key not in serialized:
+        return None
+    return {**change, OPERATION: 'upsert', 'object': serialized[key]}
+
+
+def get_changes(entries) -> list[dict]:
+    """Collapse entries to the latest change of every object.
+
+    Upserts of objects deleted meanwhile are left out, their tombstones follow.
+
+    Args:
+        entries (list[tuple]): change log entries.
+
+    Returns:
+        list[dict]: upserts with current representations and tombstones.
+    """
+    latest = {}
+    for entry in entries:
+        key = tuple(entry[2:4])
+        latest.pop(key, None)
+        latest[key] = entry[4]
+    serialized = load_objects([key for key, deleted in latest.items() if not deleted])
+    changes = (get_change(key, deleted, serialized) for key, deleted in latest.items())
+    return [change for change in changes if change is not None]
+
+
+@decorators.api_view(['GET'])
+@decorators.authentication_classes([authentication.CachedTokenAuthentication])
+@decorators.permission_classes([MyPermission])
+def changes_view(request):
+    """Return catalog changes after the cursor.
+
+    Args:
+        request: request.
+
+    Returns:
+        Response: changes, the cursor of the next request and whether more are ready.
+    """
+    cursor = parse_cursor(request)
+    limit = pagination.KeysetPagination().get_page_size(request)
+    entries = read_entries(cursor, limit + 1)
+    page = entries[:limit]
+    if page:
+        cursor = page[-1][:2]
+    return Response({
+        'changes': get_changes(page),
+        'cursor': CURSOR_SEPARATOR.join(map(str, cursor)),
+        'has_more': len(entries) > limit,
+    })
@@ -0,0 +1,171 @@
+"""Module for conditional GET of the REST API.
+
+Validators are read with one aggregate query before the response is built: lists
+are tagged with the latest modification time and the amount of rows, details
+with the modification time and the primary key. Rows of the link tables behind
+many to many fields are folded in the same way, since the representations list
+linked objects, e.g. sports of a competition or clients of a stage. Matching
+If-None-Match or If-Modified-Since headers are answered with 304 without
+serializing anything. Expanded responses carry no validators, related objects
+change on their own.
+"""
+from functools import partial
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .fieldsets import EXPAND
+
+LATEST = 'latest'
+TOTAL = 'total'
+LINK_LATEST = '{0}_latest'
+LINK_TOTAL = '{0}_total'
+
+
+def get_validators(tag, modified, request) -> tuple:
+    """Build the ETag and the Last-Modified timestamp.
+
+    The renderer format is part of the ETag since JSON and the browsable API
+    share the URL.
+
+    Args:
+        tag (str): rows identity, amount of rows or primary key.
+        modified (datetime): latest modification time or None.
+        request: request.
+
+    Returns:
+        tuple: quoted ETag and timestamp in seconds or None.
+    """
+    timestamp = modified.timestamp() if modified else 0
+    etag = quote_etag(f'{request.accepted_renderer.format}-{tag}-{timestamp}')
+    return etag, int(timestamp) if modified else None
+
+
+def get_link_names(model_class) -> list[str]:
+    """Return query names of the link tables of the model's many to many fields.
+
+    Args:
+        model_class: model class.
+
+    Returns:
+        list[str]: reverse relation names, e.g. ['competitionssports'].
+    """
+    throughs = {field.remote_field.through for field in model_class._meta.many_to_many}
+    return sorted(
+        relation.name
+        for relation in model_class._meta.related_objects
+        if relation.related_model in throughs
+    )
+
+
+def aggregate(queryset) -> tuple:
+    """Read amounts and the latest modification time of rows and their links.
+
+    Args:
+        queryset (QuerySet): serialized rows.
+
+    Returns:
+        tuple: amounts of rows and of every link table, latest modification time or None.
+    """
+    aggregates = {LATEST: Max('modified'), TOTAL: Count('pk', distinct=True)}
+    for name in get_link_names(queryset.model):
+        aggregates[LINK_LATEST.format(name)] = Max(f'{name}__modified')
+        aggregates[LINK_TOTAL.format(name)] = Count(name, distinct=True)
+    aggregated = queryset.order_by().aggregate(**aggregates)
+    totals = [amount for key, amount in aggregated.items() if key.endswith(TOTAL)]
+    moments = [moment for key, moment in aggregated.items() if key.endswith(LATEST) and moment]
+    return totals, max(moments, default=None)
+
+
+def list_validators(queryset, request) -> tuple:
+    """Read validators of a list with one aggregate query.
+
+    Args:
+        queryset (QuerySet): filtered list queryset.
+        request: request.
+
+    Returns:
+        tuple: quoted ETag and timestamp in seconds or None.
+    """
+    totals, modified = aggregate(queryset)
+    return get_validators('.'.join(map(str, totals)), modified, request)
+
+
+def detail_validators(queryset, pk, request):
+    """Read validators of an object with one query.
+
+    Args:
+        queryset (QuerySet): detail queryset.
+        pk: primary key of the object.
+        request: request.
+
+    Returns:
+        tuple: quoted ETag and timestamp in seconds, None if the object is missing.
+    """
+    try:
+        totals, modified = aggregate(queryset.filter(pk=pk))
+    except ValidationError:
+        return None
+    if not totals[0]:
+        return None
+    return get_validators('.'.join(map(str, [pk, *totals[1:]])), modified, request)
+
+
+def respond(request, validators, build_response):
+    """Answer 304 if the client copy is fresh, otherwise build the response.
+
+    Args:
+        request: request.
+        validators (tuple): quoted ETag and timestamp or None.
+        build_response: callable building the full response.
+
+    Returns:
+        HttpResponse: not modified or full response with validators.
+    """
+    if validators is None or request.query_params.get(EXPAND):
+        return build_response()
+    etag, last_modified = validators
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        return not_modified
+    response = build_response()
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+class ConditionalMixin:
+    """View set mixin answering conditional GET of lists and details."""
+
+    def list(self, request, *args, **kwargs):
+        """List objects unless the client copy is fresh.
+
+        Args:
+            request: request.
+            args: positional arguments.
+            kwargs: keyword arguments.
+
+        Returns:
+            HttpResponse: not modified or list response.
+        """
+        validators = list_validators(self.filter_queryset(self.get_queryset()), request)
+        return respond(request, validators, partial(super().list, request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve an object unless the client copy is fresh.
+
+        Args:
+            request: request.
+            args: positional arguments.
+            kwargs: keyword arguments.
+
+        Returns:
+            HttpResponse: not modified or detail response.
+        """
+        validators = detail_validators(
+            self.filter_queryset(self.get_queryset()), kwargs[self.lookup_field], request,
+        )
+        return respond(request, validators, partial(super().retrieve, request, *args, **kwargs))
@@ -48,3 +48,14 @@ STAGES = 'stages'
 STAGE = 'stage'
 FORM = 'form'
 POST = 'POST'
+PROFILE = 'profile'
+CURSOR = 'cursor'
+CATALOG_PAGE_SIZE = 10
+SPORT_STAGES_LIMIT = 50
+EXPORT_CHUNK_SIZE = 2000
+MODE = 'mode'
+FLAT = 'flat'
+PAGE_SIZE = 'page_size'
+PAGINATION = 'pagination'
+OFF = 'off'
+MAX_EXPAND_DEPTH = 3
@@ -0,0 +1,112 @@
+"""Module for maintained entity counters."""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection
+
+from .models import Competition, EntityCounter, Sport, Stage
+
+COUNTED_MODELS = (Competition, Sport, Stage)
+
+ESTIMATED_COUNTS_SQL = """
+    SELECT relation.name, GREATEST(pg_class.reltuples, 0)::bigint
+    FROM unnest(%s::text[], %s::text[]) AS relation(name, db_table)
+    JOIN pg_class ON pg_class.oid = relation.db_table::regclass
+"""
+
+
+def count_created(sender, created, raw=False, **kwargs):
+    """Increment counter of a counted model on creation.
+
+    Args:
+        sender: saved model class.
+        created (bool): whether a new row was inserted.
+        raw (bool): whether the instance is loaded from a fixture.
+        kwargs: other signal arguments.
+    """
+    if created and not raw:
+        EntityCounter.add(sender, 1)
+
+
+def count_deleted(sender, **kwargs):
+    """Decrement counter of a counted model on deletion, cascades included.
+
+    Args:
+        sender: deleted model class.
+        kwargs: other signal arguments.
+    """
+    EntityCounter.add(sender, -1)
+
+
+def get_exact_counts(model_classes=COUNTED_MODELS) -> dict:
+    """Read maintained counters with a single primary key lookup.
+
+    Args:
+        model_classes (tuple): counted model classes.
+
+    Returns:
+        dict: rows amount by model class.
+    """
+    by_name = {model_class._meta.label_lower: model_class for model_class in model_classes}
+    counters = dict(
+        EntityCounter.objects.filter(name__in=by_name).values_list('name', 'amount'),
+    )
+    return {
+        model_class: counters[name] if name in counters else EntityCounter.reconcile(model_class)
+        for name, model_class in by_name.items()
+    }
+
+
+def get_estimated_counts(model_classes=COUNTED_MODELS) -> dict:
+    """Read planner row estimates from pg_class, as fresh as the last (auto)vacuum.
+
+    Args:
+        model_classes (tuple): counted model classes.
+
+    Returns:
+        dict: estimated rows amount by model class.
+    """
+    by_name = {model_class._meta.label_lower: model_class for model_class in model_classes}
+    tables = [model_class._meta.db_table for model_class in by_name.values()]
+    with connection.cursor() as cursor:
+        cursor.execute(ESTIMATED_COUNTS_SQL, [list(by_name), tables])
+        return {by_name[name]: rows_amount for name, rows_amount in cursor.fetchall()}
+
+
+def get_counts(model_classes=COUNTED_MODELS) -> dict:
+    """Read rows amounts in the mode chosen by ENTITY_COUNTS_ESTIMATED setting.
+
+    Args:
+        model_classes (tuple): counted model classes.
+
+    Returns:
+        dict: rows amount by model class.
+    """
+    if settings.ENTITY_COUNTS_ESTIMATED:
+        return get_estimated_counts(model_classes)
+    return get_exact_counts(model_classes)
+
+
+async def aget_counts(model_classes=COUNTED_MODELS) -> dict:
+    """Read rows amounts asynchronously, missing counters are recounted concurrently.
+
+    Args:
+        model_classes (tuple): counted model classes.
+
+    Returns:
+        dict: rows amount by model class.
+    """
+    if settings.ENTITY_COUNTS_ESTIMATED:
+        return await sync_to_async(get_estimated_counts)(model_classes)
+    by_name = {model_class._meta.label_lower: model_class for model_class in model_classes}
+    counts = {
+        by_name[name]: amount
+        async for name, amount in EntityCounter.objects.filter(
+            name__in=by_name,
+        ).values_list('name', 'amount')
+    }
+    missing = [model_class for model_class in model_classes if model_class not in counts]
+    recounted = await asyncio.gather(*(EntityCounter.areconcile(model) for model in missing))
+    counts.update(zip(missing, recounted))
+    return counts
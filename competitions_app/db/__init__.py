@@ -0,0 +1,7 @@
+"""PostgreSQL backend taking connections from a psycopg pool.
+
+Use ``competitions_app.db`` as the ENGINE and put the keyword arguments of
+``psycopg_pool.ConnectionPool``, e.g. sizes and the checkout timeout, under
+OPTIONS['pool']. Without them the backend connects per request like the stock
+one.
+"""
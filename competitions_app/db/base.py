@@ -0,0 +1,170 @@
+"""Module for the pooled PostgreSQL database wrapper.
+
+Physical connections live in one pool per database alias and process. A
+connection is configured once when the pool opens it: the search_path comes
+with the startup options and the time zone and role are set by ``configure``,
+so a checkout costs no handshake and no statements. With CONN_HEALTH_CHECKS
+the pool checks a connection before handing it out and replaces a broken one.
+Closing a Django connection returns it to the pool, so CONN_MAX_AGE must be 0.
+"""
+import threading
+from functools import partial
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base
+from django.db.utils import DEFAULT_DB_ALIAS
+from psycopg import sql
+from psycopg_pool import ConnectionPool
+
+from .creation import DatabaseCreation
+
+POOL = 'pool'
+ISOLATION_LEVEL = 'isolation_level'
+
+
+def configure_connection(connection, timezone_sql, timezone_name, role) -> None:
+    """Set the time zone and the role of a new physical connection.
+
+    Args:
+        connection: psycopg connection opened by the pool.
+        timezone_sql (str): statement setting the time zone.
+        timezone_name (str): time zone of the database, None to keep the server one.
+        role (str): role to assume, None to keep the login one.
+    """
+    with connection.cursor() as cursor:
+        if timezone_name and connection.info.parameter_status('TimeZone') != timezone_name:
+            cursor.execute(timezone_sql, [timezone_name])
+        if role:
+            cursor.execute(sql.SQL('SET ROLE {0}').format(sql.Identifier(role)))
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """PostgreSQL database wrapper backed by a psycopg connection pool.
+
+    Args:
+        base.DatabaseWrapper: PostgreSQL database wrapper of Django.
+    """
+
+    creation_class = DatabaseCreation
+    pools = {}
+    pools_lock = threading.Lock()
+
+    @property
+    def pool(self):
+        """Connection pool of the alias, created on first use.
+
+        The pool is replaced when the database name changes, e.g. for the test
+        database.
+
+        Raises:
+            ImproperlyConfigured: if connections are persistent.
+
+        Returns:
+            ConnectionPool: pool or None if pooling is off.
+        """
+        pool_options = self.settings_dict['OPTIONS'].get(POOL)
+        if self.alias == NO_DB_ALIAS or not pool_options:
+            return None
+        if self.settings_dict['CONN_MAX_AGE']:
+            raise ImproperlyConfigured('Pooled connections must not be persistent.')
+        with self.pools_lock:
+            pool = self.pools.get(self.alias)
+            if pool is not None and pool.kwargs['dbname'] != self.settings_dict['NAME']:
+                pool.close()
+                pool = None
+            if pool is None:
+                pool = self.create_pool(pool_options)
+                self.pools[self.alias] = pool
+        return pool
+
+    def create_pool(self, pool_options):
+        """Create a closed pool of connections to the database.
+
+        Args:
+            pool_options (dict): keyword arguments of the pool.
+
+        Returns:
+            ConnectionPool: pool.
+        """
+        connect_kwargs = self.get_connection_params()
+        connect_kwargs['autocommit'] = True
+        return ConnectionPool(
+            kwargs=connect_kwargs,
+            open=False,
+            configure=partial(
+                configure_connection,
+                timezone_sql=self.ops.set_time_zone_sql(),
+                timezone_name=self.timezone_name,
+                role=self.settings_dict['OPTIONS'].get('assume_role'),
+            ),
+            check=ConnectionPool.check_connection
+            if self.settings_dict['CONN_HEALTH_CHECKS'] else None,
+            name=self.alias,
+            **pool_options,
+        )
+
+    def close_pool(self) -> None:
+        """Close the pool of the alias with all its connections."""
+        with self.pools_lock:
+            pool = self.pools.pop(self.alias, None)
+        if pool is not None:
+            pool.close()
+
+    def get_connection_params(self) -> dict:
+        """Build connection parameters without the pool options.
+
+        Returns:
+            dict: keyword arguments of psycopg connect.
+        """
+        conn_params = super().get_connection_params()
+        conn_params.pop(POOL, None)
+        return conn_params
+
+    def get_new_connection(self, conn_params):
+        """Check a connection out of the pool or open a new one.
+
+        Args:
+            conn_params (dict): keyword arguments of psycopg connect.
+
+        Returns:
+            Connection: psycopg connection.
+        """
+        pool = self.pool
+        if pool is None:
+            return super().get_new_connection(conn_params)
+        pool.open()
+        connection = pool.getconn()
+        isolation_level = self.settings_dict['OPTIONS'].get(ISOLATION_LEVEL)
+        self.isolation_level = base.IsolationLevel.READ_COMMITTED
+        if isolation_level is not None:
+            self.isolation_level = base.IsolationLevel(isolation_level)
+            connection.isolation_level = self.isolation_level
+        return connection
+
+    def init_connection_state(self) -> None:
+        """Configure the connection unless the pool has configured it."""
+        if self.pool is None:
+            super().init_connection_state()
+
+    def _close(self):
+        if self.connection is None or self.pool is None:
+            return super()._close()
+        with self.wrap_database_errors:
+            self.connection._pool.putconn(self.connection)  # noqa: WPS437
+        self.connection = None
+        return None
+
+
+def get_pool_stats(alias=DEFAULT_DB_ALIAS) -> dict:
+    """Read statistics of the pool of the alias in this process.
+
+    Args:
+        alias (str): database alias.
+
+    Returns:
+        dict: pool counters and gauges, empty if the pool is not open.
+    """
+    if alias not in DatabaseWrapper.pools:
+        return {}
+    return DatabaseWrapper.pools[alias].get_stats()
@@ -0,0 +1,14 @@
+"""Module for creating test databases of the pooled backend."""
+from django.db.backends.postgresql import creation
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    """Test database creation closing the pool before dropping a database.
+
+    Args:
+        creation.DatabaseCreation: PostgreSQL test database creation of Django.
+    """
+
+    def _destroy_test_db(self, test_database_name, verbosity):
+        self.connection.close_pool()
+        super()._destroy_test_db(test_database_name, verbosity)
@@ -0,0 +1,163 @@
+"""Module for streaming catalog exports.
+
+Rows are read through a server-side cursor and written to the response as they
+come, so worker memory depends on the chunk size, not on the table size.
+"""
+import csv
+import json
+from types import MappingProxyType
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, StreamingHttpResponse
+from django.utils.dateparse import parse_datetime
+from rest_framework import decorators, exceptions
+
+from competitions_app import config
+
+from . import authentication
+from .fixtures import chunked
+from .models import Competition, Sport, Stage
+from .views import MyPermission
+
+COMMON_FIELDS = ('id', 'name')
+TIMESTAMP_FIELDS = ('created', 'modified')
+EXPORTS = MappingProxyType({
+    'competitions': (
+        Competition, (*COMMON_FIELDS, 'competition_start', 'competition_end', *TIMESTAMP_FIELDS),
+    ),
+    'sports': (Sport, (*COMMON_FIELDS, 'description', *TIMESTAMP_FIELDS)),
+    'stages': (
+        Stage,
+        (
+            *COMMON_FIELDS,
+            'stage_date',
+            'place',
+            'bet_coefficient',
+            'comp_sport_id',
+            *TIMESTAMP_FIELDS,
+        ),
+    ),
+})
+MODIFIED_SINCE = 'modified__gte'
+
+
+class Echo:
+    """Pseudo buffer returning written values instead of storing them."""
+
+    def write(self, line):
+        """Return the written line.
+
+        Args:
+            line (str): line formatted by csv.writer.
+
+        Returns:
+            str: the same line.
+        """
+        return line
+
+
+def iter_ndjson(rows, fields):
+    """Format rows as JSON lines.
+
+    Args:
+        rows: value tuples.
+        fields (tuple[str]): field names.
+
+    Yields:
+        str: JSON line.
+    """
+    yield from (
+        f'{json.dumps(dict(zip(fields, row)), cls=DjangoJSONEncoder)}\n' for row in rows
+    )
+
+
+def iter_csv(rows, fields):
+    """Format rows as CSV lines with a header.
+
+    Args:
+        rows: value tuples.
+        fields (tuple[str]): field names.
+
+    Yields:
+        str: CSV line.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    yield from (writer.writerow(row) for row in rows)
+
+
+FORMATS = MappingProxyType({
+    'ndjson': (iter_ndjson, 'application/x-ndjson'),
+    'csv': (iter_csv, 'text/csv'),
+})
+
+
+def get_rows(model_class, fields, modified_since=None):
+    """Read rows through a server-side cursor in table order.
+
+    Args:
+        model_class: exported model class.
+        fields (tuple[str]): exported fields.
+        modified_since (datetime): lower bound of modification time.
+
+    Returns:
+        Iterator: value tuples.
+    """
+    queryset = model_class.objects.order_by()
+    if modified_since is not None:
+        queryset = queryset.filter(**{MODIFIED_SINCE: modified_since})
+    return queryset.values_list(*fields).iterator(chunk_size=config.EXPORT_CHUNK_SIZE)
+
+
+def parse_modified_since(request):
+    """Read the modification time filter from the query.
+
+    Args:
+        request: request.
+
+    Raises:
+        ValidationError: if the filter is not a datetime.
+
+    Returns:
+        datetime: lower bound of modification time or None.
+    """
+    modified_since = request.query_params.get(MODIFIED_SINCE)
+    if not modified_since:
+        return None
+    try:
+        parsed = parse_datetime(modified_since)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise exceptions.ValidationError({MODIFIED_SINCE: 'Expected ISO 8601 datetime.'})
+    return parsed
+
+
+@decorators.api_view(['GET'])
+@decorators.authentication_classes([authentication.CachedTokenAuthentication])
+@decorators.permission_classes([MyPermission])
+def export_view(request, name, file_format):
+    """Stream the whole table, optionally rows modified since the given time.
+
+    Args:
+        request: request.
+        name (str): exported table name.
+        file_format (str): ndjson or csv.
+
+    Raises:
+        Http404: if the table or the format is unknown.
+
+    Returns:
+        StreamingHttpResponse: streamed file.
+    """
+    if name not in EXPORTS or file_format not in FORMATS:
+        raise Http404()
+    model_class, fields = EXPORTS[name]
+    formatter, content_type = FORMATS[file_format]
+    lines = formatter(get_rows(model_class, fields, parse_modified_since(request)), fields)
+    response = StreamingHttpResponse(
+        (''.join(chunk) for chunk in chunked(lines, config.EXPORT_CHUNK_SIZE)),
+        content_type=content_type,
+    )
+    response['Content-Disposition'] = f'attachment; filename="{name}.{file_format}"'
+    return response
@@ -0,0 +1,114 @@
+"""Module for sparse fieldsets and nested expansion of API responses.
+
+``?fields=id,name`` keeps the listed fields of the response and loads only their
+columns. ``?expand=comp_sport.competition_id`` replaces relations along the path
+with nested objects loaded by select_related, or by prefetch_related once the path
+crosses a to-many relation. Both apply to reads only.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import exceptions
+
+from competitions_app import config
+
+from .pagination import DESCENDING, get_keyset_ordering
+
+FIELDS = 'fields'
+EXPAND = 'expand'
+READ_METHODS = frozenset(('GET', 'HEAD'))
+PATH_SEPARATOR = '.'
+
+
+def get_names(request, query_name) -> tuple[str, ...]:
+    """Read a comma separated list of names from the query of a read request.
+
+    Args:
+        request: request or None.
+        query_name (str): query parameter.
+
+    Returns:
+        tuple[str, ...]: names, empty if the parameter is missing.
+    """
+    if request is None or request.method not in READ_METHODS:
+        return ()
+    raw_names = request.query_params.get(query_name, '')
+    return tuple(name.strip() for name in raw_names.split(',') if name.strip())
+
+
+def check_names(names, available, query_name) -> None:
+    """Reject names missing from the serializer.
+
+    Args:
+        names (tuple[str, ...]): requested names.
+        available: names of the serializer fields.
+        query_name (str): query parameter.
+
+    Raises:
+        ValidationError: if some names are unknown.
+    """
+    unknown = sorted(set(names) - set(available))
+    if unknown:
+        raise exceptions.ValidationError({
+            query_name: [f'Unknown field: {name}' for name in unknown],
+        })
+
+
+def get_relation(model_class, name):
+    """Find a relation of the model.
+
+    Args:
+        model_class: model class.
+        name (str): field name.
+
+    Returns:
+        Field: relation field or None if the name is not a relation.
+    """
+    try:
+        field = model_class._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    return field if field.is_relation and field.related_model else None
+
+
+def get_columns(model_class, fields) -> list[str]:
+    """List columns loaded for the fields along with the keyset ordering.
+
+    Args:
+        model_class: model class.
+        fields (tuple[str, ...]): serialized fields.
+
+    Returns:
+        list[str]: names for QuerySet.only.
+    """
+    ordering = (name.lstrip(DESCENDING) for name in get_keyset_ordering(model_class))
+    columns = {model_class._meta.pk.name, *ordering}
+    for name in fields:
+        try:
+            field = model_class._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if field.concrete and not field.many_to_many:
+            columns.add(name)
+    return sorted(columns)
+
+
+def split_paths(paths) -> dict:
+    """Group expansion paths by their first relation.
+
+    Args:
+        paths (tuple[str, ...]): dotted paths.
+
+    Raises:
+        ValidationError: if a path is deeper than allowed.
+
+    Returns:
+        dict: rest of the paths by the first relation.
+    """
+    grouped = {}
+    for path in paths:
+        first, _, rest = path.partition(PATH_SEPARATOR)
+        if path.count(PATH_SEPARATOR) >= config.MAX_EXPAND_DEPTH:
+            raise exceptions.ValidationError({EXPAND: [f'Too deep: {path}']})
+        grouped.setdefault(first, [])
+        if rest:
+            grouped[first].append(rest)
+    return grouped
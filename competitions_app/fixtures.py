@@ -0,0 +1,396 @@
+"""Module for streaming bulk import of catalog fixtures.
+
+Records are read lazily from CSV or JSON lines files and written in chunks, so
+memory depends on the chunk size and the catalog natural keys, not on the amount
+of stages. Competitions and sports are keyed by name, competition sport links by
+the pair of their keys. Stages are validated against the competition bounds held in
+memory and written with COPY.
+"""
+import csv
+import itertools
+import json
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from uuid import uuid4
+
+from django.db import connection, transaction
+from django.utils.translation import gettext_lazy as _
+
+from . import caching, models
+
+COPY_STAGES_SQL = """
+    COPY crud_api.stage
+    (id, name, stage_date, place, bet_coefficient, comp_sport_id, created, modified)
+    FROM STDIN
+"""
+
+COPY_NULL = r'\N'
+COPY_ESCAPES = str.maketrans({'\\': r'\\', '\t': r'\t', '\n': r'\n', '\r': r'\r'})
+JSON_LINES_SUFFIXES = frozenset(('.jsonl', '.ndjson'))
+NAME = 'name'
+COMPETITION = 'competition'
+SPORT = 'sport'
+COMPETITION_START = 'competition_start'
+COMPETITION_END = 'competition_end'
+COEFFICIENT_STEP = Decimal(1).scaleb(-models.DECIMAL_PLACES)
+COEFFICIENT_LIMIT = 10 ** (models.MAX_DIGITS - models.DECIMAL_PLACES)
+
+
+def read_records(path):
+    """Read records of a CSV or JSON lines file one by one.
+
+    Args:
+        path (str): file path, the format is chosen by the suffix.
+
+    Yields:
+        dict: record.
+
+    Raises:
+        ValueError: if the file format is not supported.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix not in JSON_LINES_SUFFIXES | {'.csv'}:
+        raise ValueError(_('Unsupported fixture format: {0}').format(suffix))
+    with open(path, newline='', encoding='utf-8') as fixture:
+        if suffix == '.csv':
+            yield from csv.DictReader(fixture)
+            return
+        for line in fixture:
+            if line.strip():
+                yield json.loads(line)
+
+
+def chunked(iterable, size):
+    """Split an iterable into lists lazily.
+
+    Args:
+        iterable: items.
+        size (int): items per chunk.
+
+    Yields:
+        list: chunk of items.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class Catalog:
+    """Natural key maps of competitions, sports and their links."""
+
+    def __init__(self):
+        """Load the keys of existing rows with three queries."""
+        self.competitions = {
+            name: (pk, start, end)
+            for pk, name, start, end in models.Competition.objects.values_list(
+                'pk', NAME, COMPETITION_START, COMPETITION_END,
+            )
+        }
+        self.sports = dict(models.Sport.objects.values_list(NAME, 'pk'))
+        self.links = {
+            (competition, sport): pk
+            for pk, competition, sport in models.CompetitionsSports.objects.values_list(
+                'pk', 'competition_id', 'sport_id',
+            )
+        }
+
+    def add_competitions(self, numbered_records) -> tuple[int, list]:
+        """Create valid competitions missing from the map.
+
+        Args:
+            numbered_records (list[tuple[int, dict]]): competition records with their numbers.
+
+        Returns:
+            tuple[int, list]: amount of created competitions and errors with record numbers.
+        """
+        created, errors = {}, []
+        for number, record in numbered_records:
+            try:
+                fields = validate_competition(record)
+            except (KeyError, TypeError, ValueError) as error:
+                errors.append((number, str(error)))
+                continue
+            if fields[NAME] not in self.competitions:
+                created[fields[NAME]] = models.Competition(**fields)
+        models.Competition.objects.bulk_create(created.values())
+        for competition_name, competition in created.items():
+            self.competitions[competition_name] = (
+                competition.pk, competition.competition_start, competition.competition_end,
+            )
+        return len(created), errors
+
+    def add_sports(self, records) -> int:
+        """Create sports missing from the map.
+
+        Args:
+            records (list[dict]): sport records.
+
+        Returns:
+            int: amount of created sports.
+        """
+        created = {}
+        for record in records:
+            if record[NAME] not in self.sports:
+                created[record[NAME]] = models.Sport(
+                    name=record[NAME], description=record.get('description') or None,
+                )
+        models.Sport.objects.bulk_create(created.values())
+        self.sports.update((name, sport.pk) for name, sport in created.items())
+        return len(created)
+
+    def resolve(self, competition_name, sport_name) -> tuple:
+        """Find competition bounds and primary keys by names.
+
+        Args:
+            competition_name (str): competition name.
+            sport_name (str): sport name.
+
+        Raises:
+            ValueError: if the competition or the sport is unknown.
+
+        Returns:
+            tuple: competition primary key, start, end and sport primary key.
+        """
+        if competition_name not in self.competitions:
+            raise ValueError(_('Unknown competition: {0}').format(competition_name))
+        if sport_name not in self.sports:
+            raise ValueError(_('Unknown sport: {0}').format(sport_name))
+        return *self.competitions[competition_name], self.sports[sport_name]
+
+    def add_links(self, keys) -> None:
+        """Create competition sport links missing from the map.
+
+        Args:
+            keys (set[tuple]): pairs of competition and sport primary keys.
+        """
+        created = [
+            models.CompetitionsSports(competition_id_id=competition, sport_id_id=sport)
+            for competition, sport in keys - self.links.keys()
+        ]
+        models.CompetitionsSports.objects.bulk_create(created)
+        self.links.update(
+            ((link.competition_id_id, link.sport_id_id), link.pk) for link in created
+        )
+
+
+def validate_text(record, field, max_length, required=False) -> str:
+    """Check a text field fits its column.
+
+    Args:
+        record (dict): competition or stage record.
+        field (str): field name.
+        max_length (int): maximum length of the column.
+        required (bool): whether the text must not be blank.
+
+    Raises:
+        ValueError: if the text is blank but required or too long.
+
+    Returns:
+        str: text or None.
+    """
+    text = record.get(field)
+    if required and not str(text or '').strip():
+        raise ValueError(_('Field {field} is required.').format(field=field))
+    if text and len(str(text)) > max_length:
+        raise ValueError(
+            _('Field {field} is longer than {length} characters.').format(
+                field=field, length=max_length,
+            ),
+        )
+    return text
+
+
+def validate_coefficient(coefficient):
+    """Parse a coefficient the way the decimal column stores it.
+
+    Args:
+        coefficient: coefficient of the record, empty if it must be generated.
+
+    Raises:
+        ValueError: if the coefficient is not a finite number fitting the column.
+
+    Returns:
+        Decimal: coefficient rounded to the column places or None.
+    """
+    if coefficient in {None, ''}:
+        return None
+    try:
+        parsed = Decimal(str(coefficient))
+    except InvalidOperation:
+        parsed = None
+    if parsed is None or not parsed.is_finite():
+        raise ValueError(_('Bet coefficient must be a number.'))
+    parsed = parsed.quantize(COEFFICIENT_STEP)
+    if abs(parsed) >= COEFFICIENT_LIMIT:
+        raise ValueError(
+            _('Bet coefficient must be less than {limit}.').format(limit=COEFFICIENT_LIMIT),
+        )
+    return parsed
+
+
+def validate_competition(record) -> dict:
+    """Check a competition record against its columns and the check_start_date constraint.
+
+    Args:
+        record (dict): competition record.
+
+    Raises:
+        ValueError: if the record is invalid.
+
+    Returns:
+        dict: competition fields.
+    """
+    fields = {
+        NAME: validate_text(record, NAME, models.MAX_LENGTH_NAME, required=True),
+        COMPETITION_START: date.fromisoformat(record[COMPETITION_START]),
+        COMPETITION_END: date.fromisoformat(record[COMPETITION_END]),
+    }
+    if fields[COMPETITION_END] <= fields[COMPETITION_START]:
+        raise ValueError(_('Competition cannot end before its start.'))
+    return fields
+
+
+def validate_stage(record, catalog):
+    """Resolve stage keys and check its fields before they reach COPY.
+
+    The rules follow Stage.clean without fetching the competition per stage, the
+    name, place and coefficient are checked against their columns, so a bad
+    record is reported instead of failing the COPY of its whole chunk.
+
+    Args:
+        record (dict): stage record.
+        catalog (Catalog): natural key maps.
+
+    Raises:
+        ValueError: if the record is invalid.
+
+    Returns:
+        tuple: stage date, competition and sport primary keys pair, coefficient or None.
+    """
+    validate_text(record, NAME, models.MAX_LENGTH_NAME, required=True)
+    validate_text(record, 'place', models.MAX_LENGTH_PLACE)
+    competition, start, end, sport = catalog.resolve(record[COMPETITION], record[SPORT])
+    stage_date = date.fromisoformat(record['stage_date'])
+    if start and stage_date < start:
+        raise ValueError(_('Stage cannot be held before the competition start.'))
+    if end and stage_date > end:
+        raise ValueError(_('Stage cannot be held after the competition end.'))
+    return stage_date, (competition, sport), validate_coefficient(record.get('bet_coefficient'))
+
+
+def validate_stages(numbered_records, catalog):
+    """Validate a chunk of stages against the in-memory catalog.
+
+    Args:
+        numbered_records (list[tuple[int, dict]]): stage records with their numbers.
+        catalog (Catalog): natural key maps.
+
+    Returns:
+        tuple[list, list]: valid records with resolved keys and errors with record numbers.
+    """
+    valid, errors = [], []
+    for number, record in numbered_records:
+        try:
+            valid.append((record, *validate_stage(record, catalog)))
+        except (KeyError, TypeError, ValueError) as error:
+            errors.append((number, str(error)))
+    return valid, errors
+
+
+def to_copy_text(text) -> str:
+    """Format a text for COPY text format.
+
+    Args:
+        text (str): column text.
+
+    Returns:
+        str: escaped text, NULL marker for empty texts.
+    """
+    if not text:
+        return COPY_NULL
+    return str(text).translate(COPY_ESCAPES)
+
+
+def get_stage_line(stage, coefficient, catalog, now) -> str:
+    """Build a COPY line of the stage table.
+
+    Args:
+        stage (tuple): record with stage date, link key and coefficient.
+        coefficient (float): generated coefficient used if the record has none.
+        catalog (Catalog): natural key maps.
+        now (str): creation time.
+
+    Returns:
+        str: tab separated column values.
+    """
+    record, stage_date, link_key, fixed_coefficient = stage
+    columns = (
+        uuid4().hex,
+        to_copy_text(record[NAME]),
+        stage_date,
+        to_copy_text(record.get('place')),
+        coefficient if fixed_coefficient is None else fixed_coefficient,
+        catalog.links[link_key].hex,
+        now,
+        now,
+    )
+    return '\t'.join(map(str, columns))
+
+
+def copy_stages(valid, catalog, odds_generator) -> None:
+    """Write validated stages with one COPY.
+
+    Coefficients missing from the records are drawn for the chunk at once.
+
+    Args:
+        valid (list[tuple]): records with resolved values.
+        catalog (Catalog): natural key maps.
+        odds_generator (OddsGenerator): coefficients generator.
+    """
+    catalog.add_links({link_key for _, _, link_key, _ in valid})
+    now = models.get_datetime().isoformat()
+    lines = (
+        get_stage_line(stage, coefficient, catalog, now)
+        for stage, coefficient in zip(valid, odds_generator.generate(len(valid)))
+    )
+    with connection.cursor() as cursor:
+        with cursor.cursor.copy(COPY_STAGES_SQL) as copy:
+            copy.write(''.join(f'{line}\n' for line in lines))
+    models.EntityCounter.add(models.Stage, len(valid))
+    invalidate_links({link_key for _, _, link_key, _ in valid})
+
+
+def invalidate_links(link_keys) -> None:
+    """Invalidate cached lists of the links which got new stages.
+
+    Args:
+        link_keys (set[tuple]): pairs of competition and sport primary keys.
+    """
+    links = [
+        models.CompetitionsSports(competition_id_id=competition, sport_id_id=sport)
+        for competition, sport in link_keys
+    ]
+    caching.invalidate(caching.get_keys(models.CompetitionsSports, links))
+
+
+def import_stages(records, catalog, chunk_size, odds_generator):
+    """Import stages chunk by chunk, every chunk in its own transaction.
+
+    Args:
+        records: stage records.
+        catalog (Catalog): natural key maps.
+        chunk_size (int): records per chunk.
+        odds_generator (OddsGenerator): coefficients generator.
+
+    Yields:
+        tuple[int, list]: amount of imported stages and errors of every chunk.
+    """
+    for chunk in chunked(enumerate(records, 1), chunk_size):
+        valid, errors = validate_stages(chunk, catalog)
+        with transaction.atomic():
+            copy_stages(valid, catalog, odds_generator)
+        yield len(valid), errors
@@ -2,7 +2,7 @@
 import datetime
 
 from django import forms as dj_form
-from django.contrib.auth import forms, models
+from django.contrib.auth import authenticate, forms, models
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxLengthValidator, MinLengthValidator
 from django.utils.translation import gettext_lazy as _
@@ -80,14 +80,28 @@ class LoginForm(dj_form.Form):
     username = dj_form.CharField(label='Login')
     password = dj_form.CharField(label='Password', widget=dj_form.PasswordInput)
 
+    def __init__(self, *args, request=None, **kwargs):
+        """
+        Initialize the form.
+
+        Args:
+            args: positional arguments of Form.
+            request (HttpRequest): request passed to the authentication backends.
+            kwargs: keyword arguments of Form.
+        """
+        super().__init__(*args, **kwargs)
+        self.request = request
+        # authenticated user, set by a successful validation
+        self.user = None
+
     def clean(self):
         """
         Validate the username and password.
 
         This method validates the username and password entered by the user.
         It checks that the username exists in the database and that the password
-        is correct. If the username and password are valid, it sets the user's
-        token and saves the user.
+        is correct. If the username and password are valid, it remembers the
+        authenticated user and makes sure the user has an API token.
 
         Returns:
             dict: The cleaned data.
@@ -102,8 +116,8 @@ class LoginForm(dj_form.Form):
 
         This method validates the username and password entered by the user.
         It checks that the username exists in the database and that the password
-        is correct. If the username and password are valid, it sets the user's
-        token and saves the user.
+        is correct. If the username and password are valid, it remembers the
+        authenticated user and makes sure the user has an API token.
 
         Args:
             cleaned_data (dict): The cleaned data.
@@ -118,28 +132,23 @@ class LoginForm(dj_form.Form):
         """
         Validate the user.
 
-        This method validates the user entered by the user. It checks that the
-        user exists in the database and that the password is correct. If the
-        user and password are valid, it sets the user's token and saves the user.
+        This method authenticates the user with a single password hash check.
+        The API token is created only if the user has none, nothing else is
+        written.
 
         Args:
             username (str): The username of the user.
             password (str): The password of the user.
 
         Raises:
-            ValidationError: If the user does not exist or the password is incorrect.
+            ValidationError: If the user does not exist, is inactive or the password is incorrect.
         """
-        try:
-            user = models.User.objects.get(username=username)
-        except models.User.DoesNotExist:
-            raise ValidationError('User with this username was not found.')
-
-        if not user.check_password(password):
+        user = authenticate(self.request, username=username, password=password)
+        if user is None:
             raise ValidationError('Incorrect username of password..')
 
-        token, _ = Token.objects.get_or_create(user=user)
-        user.token = token.key
-        user.save()
+        Token.objects.get_or_create(user=user)
+        self.user = user
 
 
 class CardNumberField(dj_form.CharField):
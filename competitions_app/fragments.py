@@ -0,0 +1,65 @@
+"""Module for versioned template fragments of catalog and entity pages.
+
+Markup shared by all users is cached with the ``cache`` template tag under a
+version digested from primary keys and modification times of the shown objects,
+so any change, insertion or deletion of a shown object moves the page to a new
+fragment. Per-user parts render outside of the fragments on every request.
+"""
+import hashlib
+from itertools import chain
+
+from django.conf import settings
+
+from . import caching
+
+FRAGMENT_VERSION = 'fragment_version'
+FRAGMENT_TIMEOUT = 'fragment_timeout'
+
+
+def get_version(instances) -> str:
+    """Digest primary keys and modification times of the objects.
+
+    Args:
+        instances: shown objects in the order of the page.
+
+    Returns:
+        str: fragment version.
+    """
+    digest = hashlib.md5(usedforsecurity=False)
+    for instance in instances:
+        digest.update(f'{instance.pk}:{instance.modified.isoformat()};'.encode())
+    return digest.hexdigest()
+
+
+def get_context(instances) -> dict:
+    """Build template context of the fragments showing the objects.
+
+    Args:
+        instances: shown objects in the order of the page.
+
+    Returns:
+        dict: fragment version and timeout.
+    """
+    return {
+        FRAGMENT_VERSION: get_version(instances),
+        FRAGMENT_TIMEOUT: settings.FRAGMENT_CACHE_TIMEOUT,
+    }
+
+
+def get_entity_context(instance, lists) -> dict:
+    """Build fragment context of an entity page.
+
+    Args:
+        instance: competition, sport or stage.
+        lists (dict): lists shown on the page, see caching.get_page_lists.
+
+    Returns:
+        dict: fragment version and timeout.
+    """
+    groups = lists.get(caching.QUERY_STAGES, ())
+    return get_context(chain(
+        (instance,),
+        lists.get(caching.SPORTS, ()),
+        (competition for competition, _ in groups),
+        chain.from_iterable(stages for _, stages in groups),
+    ))
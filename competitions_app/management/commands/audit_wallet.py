@@ -0,0 +1,47 @@
+"""Command replaying the wallet history of a client."""
+from django.core.management.base import BaseCommand, CommandError
+
+from competitions_app import wallet
+from competitions_app.models import Client
+
+
+class Command(BaseCommand):
+    """Print the ledger of a client and check its snapshots.
+
+    Args:
+        BaseCommand: base class for management commands.
+    """
+
+    help = 'Replay wallet history of a client and check balance snapshots.'
+
+    def add_arguments(self, parser):
+        """Add command arguments.
+
+        Args:
+            parser: arguments parser.
+        """
+        parser.add_argument('username')
+
+    def handle(self, *args, **options):
+        """Replay the history.
+
+        Args:
+            args: positional arguments.
+            options: command options.
+
+        Raises:
+            CommandError: if the client is not found or snapshots mismatch.
+        """
+        try:
+            client = Client.objects.get(user__username=options['username'])
+        except Client.DoesNotExist:
+            raise CommandError('Client with this username was not found.')
+        for entry, balance in wallet.replay(client.id):
+            self.stdout.write(f'{entry.id} {entry} = {balance}')
+        mismatches = wallet.audit(client.id)
+        for snapshot, replayed in mismatches:
+            self.stderr.write(
+                f'Snapshot {snapshot.id} holds {snapshot.balance}, history gives {replayed}',
+            )
+        if mismatches:
+            raise CommandError('Wallet snapshots do not match the history.')
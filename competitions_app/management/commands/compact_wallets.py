@@ -0,0 +1,38 @@
+"""Command rolling wallet ledger entries up into snapshots."""
+from django.core.management.base import BaseCommand
+
+from competitions_app import wallet
+
+DEFAULT_MIN_ENTRIES = 50
+DEFAULT_BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    """Create balance snapshots for clients with long unrolled ledger tails.
+
+    Meant to run periodically, e.g. from cron, to keep balance reads short.
+
+    Args:
+        BaseCommand: base class for management commands.
+    """
+
+    help = 'Roll wallet ledger entries up into balance snapshots.'
+
+    def add_arguments(self, parser):
+        """Add command arguments.
+
+        Args:
+            parser: arguments parser.
+        """
+        parser.add_argument('--min-entries', type=int, default=DEFAULT_MIN_ENTRIES)
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        """Compact wallets.
+
+        Args:
+            args: positional arguments.
+            options: command options.
+        """
+        created = wallet.compact(options['min_entries'], options['batch_size'])
+        self.stdout.write(f'Snapshots created: {created}')
@@ -0,0 +1,119 @@
+"""Command importing competitions, sports and stages from fixture files."""
+from django.core.management.base import BaseCommand, CommandError
+
+from competitions_app import fixtures
+from competitions_app.odds import OddsGenerator
+
+DEFAULT_CHUNK_SIZE = 10000
+MAX_REPORTED_ERRORS = 20
+
+
+class Command(BaseCommand):
+    """Stream CSV or JSON lines fixtures into the catalog.
+
+    Competitions and sports already present by name are skipped, competitions and
+    stages failing validation are reported with their record numbers and skipped.
+
+    Args:
+        BaseCommand: base class for management commands.
+    """
+
+    help = 'Import competitions, sports and stages from CSV or JSON lines files.'
+
+    def add_arguments(self, parser):
+        """Add command arguments.
+
+        Args:
+            parser: arguments parser.
+        """
+        parser.add_argument('--competitions', help='name, competition_start, competition_end')
+        parser.add_argument('--sports', help='name, description')
+        parser.add_argument(
+            '--stages', help='name, stage_date, competition, sport, place, bet_coefficient',
+        )
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+        parser.add_argument('--seed', type=int, help='seed of generated bet coefficients')
+
+    def handle(self, *args, **options):
+        """Import the files.
+
+        Args:
+            args: positional arguments.
+            options: command options.
+
+        Raises:
+            CommandError: if a file cannot be read.
+        """
+        try:
+            self.import_files(options)
+        except (OSError, ValueError) as error:
+            raise CommandError(error)
+
+    def import_files(self, options):
+        """Import competitions, sports and stages in this order.
+
+        Args:
+            options: command options.
+        """
+        catalog = fixtures.Catalog()
+        chunk_size = options['chunk_size']
+        if options['competitions']:
+            self.import_competitions(catalog, options)
+        if options['sports']:
+            created = sum(
+                catalog.add_sports(chunk)
+                for chunk in fixtures.chunked(fixtures.read_records(options['sports']), chunk_size)
+            )
+            self.stdout.write(f'Sports created: {created}')
+        if options['stages']:
+            self.import_stages(catalog, options)
+
+    def import_competitions(self, catalog, options):
+        """Import competitions reporting the first errors.
+
+        Args:
+            catalog (Catalog): natural key maps.
+            options: command options.
+        """
+        created, errors_amount = 0, 0
+        chunks = fixtures.chunked(
+            enumerate(fixtures.read_records(options['competitions']), 1), options['chunk_size'],
+        )
+        for chunk in chunks:
+            chunk_created, errors = catalog.add_competitions(chunk)
+            created += chunk_created
+            errors_amount += self.report(errors, errors_amount)
+        self.stdout.write(f'Competitions created: {created}, skipped: {errors_amount}')
+
+    def import_stages(self, catalog, options):
+        """Import stages reporting the first errors.
+
+        Args:
+            catalog (Catalog): natural key maps.
+            options: command options.
+        """
+        imported, errors_amount = 0, 0
+        chunks = fixtures.import_stages(
+            fixtures.read_records(options['stages']),
+            catalog,
+            options['chunk_size'],
+            OddsGenerator(options['seed']),
+        )
+        for chunk_imported, errors in chunks:
+            imported += chunk_imported
+            errors_amount += self.report(errors, errors_amount)
+        self.stdout.write(f'Stages imported: {imported}, skipped: {errors_amount}')
+
+    def report(self, errors, reported) -> int:
+        """Write errors of a chunk until MAX_REPORTED_ERRORS are written.
+
+        Args:
+            errors (list[tuple[int, str]]): record numbers and messages.
+            reported (int): amount of errors of the file before the chunk.
+
+        Returns:
+            int: amount of errors of the chunk.
+        """
+        for number, message in errors[:max(MAX_REPORTED_ERRORS - reported, 0)]:
+            self.stderr.write(f'Record {number}: {message}')
+        return len(errors)
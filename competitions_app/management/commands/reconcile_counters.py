@@ -0,0 +1,29 @@
+"""Command recounting maintained entity counters."""
+from django.core.management.base import BaseCommand
+
+from competitions_app.counters import COUNTED_MODELS
+from competitions_app.models import EntityCounter
+
+
+class Command(BaseCommand):
+    """Reconcile entity counters with actual rows amounts.
+
+    Counters drift only after writes bypassing the ORM hooks (raw SQL,
+    bulk_create with ignore_conflicts), so it is meant to run periodically, e.g. from cron.
+
+    Args:
+        BaseCommand: base class for management commands.
+    """
+
+    help = 'Set entity counters to actual rows amounts.'
+
+    def handle(self, *args, **options):
+        """Recount every counted model.
+
+        Args:
+            args: positional arguments.
+            options: command options.
+        """
+        for model_class in COUNTED_MODELS:
+            rows_amount = EntityCounter.reconcile(model_class)
+            self.stdout.write(f'{model_class._meta.label_lower}: {rows_amount}')
@@ -0,0 +1,41 @@
+"""Command settling bets on a stage."""
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from competitions_app import bets
+from competitions_app.models import StageOutcome
+
+
+class Command(BaseCommand):
+    """Record the stage result and settle its bets.
+
+    Args:
+        BaseCommand: base class for management commands.
+    """
+
+    help = 'Record the stage result and settle its open bets.'
+
+    def add_arguments(self, parser):
+        """Add command arguments.
+
+        Args:
+            parser: arguments parser.
+        """
+        parser.add_argument('stage')
+        parser.add_argument('outcome', choices=StageOutcome.values)
+
+    def handle(self, *args, **options):
+        """Settle the stage.
+
+        Args:
+            args: positional arguments.
+            options: command options.
+
+        Raises:
+            CommandError: if the stage is not found or settled with another outcome.
+        """
+        try:
+            settled, credited = bets.settle_stage(options['stage'], options['outcome'])
+        except (ObjectDoesNotExist, ValidationError) as error:
+            raise CommandError(error)
+        self.stdout.write(f'Bets settled: {settled}, clients credited: {credited}')
@@ -0,0 +1,243 @@
+"""Module for response compression, client resolution and replica middleware.
+
+Responses over COMPRESSION_MIN_SIZE bytes and streamed ones are compressed with
+brotli when the client accepts it and with gzip otherwise. Brotli runs at a low
+quality level, dynamic responses cannot afford its slowest settings. Only API
+payloads are compressed with brotli, HTML pages carry CSRF tokens and keep the
+BREACH padding of the gzip middleware.
+
+``request.client`` is the betting client of the logged in user, resolved on
+first access and cached for CLIENT_CACHE_TTL seconds under the session key.
+Async views await ``request.aclient()`` instead.
+
+Reads of a reading request go to a replica unless its client has written within
+REPLICA_STICKY_SECONDS, which a short lived cookie set after writes remembers.
+Writing requests read from the primary, the rows they update must be current.
+"""
+import re
+from functools import partial
+
+import brotli
+from django.conf import settings
+from django.core.cache import cache
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.functional import SimpleLazyObject
+
+from . import routers
+from .models import Client
+
+ACCEPTS_BROTLI = re.compile(r'\bbr\b')
+CONTENT_ENCODING = 'Content-Encoding'
+WEAK_PREFIX = 'W/'
+BROTLI_CONTENT_TYPES = frozenset(('application/json', 'application/msgpack'))
+PRIMARY_COOKIE = 'read_primary'
+READ_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+
+
+def use_brotli(request, response) -> bool:
+    """Check whether the response is an API payload the client accepts brotli for.
+
+    Args:
+        request: request.
+        response: response.
+
+    Returns:
+        bool: whether to compress with brotli.
+    """
+    if response.streaming and response.is_async:
+        return False
+    content_type = response.get('Content-Type', '').partition(';')[0].strip()
+    accepted = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    return content_type in BROTLI_CONTENT_TYPES and bool(ACCEPTS_BROTLI.search(accepted))
+
+
+def compress_stream(chunks):
+    """Compress streamed chunks with brotli as they come.
+
+    Args:
+        chunks: streamed byte strings.
+
+    Yields:
+        bytes: compressed chunks.
+    """
+    compressor = brotli.Compressor(quality=settings.BROTLI_QUALITY)
+    for chunk in chunks:
+        compressed = compressor.process(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.finish()
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """Compress large API responses with brotli, other ones with gzip.
+
+    Args:
+        GZipMiddleware: Django gzip middleware used when brotli is not accepted.
+    """
+
+    def process_response(self, request, response):
+        """Compress the response if it is large enough.
+
+        Args:
+            request: request.
+            response: response.
+
+        Returns:
+            HttpResponse: compressed or untouched response.
+        """
+        if response.has_header(CONTENT_ENCODING):
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+        if not use_brotli(request, response):
+            return super().process_response(request, response)
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if response.streaming:
+            response.streaming_content = compress_stream(response.streaming_content)
+            response.headers.pop('Content-Length', None)
+        else:
+            compressed = brotli.compress(response.content, quality=settings.BROTLI_QUALITY)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+        etag = response.get('ETag')
+        if etag and not etag.startswith(WEAK_PREFIX):
+            response.headers['ETag'] = f'{WEAK_PREFIX}{etag}'
+        response.headers[CONTENT_ENCODING] = 'br'
+        return response
+
+
+def lookup_client(request, user) -> tuple:
+    """Read the client of the session from the cache.
+
+    Args:
+        request: request.
+        user: authenticated user.
+
+    Returns:
+        tuple: cache key, None without a session, and client or None on a miss.
+    """
+    session_key = request.session.session_key
+    if not session_key:
+        return None, None
+    cache_key = f'client:{session_key}'
+    client = cache.get(cache_key)
+    if client is None or client.user_id != user.pk:
+        return cache_key, None
+    return cache_key, client
+
+
+def remember_client(cache_key, client, user):
+    """Cache the client row and attach the request user to it.
+
+    Only the client row is cached, its user is the already loaded request user.
+
+    Args:
+        cache_key (str): cache key, None without a session.
+        client (Client): client or None.
+        user: authenticated user.
+
+    Returns:
+        Client: client or None.
+    """
+    if client is None:
+        return None
+    if cache_key:
+        cache.set(cache_key, client, timeout=settings.CLIENT_CACHE_TTL)
+    client.user = user
+    return client
+
+
+def get_client(request):
+    """Resolve the client of the logged in user.
+
+    Args:
+        request: request after authentication.
+
+    Returns:
+        Client: client or None for anonymous users and users without a client.
+    """
+    user = request.user
+    if not user.is_authenticated:
+        return None
+    cache_key, client = lookup_client(request, user)
+    if client is not None:
+        client.user = user
+        return client
+    return remember_client(cache_key, Client.objects.filter(user=user).first(), user)
+
+
+async def aget_client(request):
+    """Resolve the client of the logged in user asynchronously.
+
+    Args:
+        request: request after authentication.
+
+    Returns:
+        Client: client or None for anonymous users and users without a client.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return None
+    cache_key, client = lookup_client(request, user)
+    if client is not None:
+        client.user = user
+        return client
+    return remember_client(cache_key, await Client.objects.filter(user=user).afirst(), user)
+
+
+class ClientMiddleware(MiddlewareMixin):
+    """Attach the lazily resolved client of the user to the request.
+
+    Args:
+        MiddlewareMixin: Django middleware serving sync and async requests.
+    """
+
+    def process_request(self, request):
+        """Attach request.client and the request.aclient coroutine function.
+
+        Args:
+            request: request.
+        """
+        request.client = SimpleLazyObject(partial(get_client, request))
+        request.aclient = partial(aget_client, request)
+
+
+class ReplicaMiddleware(MiddlewareMixin):
+    """Route reads of the request and keep clients on the primary after writes.
+
+    Args:
+        MiddlewareMixin: Django middleware serving sync and async requests.
+    """
+
+    def process_request(self, request):
+        """Pick the database for reads of the request.
+
+        Args:
+            request: request.
+        """
+        pinned = PRIMARY_COOKIE in request.COOKIES or request.method not in READ_METHODS
+        routers.start_request(pinned=pinned)
+
+    def process_response(self, request, response):
+        """Remember a write of the client for the sticky window.
+
+        Args:
+            request: request.
+            response: response.
+
+        Returns:
+            response: response, with the sticky cookie after writes.
+        """
+        if routers.finish_request() and settings.REPLICA_STICKY_SECONDS:
+            response.set_cookie(
+                PRIMARY_COOKIE,
+                '1',
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
@@ -0,0 +1,62 @@
+# Generated by Django 5.0.14 on 2026-10-17 06:35
+
+from django.db import migrations, models
+
+
+def _duplicates(model, *fields):
+    """Yield ids of rows repeating an earlier row by the given fields."""
+    seen = {}
+    for row in model.objects.order_by('created', 'id').values('id', *fields):
+        key = tuple(row[field] for field in fields)
+        if key in seen:
+            yield seen[key], row['id']
+        else:
+            seen[key] = row['id']
+
+
+def remove_duplicate_links(apps, schema_editor):
+    """Keep the oldest link of every pair, stages are moved to the kept link."""
+    competitions_sports = apps.get_model('competitions_app', 'CompetitionsSports')
+    stage = apps.get_model('competitions_app', 'Stage')
+    for kept_id, duplicate_id in list(_duplicates(competitions_sports, 'competition_id', 'sport_id')):
+        stage.objects.filter(comp_sport_id=duplicate_id).update(comp_sport_id=kept_id)
+        competitions_sports.objects.filter(id=duplicate_id).delete()
+
+    stage_client = apps.get_model('competitions_app', 'StageClient')
+    duplicate_ids = [duplicate_id for _, duplicate_id in _duplicates(stage_client, 'client', 'stages')]
+    stage_client.objects.filter(id__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competitions_app', '0002_remove_competition_check_start_date_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(fields=['competition_start', 'competition_end', 'name', 'id'], name='competition_ordering_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sport',
+            index=models.Index(fields=['name', 'id'], name='sport_ordering_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stage',
+            index=models.Index(fields=['stage_date', 'name', 'id'], name='stage_ordering_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stage',
+            index=models.Index(fields=['comp_sport', 'stage_date'], name='stage_comp_sport_date_idx'),
+        ),
+        migrations.RunPython(remove_duplicate_links, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='competitionssports',
+            constraint=models.UniqueConstraint(fields=('competition_id', 'sport_id'), name='unique_competition_sport'),
+        ),
+        migrations.AddConstraint(
+            model_name='stageclient',
+            constraint=models.UniqueConstraint(fields=('client', 'stages'), name='unique_stage_client'),
+        ),
+    ]
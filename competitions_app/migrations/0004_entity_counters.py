@@ -0,0 +1,39 @@
+# Generated by Django 5.0.14 on 2026-10-17 06:39
+
+from django.db import migrations, models
+
+COUNTED_MODELS = ('competition', 'sport', 'stage')
+
+
+def fill_counters(apps, schema_editor):
+    """Create counters holding current rows amounts."""
+    entity_counter = apps.get_model('competitions_app', 'EntityCounter')
+    for model_name in COUNTED_MODELS:
+        model_class = apps.get_model('competitions_app', model_name)
+        entity_counter.objects.create(
+            name=model_class._meta.label_lower,
+            amount=model_class.objects.count(),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competitions_app', '0003_ordering_indexes_and_constraints'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EntityCounter',
+            fields=[
+                ('name', models.CharField(max_length=100, primary_key=True, serialize=False, verbose_name='name')),
+                ('amount', models.BigIntegerField(default=0, verbose_name='amount')),
+            ],
+            options={
+                'verbose_name': 'entity counter',
+                'verbose_name_plural': 'entity counters',
+                'db_table': '"crud_api"."entity_counter"',
+            },
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
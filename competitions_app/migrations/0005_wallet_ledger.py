@@ -0,0 +1,73 @@
+# Generated by Django 5.0.14 on 2026-10-17 06:47
+
+import competitions_app.models
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def open_wallets(apps, schema_editor):
+    """Move client balances into opening ledger entries."""
+    client = apps.get_model('competitions_app', 'Client')
+    wallet_entry = apps.get_model('competitions_app', 'WalletEntry')
+    wallet_entry.objects.bulk_create(
+        wallet_entry(client_id=client_id, amount=money, kind='opening')
+        for client_id, money in client.objects.exclude(money=0).values_list('id', 'money')
+    )
+
+
+def close_wallets(apps, schema_editor):
+    """Move ledger balances back into client money."""
+    client = apps.get_model('competitions_app', 'Client')
+    wallet_entry = apps.get_model('competitions_app', 'WalletEntry')
+    balances = wallet_entry.objects.values('client_id').annotate(balance=Sum('amount'))
+    for row in balances:
+        client.objects.filter(id=row['client_id']).update(money=row['balance'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competitions_app', '0004_entity_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WalletEntry',
+            fields=[
+                ('created', models.DateTimeField(blank=True, default=competitions_app.models.get_datetime, null=True, validators=[competitions_app.models.check_created], verbose_name='created')),
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=11, verbose_name='amount')),
+                ('kind', models.CharField(choices=[('deposit', 'deposit'), ('bet', 'bet'), ('opening', 'opening balance')], max_length=20, verbose_name='kind')),
+                ('client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='competitions_app.client', verbose_name='client')),
+            ],
+            options={
+                'verbose_name': 'wallet entry',
+                'verbose_name_plural': 'wallet entries',
+                'db_table': '"crud_api"."wallet_entry"',
+                'indexes': [models.Index(fields=['client', 'id'], include=('amount',), name='wallet_entry_client_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='WalletSnapshot',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created', models.DateTimeField(blank=True, default=competitions_app.models.get_datetime, null=True, validators=[competitions_app.models.check_created], verbose_name='created')),
+                ('balance', models.DecimalField(decimal_places=2, max_digits=11, validators=[competitions_app.models.check_positive], verbose_name='balance')),
+                ('last_entry_id', models.BigIntegerField(verbose_name='last entry id')),
+                ('client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='competitions_app.client', verbose_name='client')),
+            ],
+            options={
+                'verbose_name': 'wallet snapshot',
+                'verbose_name_plural': 'wallet snapshots',
+                'db_table': '"crud_api"."wallet_snapshot"',
+                'indexes': [models.Index(fields=['client', '-last_entry_id'], include=('balance',), name='wallet_snapshot_client_idx')],
+            },
+        ),
+        migrations.RunPython(open_wallets, close_wallets),
+        migrations.RemoveField(
+            model_name='client',
+            name='money',
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.0.14 on 2026-10-17 06:51
+
+import competitions_app.models
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Stakes of earlier bets were never stored, they stay zero; odds are the current ones.
+FILL_ODDS_SQL = '''
+    UPDATE crud_api.stage_client AS bet
+    SET odds = stage.bet_coefficient
+    FROM crud_api.stage AS stage
+    WHERE stage.id = bet.stages_id
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competitions_app', '0005_wallet_ledger'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StageResult',
+            fields=[
+                ('created', models.DateTimeField(blank=True, default=competitions_app.models.get_datetime, null=True, validators=[competitions_app.models.check_created], verbose_name='created')),
+                ('stage', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='result', serialize=False, to='competitions_app.stage', verbose_name='stage')),
+                ('outcome', models.CharField(choices=[('won', 'won'), ('lost', 'lost'), ('void', 'void')], max_length=20, verbose_name='outcome')),
+            ],
+            options={
+                'verbose_name': 'stage result',
+                'verbose_name_plural': 'stage results',
+                'db_table': '"crud_api"."stage_result"',
+            },
+        ),
+        migrations.AddField(
+            model_name='stageclient',
+            name='odds',
+            field=models.DecimalField(decimal_places=2, default=1, max_digits=5, verbose_name='odds'),
+        ),
+        migrations.AddField(
+            model_name='stageclient',
+            name='settled',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='settled'),
+        ),
+        migrations.AddField(
+            model_name='stageclient',
+            name='stake',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=11, validators=[competitions_app.models.check_positive], verbose_name='stake'),
+        ),
+        migrations.AddField(
+            model_name='stageclient',
+            name='status',
+            field=models.CharField(choices=[('open', 'open'), ('won', 'won'), ('lost', 'lost'), ('void', 'void')], default='open', max_length=20, verbose_name='status'),
+        ),
+        migrations.RunSQL(FILL_ODDS_SQL, migrations.RunSQL.noop),
+        migrations.AlterField(
+            model_name='walletentry',
+            name='kind',
+            field=models.CharField(choices=[('deposit', 'deposit'), ('bet', 'bet'), ('payout', 'payout'), ('refund', 'refund'), ('opening', 'opening balance')], max_length=20, verbose_name='kind'),
+        ),
+        migrations.AddIndex(
+            model_name='stageclient',
+            index=models.Index(condition=models.Q(('status', 'open')), fields=['stages'], include=('client', 'stake', 'odds'), name='stage_client_open_idx'),
+        ),
+    ]
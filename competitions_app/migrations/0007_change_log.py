@@ -0,0 +1,72 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:43
+
+import competitions_app.models
+from django.db import migrations, models
+
+LOGGED_TABLES = ('competition', 'sport', 'stage', 'competitions_sports')
+
+CREATE_FUNCTION_SQL = """
+    CREATE FUNCTION crud_api.log_changes() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO crud_api.change_log (txid, entity, object_id, deleted, created)
+        SELECT pg_current_xact_id()::text::bigint, TG_TABLE_NAME, id, TG_OP = 'DELETE', now()
+        FROM changed_rows;
+        RETURN NULL;
+    END;
+    $$
+"""
+
+CREATE_TRIGGERS_SQL = """
+    CREATE TRIGGER {table}_log_insert AFTER INSERT ON crud_api.{table}
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION crud_api.log_changes();
+    CREATE TRIGGER {table}_log_update AFTER UPDATE ON crud_api.{table}
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION crud_api.log_changes();
+    CREATE TRIGGER {table}_log_delete AFTER DELETE ON crud_api.{table}
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION crud_api.log_changes();
+    INSERT INTO crud_api.change_log (txid, entity, object_id, deleted, created)
+    SELECT pg_current_xact_id()::text::bigint, '{table}', id, false, now()
+    FROM crud_api.{table};
+"""
+
+DROP_TRIGGERS_SQL = """
+    DROP TRIGGER {table}_log_insert ON crud_api.{table};
+    DROP TRIGGER {table}_log_update ON crud_api.{table};
+    DROP TRIGGER {table}_log_delete ON crud_api.{table};
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competitions_app', '0006_bet_settlement'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLog',
+            fields=[
+                ('created', models.DateTimeField(blank=True, default=competitions_app.models.get_datetime, null=True, validators=[competitions_app.models.check_created], verbose_name='created')),
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('txid', models.BigIntegerField(verbose_name='transaction id')),
+                ('entity', models.CharField(max_length=20, verbose_name='entity')),
+                ('object_id', models.UUIDField(verbose_name='object id')),
+                ('deleted', models.BooleanField(default=False, verbose_name='deleted')),
+            ],
+            options={
+                'verbose_name': 'change log entry',
+                'verbose_name_plural': 'change log entries',
+                'db_table': '"crud_api"."change_log"',
+                'indexes': [models.Index(fields=['txid', 'id'], name='change_log_cursor_idx')],
+            },
+        ),
+        migrations.RunSQL(CREATE_FUNCTION_SQL, 'DROP FUNCTION crud_api.log_changes()'),
+        *(
+            migrations.RunSQL(
+                CREATE_TRIGGERS_SQL.format(table=table), DROP_TRIGGERS_SQL.format(table=table),
+            )
+            for table in LOGGED_TABLES
+        ),
+    ]
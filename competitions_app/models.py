@@ -1,21 +1,30 @@
 """Module with database models."""
-import random
 from datetime import datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
 from uuid import uuid4
 
 from django.conf.global_settings import AUTH_USER_MODEL
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
-from competitions_app import config
+from competitions_app import config, odds
 
 NAME = 'name'
+COMPETITION_START = 'competition_start'
+STAGE_DATE = 'stage_date'
 MAX_LENGTH_NAME = 100
 MAX_LENGTH_DESCRIPTION = 200
 MAX_LENGTH_PLACE = 150
 DECIMAL_PLACES = 2
 MAX_DIGITS = 5
+CENT = Decimal('0.01')
+ID = 'id'
+MAX_LENGTH_KIND = 20
+CLIENT = 'client'
+AMOUNT = 'amount'
+BALANCE = 'balance'
+LAST_ENTRY_ID = 'last_entry_id'
 
 
 def get_datetime():
@@ -30,13 +39,12 @@ def get_datetime():
 def get_random_bet_coefficient():
     """Return random number in diapason.
 
+    Coefficients are drawn in batches by the shared odds generator.
+
     Returns:
         float: bet coefficient.
     """
-    is_big_coef = random.uniform(0, 1) > config.POINT_SEVEN
-    if is_big_coef:
-        return round(random.uniform(3, config.TWELVE), 2)
-    return round(random.uniform(1, 3), 2)
+    return odds.default_generator.draw()
 
 
 def check_created(dt: datetime):
@@ -148,12 +156,146 @@ class ModifiedMixin(models.Model):
         validators=[check_modified],
     )
 
+    def save(self, *args, **kwargs) -> None:
+        """Bump the modification date on every save.
+
+        Args:
+            args: positional arguments of Model.save.
+            kwargs: keyword arguments of Model.save.
+        """
+        self.modified = get_datetime()  # noqa: WPS601
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'modified'}
+        super().save(*args, **kwargs)
+
     class Meta:
         """Modifying meta data class."""
 
         abstract = True
 
 
+class EntityCounter(models.Model):
+    """Maintained rows amount of a model.
+
+    Args:
+        models: Django models.
+    """
+
+    name = models.CharField(_(NAME), primary_key=True, max_length=MAX_LENGTH_NAME)
+    amount = models.BigIntegerField(_(AMOUNT), default=0)
+
+    class Meta:
+        """EntityCounter meta data class."""
+
+        db_table = '"crud_api"."entity_counter"'
+        verbose_name = _('entity counter')
+        verbose_name_plural = _('entity counters')
+
+    def __str__(self) -> str:
+        """Entity counter string representation.
+
+        Returns:
+            str: string object.
+        """
+        return f'{self.name} = {self.amount}'
+
+    @classmethod
+    def add(cls, model_class, delta) -> None:
+        """Shift counter of the model, the row is recounted if it is missing.
+
+        Args:
+            model_class: counted model class.
+            delta (int): rows amount difference.
+        """
+        name = model_class._meta.label_lower
+        if not cls.objects.filter(name=name).update(amount=models.F(AMOUNT) + delta):
+            cls.reconcile(model_class)
+
+    @classmethod
+    def reconcile(cls, model_class) -> int:
+        """Set counter of the model to the actual rows amount.
+
+        Args:
+            model_class: counted model class.
+
+        Returns:
+            int: actual rows amount.
+        """
+        rows_amount = model_class.objects.count()
+        cls.objects.update_or_create(
+            name=model_class._meta.label_lower,
+            defaults={AMOUNT: rows_amount},
+        )
+        return rows_amount
+
+    @classmethod
+    async def areconcile(cls, model_class) -> int:
+        """Set counter of the model to the actual rows amount asynchronously.
+
+        Args:
+            model_class: counted model class.
+
+        Returns:
+            int: actual rows amount.
+        """
+        rows_amount = await model_class.objects.acount()
+        await cls.objects.aupdate_or_create(
+            name=model_class._meta.label_lower,
+            defaults={AMOUNT: rows_amount},
+        )
+        return rows_amount
+
+
+class CountedQuerySet(models.QuerySet):
+    """QuerySet keeping EntityCounter in sync on bulk creation.
+
+    Deletion needs no hook: QuerySet.delete sends post_delete for every row
+    as soon as the model has receivers.
+    """
+
+    def bulk_create(self, instances, *args, **kwargs):
+        """Insert objects and shift the model counter in the same transaction.
+
+        With conflicts handling the inserted amount is unknown, so the counter is recounted.
+
+        Args:
+            instances (list): model instances.
+            args: positional arguments of QuerySet.bulk_create.
+            kwargs: keyword arguments of QuerySet.bulk_create.
+
+        Returns:
+            list: created objects.
+        """
+        with transaction.atomic(using=self.db):
+            created = super().bulk_create(instances, *args, **kwargs)
+            if kwargs.get('ignore_conflicts') or kwargs.get('update_conflicts'):
+                EntityCounter.reconcile(self.model)
+            else:
+                EntityCounter.add(self.model, len(created))
+        return created
+
+
+class StageQuerySet(CountedQuerySet):
+    """QuerySet pricing stages in batches on bulk creation."""
+
+    def bulk_create(self, instances, *args, odds_generator=None, **kwargs):
+        """Insert stages, priced with one vectorized draw if a generator is given.
+
+        Args:
+            instances (list): stages.
+            args: positional arguments of QuerySet.bulk_create.
+            odds_generator (OddsGenerator): generator overriding the coefficients.
+            kwargs: keyword arguments of QuerySet.bulk_create.
+
+        Returns:
+            list: created stages.
+        """
+        if odds_generator is not None:
+            instances = odds_generator.price(list(instances))
+        return super().bulk_create(instances, *args, **kwargs)
+
+
 class Competition(UUIDMixin, NameMixin, CreatedMixin, ModifiedMixin):
     """Competition database model.
 
@@ -184,6 +326,8 @@ class Competition(UUIDMixin, NameMixin, CreatedMixin, ModifiedMixin):
         through='CompetitionsSports',
     )
 
+    objects = CountedQuerySet.as_manager()
+
     @property
     def obj_name(self):
         """Competition abstract name property.
@@ -205,12 +349,18 @@ class Competition(UUIDMixin, NameMixin, CreatedMixin, ModifiedMixin):
         """Competition meta data class."""
 
         db_table = '"crud_api"."competition"'
-        ordering = ['competition_start', 'competition_end', NAME]
+        ordering = [COMPETITION_START, 'competition_end', NAME]
         verbose_name = _('Competition')
         verbose_name_plural = _('Competitions')
+        indexes = [
+            models.Index(
+                fields=[COMPETITION_START, 'competition_end', NAME, ID],
+                name='competition_ordering_idx',
+            ),
+        ]
         constraints = [
             models.CheckConstraint(
-                check=models.Q(competition_end__gt=models.F('competition_start')),
+                check=models.Q(competition_end__gt=models.F(COMPETITION_START)),
                 name='check_start_date',
                 violation_error_message=_('Competition cannot end before its start.'),
             ),
@@ -242,6 +392,8 @@ class Sport(UUIDMixin, NameMixin, CreatedMixin, ModifiedMixin):
         through='CompetitionsSports',
     )
 
+    objects = CountedQuerySet.as_manager()
+
     @property
     def obj_name(self):
         """Sport object name.
@@ -266,6 +418,7 @@ class Sport(UUIDMixin, NameMixin, CreatedMixin, ModifiedMixin):
         ordering = [NAME]
         verbose_name = _('Sport')
         verbose_name_plural = _('Sports')
+        indexes = [models.Index(fields=[NAME, ID], name='sport_ordering_idx')]
 
 
 class Stage(UUIDMixin, NameMixin, CreatedMixin, ModifiedMixin):
@@ -305,6 +458,8 @@ class Stage(UUIDMixin, NameMixin, CreatedMixin, ModifiedMixin):
         verbose_name=_('users'),
     )
 
+    objects = StageQuerySet.as_manager()
+
     def __str__(self) -> str:
         """Stage string representation.
 
@@ -333,9 +488,13 @@ class Stage(UUIDMixin, NameMixin, CreatedMixin, ModifiedMixin):
         """Stage meta data class."""
 
         db_table = '"crud_api"."stage"'
-        ordering = ['stage_date', NAME]
+        ordering = [STAGE_DATE, NAME]
         verbose_name = _('Stage')
         verbose_name_plural = _('Stages')
+        indexes = [
+            models.Index(fields=[STAGE_DATE, NAME, ID], name='stage_ordering_idx'),
+            models.Index(fields=['comp_sport', STAGE_DATE], name='stage_comp_sport_date_idx'),
+        ]
 
 
 class CompetitionsSports(UUIDMixin, CreatedMixin, ModifiedMixin):
@@ -369,6 +528,12 @@ class CompetitionsSports(UUIDMixin, CreatedMixin, ModifiedMixin):
         ordering = ['competition_id', 'sport_id']
         verbose_name = _('relationship competition sports')
         verbose_name_plural = _('relationships competition sports')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['competition_id', 'sport_id'],
+                name='unique_competition_sport',
+            ),
+        ]
 
     def __str__(self) -> str:
         """Competition sport string representation.
@@ -391,13 +556,6 @@ class Client(UUIDMixin, CreatedMixin, ModifiedMixin):
         Client: client instance.
     """
 
-    money = models.DecimalField(
-        verbose_name=_('money'),
-        decimal_places=2,
-        max_digits=config.ELEVEN,
-        default=0,
-        validators=[check_positive],
-    )
     user = models.OneToOneField(
         AUTH_USER_MODEL,
         unique=True,
@@ -414,6 +572,15 @@ class Client(UUIDMixin, CreatedMixin, ModifiedMixin):
         verbose_name = _('client')
         verbose_name_plural = _('clients')
 
+    @property
+    def money(self):
+        """Client balance from the wallet ledger.
+
+        Returns:
+            Decimal: current balance.
+        """
+        return WalletEntry.balance(self.pk)
+
     @property
     def username(self) -> str:
         """Client username property.
@@ -450,6 +617,31 @@ class Client(UUIDMixin, CreatedMixin, ModifiedMixin):
         return f'{self.username} ({self.first_name} {self.last_name})'
 
 
+class BetStatus(models.TextChoices):
+    """Bet settlement statuses.
+
+    Args:
+        TextChoices: Django text enumeration.
+    """
+
+    OPEN = 'open', _('open')
+    WON = 'won', _('won')
+    LOST = 'lost', _('lost')
+    VOID = 'void', _('void')
+
+
+class StageOutcome(models.TextChoices):
+    """Stage outcomes for the bettors, a void stage refunds the stakes.
+
+    Args:
+        TextChoices: Django text enumeration.
+    """
+
+    WON = BetStatus.WON.value, BetStatus.WON.label
+    LOST = BetStatus.LOST.value, BetStatus.LOST.label
+    VOID = BetStatus.VOID.value, BetStatus.VOID.label
+
+
 class StageClient(UUIDMixin, CreatedMixin, ModifiedMixin):
     """Stage Client database model.
 
@@ -463,7 +655,27 @@ class StageClient(UUIDMixin, CreatedMixin, ModifiedMixin):
     """
 
     stages = models.ForeignKey(Stage, verbose_name=_('stage'), on_delete=models.CASCADE)
-    client = models.ForeignKey(Client, verbose_name=_('client'), on_delete=models.CASCADE)
+    client = models.ForeignKey(Client, verbose_name=_(CLIENT), on_delete=models.CASCADE)
+    stake = models.DecimalField(
+        _('stake'),
+        decimal_places=DECIMAL_PLACES,
+        max_digits=config.ELEVEN,
+        default=0,
+        validators=[check_positive],
+    )
+    odds = models.DecimalField(
+        _('odds'),
+        decimal_places=DECIMAL_PLACES,
+        max_digits=MAX_DIGITS,
+        default=1,
+    )
+    status = models.CharField(
+        _('status'),
+        max_length=MAX_LENGTH_KIND,
+        choices=BetStatus.choices,
+        default=BetStatus.OPEN,
+    )
+    settled = models.DateTimeField(_('settled'), null=True, blank=True)
 
     class Meta:
         """StageClient meta data class."""
@@ -471,3 +683,208 @@ class StageClient(UUIDMixin, CreatedMixin, ModifiedMixin):
         db_table = '"crud_api"."stage_client"'
         verbose_name = _('relationship stage client')
         verbose_name_plural = _('relationships stage client')
+        constraints = [
+            models.UniqueConstraint(fields=['client', 'stages'], name='unique_stage_client'),
+        ]
+        indexes = [
+            models.Index(
+                fields=['stages'],
+                include=[CLIENT, 'stake', 'odds'],
+                condition=models.Q(status=BetStatus.OPEN),
+                name='stage_client_open_idx',
+            ),
+        ]
+
+    @property
+    def payout(self):
+        """Amount credited on settlement, zero for open and lost bets.
+
+        Returns:
+            Decimal: payout.
+        """
+        if self.status == BetStatus.WON:
+            return (self.stake * self.odds).quantize(CENT, ROUND_HALF_UP)
+        if self.status == BetStatus.VOID:
+            return self.stake
+        return 0
+
+
+class StageResult(CreatedMixin):
+    """Result of a stage bets are settled with.
+
+    Args:
+        CreatedMixin: model create mixin.
+    """
+
+    stage = models.OneToOneField(
+        Stage,
+        primary_key=True,
+        verbose_name=_('stage'),
+        on_delete=models.CASCADE,
+        related_name='result',
+    )
+    outcome = models.CharField(
+        _('outcome'),
+        max_length=MAX_LENGTH_KIND,
+        choices=StageOutcome.choices,
+    )
+
+    class Meta:
+        """StageResult meta data class."""
+
+        db_table = '"crud_api"."stage_result"'
+        verbose_name = _('stage result')
+        verbose_name_plural = _('stage results')
+
+    def __str__(self) -> str:
+        """Stage result string representation.
+
+        Returns:
+            str: string object.
+        """
+        return f'{self.stage_id} {self.outcome}'
+
+
+class EntryKind(models.TextChoices):
+    """Kinds of wallet ledger entries.
+
+    Args:
+        TextChoices: Django text enumeration.
+    """
+
+    DEPOSIT = 'deposit', _('deposit')
+    BET = 'bet', _('bet')
+    PAYOUT = 'payout', _('payout')
+    REFUND = 'refund', _('refund')
+    OPENING = 'opening', _('opening balance')
+
+
+class WalletEntry(CreatedMixin):
+    """Append-only wallet ledger entry.
+
+    The sequential primary key orders entries of a client, snapshots refer to it.
+
+    Args:
+        CreatedMixin: model create mixin.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    client = models.ForeignKey(Client, verbose_name=_(CLIENT), on_delete=models.CASCADE)
+    amount = models.DecimalField(
+        _(AMOUNT),
+        decimal_places=DECIMAL_PLACES,
+        max_digits=config.ELEVEN,
+    )
+    kind = models.CharField(_('kind'), max_length=MAX_LENGTH_KIND, choices=EntryKind.choices)
+
+    class Meta:
+        """WalletEntry meta data class."""
+
+        db_table = '"crud_api"."wallet_entry"'
+        verbose_name = _('wallet entry')
+        verbose_name_plural = _('wallet entries')
+        indexes = [
+            models.Index(fields=[CLIENT, ID], include=[AMOUNT], name='wallet_entry_client_idx'),
+        ]
+
+    def __str__(self) -> str:
+        """Wallet entry string representation.
+
+        Returns:
+            str: string object.
+        """
+        return f'{self.client_id} {self.kind} {self.amount}'
+
+    @classmethod
+    def balance(cls, client_id):
+        """Return client balance as the latest snapshot plus the tail of newer entries.
+
+        Args:
+            client_id: client primary key.
+
+        Returns:
+            Decimal: current balance.
+        """
+        latest = WalletSnapshot.objects.filter(client_id=client_id).order_by('-last_entry_id')
+        snapshot = latest.values(BALANCE, LAST_ENTRY_ID).first() or {
+            BALANCE: 0, LAST_ENTRY_ID: 0,
+        }
+        tail = cls.objects.filter(
+            client_id=client_id,
+            id__gt=snapshot[LAST_ENTRY_ID],
+        ).aggregate(total=models.Sum(AMOUNT, default=0))
+        return snapshot[BALANCE] + tail['total']
+
+
+class WalletSnapshot(UUIDMixin, CreatedMixin):
+    """Client balance rolled up to a ledger entry.
+
+    Args:
+        UUIDMixin: model uuid mixin.
+        CreatedMixin: model create mixin.
+    """
+
+    client = models.ForeignKey(Client, verbose_name=_(CLIENT), on_delete=models.CASCADE)
+    balance = models.DecimalField(
+        _(BALANCE),
+        decimal_places=DECIMAL_PLACES,
+        max_digits=config.ELEVEN,
+        validators=[check_positive],
+    )
+    last_entry_id = models.BigIntegerField(_('last entry id'))
+
+    class Meta:
+        """WalletSnapshot meta data class."""
+
+        db_table = '"crud_api"."wallet_snapshot"'
+        verbose_name = _('wallet snapshot')
+        verbose_name_plural = _('wallet snapshots')
+        indexes = [
+            models.Index(
+                fields=[CLIENT, '-last_entry_id'],
+                include=[BALANCE],
+                name='wallet_snapshot_client_idx',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Wallet snapshot string representation.
+
+        Returns:
+            str: string object.
+        """
+        return f'{self.client_id} {self.balance} @{self.last_entry_id}'
+
+
+class ChangeLog(CreatedMixin):
+    """Catalog change recorded by database triggers in the changing transaction.
+
+    Entries are ordered by the transaction id, so a feed reading only finished
+    transactions never skips an entry committed out of sequence order.
+
+    Args:
+        CreatedMixin: model create mixin.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    txid = models.BigIntegerField(_('transaction id'))
+    entity = models.CharField(_('entity'), max_length=MAX_LENGTH_KIND)
+    object_id = models.UUIDField(_('object id'))
+    deleted = models.BooleanField(_('deleted'), default=False)
+
+    class Meta:
+        """ChangeLog meta data class."""
+
+        db_table = '"crud_api"."change_log"'
+        verbose_name = _('change log entry')
+        verbose_name_plural = _('change log entries')
+        indexes = [models.Index(fields=['txid', ID], name='change_log_cursor_idx')]
+
+    def __str__(self) -> str:
+        """Change log entry string representation.
+
+        Returns:
+            str: string object.
+        """
+        operation = 'delete' if self.deleted else 'upsert'
+        return f'{self.entity} {self.object_id} {operation}'
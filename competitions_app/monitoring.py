@@ -0,0 +1,23 @@
+"""Module for monitoring endpoints of the REST API."""
+from django.db import connections
+from rest_framework import decorators
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from . import authentication
+from .db.base import get_pool_stats
+
+
+@decorators.api_view(['GET'])
+@decorators.authentication_classes([authentication.CachedTokenAuthentication])
+@decorators.permission_classes([IsAdminUser])
+def pool_stats_view(request):
+    """Return statistics of the connection pools of the serving process.
+
+    Args:
+        request: request.
+
+    Returns:
+        Response: pool statistics per database alias, empty for aliases without a pool.
+    """
+    return Response({alias: get_pool_stats(alias) for alias in connections})
@@ -0,0 +1,126 @@
+"""Module for vectorized bet coefficient generation.
+
+Coefficients are drawn for a whole batch of stages with one NumPy call. The
+generator is seedable, so a seeded catalog is priced the same on every run, and
+the distribution is pluggable.
+"""
+import threading
+from typing import Callable
+
+import numpy as np
+from django.conf import settings
+from django.db import connection, transaction
+
+from competitions_app import config
+
+LOW_ODDS = (1, 3)
+HIGH_ODDS = (3, config.TWELVE)
+BUFFER_SIZE = 1024
+
+REPRICE_SQL = """
+    UPDATE crud_api.stage AS stage
+    SET bet_coefficient = priced.coefficient, modified = now()
+    FROM unnest(%s::uuid[], %s::numeric[]) AS priced(id, coefficient)
+    WHERE stage.id = priced.id
+"""
+
+Distribution = Callable[[np.random.Generator, int], np.ndarray]
+
+
+def split_uniform(generator: np.random.Generator, size: int) -> np.ndarray:
+    """Draw 70% of coefficients uniformly from 1-3 and 30% from 3-12.
+
+    Args:
+        generator (Generator): NumPy random generator.
+        size (int): amount of coefficients.
+
+    Returns:
+        ndarray: coefficients.
+    """
+    is_high = generator.random(size) > config.POINT_SEVEN
+    low = generator.uniform(*LOW_ODDS, size)
+    high = generator.uniform(*HIGH_ODDS, size)
+    return np.where(is_high, high, low)
+
+
+class OddsGenerator:
+    """Seedable generator of bet coefficients rounded to cents."""
+
+    def __init__(self, seed=None, distribution: Distribution = split_uniform):
+        """Create the generator.
+
+        Args:
+            seed: seed of the NumPy generator, None for fresh entropy.
+            distribution (Distribution): function drawing coefficients.
+        """
+        self._generator = np.random.default_rng(seed)
+        self._distribution = distribution
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    def generate(self, size: int) -> list[float]:
+        """Draw a batch of coefficients with one vectorized call.
+
+        Args:
+            size (int): amount of coefficients.
+
+        Returns:
+            list[float]: coefficients.
+        """
+        with self._lock:
+            coefficients = self._distribution(self._generator, size)
+        return np.round(coefficients, config.DIGIT_PLACES).tolist()
+
+    def draw(self) -> float:
+        """Return a single coefficient from a buffer refilled in batches.
+
+        Returns:
+            float: coefficient.
+        """
+        if not self._buffer:
+            self._buffer.extend(self.generate(BUFFER_SIZE))
+        try:
+            return self._buffer.pop()
+        except IndexError:
+            return self.draw()
+
+    def price(self, stages) -> list:
+        """Set coefficients of the stages in place.
+
+        Args:
+            stages (list[Stage]): stages to price.
+
+        Returns:
+            list: the same stages.
+        """
+        for stage, coefficient in zip(stages, self.generate(len(stages))):
+            stage.bet_coefficient = coefficient
+        return stages
+
+
+default_generator = OddsGenerator(settings.ODDS_SEED)
+
+
+def reprice(stages, generator: OddsGenerator = default_generator) -> int:
+    """Draw new coefficients for the stages and store them with one UPDATE.
+
+    Placed bets keep the odds locked at placement time. The UPDATE sends no
+    signals, so cached stages and lists are invalidated in its transaction.
+
+    Args:
+        stages (QuerySet): stages to reprice.
+        generator (OddsGenerator): coefficients generator.
+
+    Returns:
+        int: amount of repriced stages.
+    """
+    from competitions_app import caching
+
+    priced = list(stages.only('pk', 'comp_sport'))
+    stage_ids = [str(stage.pk) for stage in priced]
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(REPRICE_SQL, [stage_ids, generator.generate(len(stage_ids))])
+            repriced = cursor.rowcount
+        caching.invalidate(caching.get_keys(stages.model, priced))
+    return repriced
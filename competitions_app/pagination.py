@@ -0,0 +1,428 @@
+"""Module for keyset (cursor) pagination."""
+import base64
+import json
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from competitions_app import config
+
+NEXT = 'next'
+PREVIOUS = 'prev'
+DESCENDING = '-'
+
+
+def encode_cursor(keys, direction) -> str:
+    """Encode keyset values into an opaque cursor.
+
+    Args:
+        keys (list): ordering values of the boundary row.
+        direction (str): NEXT or PREVIOUS.
+
+    Returns:
+        str: urlsafe cursor.
+    """
+    payload = json.dumps({'v': keys, 'd': direction}, cls=DjangoJSONEncoder)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Decode an opaque cursor.
+
+    Args:
+        cursor (str): cursor produced by encode_cursor.
+
+    Returns:
+        tuple[list, str] | None: ordering values and direction, None if cursor is invalid.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        return None
+    if not isinstance(payload, dict) or payload.get('d') not in {NEXT, PREVIOUS}:
+        return None
+    if not isinstance(payload.get('v'), list):
+        return None
+    return payload.get('v'), payload.get('d')
+
+
+def get_keyset_ordering(model_class) -> list[str]:
+    """Return model ordering with the primary key as a unique tiebreaker.
+
+    Foreign keys are ordered by their own column. Ordering by the relation name
+    would join the related table and sort by its ordering, which the keyset
+    condition comparing the column values does not follow.
+
+    Args:
+        model_class: desired model class.
+
+    Returns:
+        list[str]: ordering fields, e.g. ['stage_date', 'name', 'id'].
+    """
+    ordering = [_get_column_name(model_class, field) for field in model_class._meta.ordering]
+    pk_name = model_class._meta.pk.name
+    if pk_name not in {field.lstrip(DESCENDING) for field in ordering}:
+        ordering.append(pk_name)
+    return ordering
+
+
+def _get_column_name(model_class, field) -> str:
+    """Replace a foreign key in an ordering field with its column attribute.
+
+    Args:
+        model_class: desired model class.
+        field (str): ordering field, optionally descending.
+
+    Returns:
+        str: ordering field of the column, e.g. 'competition_id_id'.
+    """
+    name = field.lstrip(DESCENDING)
+    model_field = model_class._meta.get_field(name)
+    if model_field.many_to_one:
+        return field.replace(name, model_field.attname)
+    return field
+
+
+def _beyond(field, bound, ascending, nullable) -> models.Q:
+    """Build condition for rows strictly after bound in the scan direction.
+
+    NULLs are sorted last on ascending order, as PostgreSQL does.
+
+    Args:
+        field (str): field name.
+        bound: boundary value.
+        ascending (bool): whether scan goes in ascending order.
+        nullable (bool): whether field may hold NULL.
+
+    Returns:
+        models.Q: filter condition.
+    """
+    if bound is None:
+        if ascending:
+            return models.Q(pk__in=[])
+        return models.Q(**{f'{field}__isnull': False})
+    if not ascending:
+        return models.Q(**{f'{field}__lt': bound})
+    condition = models.Q(**{f'{field}__gt': bound})
+    if nullable:
+        condition |= models.Q(**{f'{field}__isnull': True})
+    return condition
+
+
+def _equal(field, bound) -> models.Q:
+    """Build equality condition treating NULL as a regular value.
+
+    Args:
+        field (str): field name.
+        bound: boundary value.
+
+    Returns:
+        models.Q: filter condition.
+    """
+    if bound is None:
+        return models.Q(**{f'{field}__isnull': True})
+    return models.Q(**{field: bound})
+
+
+def _leading_range(field, bound, ascending) -> models.Q:
+    """Build redundant range condition on the first ordering field.
+
+    The lexicographic OR chain is not usable as an index condition, this one is,
+    so the index scan starts right at the boundary row.
+
+    Args:
+        field (str): field name.
+        bound: boundary value, must not be NULL.
+        ascending (bool): whether scan goes in ascending order.
+
+    Returns:
+        models.Q: filter condition.
+    """
+    lookup = 'gte' if ascending else 'lte'
+    return models.Q(**{f'{field}__{lookup}': bound})
+
+
+def _lexicographic(ordering, keys, forward, nullable) -> models.Q:
+    """Build OR chain comparing rows with boundary field by field.
+
+    Args:
+        ordering (list[str]): ordering fields.
+        keys (list): boundary row values.
+        forward (bool): True to fetch rows after boundary, False to fetch rows before.
+        nullable (frozenset[str]): names of fields which may hold NULL.
+
+    Returns:
+        models.Q: filter condition.
+    """
+    conditions = []
+    for index, field in enumerate(ordering):
+        name = field.lstrip(DESCENDING)
+        ascending = field.startswith(DESCENDING) != forward
+        condition = _beyond(name, keys[index], ascending, name in nullable)
+        for prev_field, prev_key in zip(ordering[:index], keys):
+            condition &= _equal(prev_field.lstrip(DESCENDING), prev_key)
+        conditions.append(condition)
+    return reduce(or_, conditions)
+
+
+def keyset_filter(ordering, keys, forward, nullable=frozenset()) -> models.Q:
+    """Build keyset condition selecting rows beyond the boundary row.
+
+    Args:
+        ordering (list[str]): ordering fields.
+        keys (list): boundary row values.
+        forward (bool): True to fetch rows after boundary, False to fetch rows before.
+        nullable (frozenset[str]): names of fields which may hold NULL.
+
+    Returns:
+        models.Q: filter condition.
+    """
+    keyset = _lexicographic(ordering, keys, forward, nullable)
+    first = ordering[0].lstrip(DESCENDING)
+    if first in nullable or keys[0] is None:
+        return keyset
+    ascending = ordering[0].startswith(DESCENDING) != forward
+    return keyset & _leading_range(first, keys[0], ascending)
+
+
+def get_nullable_fields(model_class, ordering) -> frozenset[str]:
+    """Return ordering fields which may hold NULL.
+
+    Args:
+        model_class: desired model class.
+        ordering (list[str]): ordering fields.
+
+    Returns:
+        frozenset[str]: nullable field names.
+    """
+    names = (field.lstrip(DESCENDING) for field in ordering)
+    return frozenset(name for name in names if model_class._meta.get_field(name).null)
+
+
+def _reverse(ordering) -> list[str]:
+    """Reverse ordering directions.
+
+    Args:
+        ordering (list[str]): ordering fields.
+
+    Returns:
+        list[str]: reversed ordering, PostgreSQL puts NULLs first on descending order.
+    """
+    return [
+        field[1:] if field.startswith(DESCENDING) else f'{DESCENDING}{field}'
+        for field in ordering
+    ]
+
+
+class KeysetPage:
+    """Page of objects produced by KeysetPaginator."""
+
+    def __init__(self, object_list, ordering, has_next, has_previous):
+        """Initialize the page.
+
+        Args:
+            object_list (list): objects on the page.
+            ordering (list[str]): ordering used for cursors.
+            has_next (bool): whether there is a next page.
+            has_previous (bool): whether there is a previous page.
+        """
+        self.object_list = object_list
+        self.ordering = ordering
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    def __iter__(self):
+        """Iterate over page objects.
+
+        Returns:
+            iterator: page objects iterator.
+        """
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        """Return amount of objects on the page.
+
+        Returns:
+            int: objects count.
+        """
+        return len(self.object_list)
+
+    @property
+    def next_cursor(self):
+        """Cursor of the next page.
+
+        Returns:
+            str | None: cursor or None if there is no next page.
+        """
+        if not self.has_next:
+            return None
+        return encode_cursor(self._keys(self.object_list[-1]), NEXT)
+
+    @property
+    def previous_cursor(self):
+        """Cursor of the previous page.
+
+        Returns:
+            str | None: cursor or None if there is no previous page.
+        """
+        if not self.has_previous or not self.object_list:
+            return None
+        return encode_cursor(self._keys(self.object_list[0]), PREVIOUS)
+
+    def _keys(self, instance) -> list:
+        return [instance.serializable_value(field.lstrip(DESCENDING)) for field in self.ordering]
+
+
+class KeysetPaginator:
+    """Paginator seeking by ordering values instead of OFFSET.
+
+    Every page costs a single query of page size plus one rows, no COUNT is issued.
+    """
+
+    def __init__(self, queryset, per_page, ordering=None):
+        """Initialize the paginator.
+
+        Args:
+            queryset (QuerySet): objects to paginate.
+            per_page (int): objects per page.
+            ordering (list[str], optional): unique ordering. Defaults to model ordering and pk.
+        """
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = ordering or get_keyset_ordering(queryset.model)
+        self.nullable = get_nullable_fields(queryset.model, self.ordering)
+
+    def get_page(self, cursor=None) -> KeysetPage:
+        """Return page located by the cursor.
+
+        Invalid cursors are treated as the first page.
+
+        Args:
+            cursor (str, optional): cursor from a previous page.
+
+        Returns:
+            KeysetPage: requested page.
+        """
+        queryset, forward, has_previous = self._plan(cursor)
+        try:
+            rows = list(queryset)
+        except (ValidationError, ValueError, TypeError):
+            queryset, forward, has_previous = self._plan(None)
+            rows = list(queryset)
+        return self._build(rows, forward, has_previous)
+
+    async def aget_page(self, cursor=None) -> KeysetPage:
+        """Return page located by the cursor, reading rows asynchronously.
+
+        Invalid cursors are treated as the first page.
+
+        Args:
+            cursor (str, optional): cursor from a previous page.
+
+        Returns:
+            KeysetPage: requested page.
+        """
+        queryset, forward, has_previous = self._plan(cursor)
+        try:
+            rows = [row async for row in queryset]
+        except (ValidationError, ValueError, TypeError):
+            queryset, forward, has_previous = self._plan(None)
+            rows = [row async for row in queryset]
+        return self._build(rows, forward, has_previous)
+
+    def _plan(self, cursor) -> tuple:
+        decoded = decode_cursor(cursor) if cursor else None
+        if decoded is None or len(decoded[0]) != len(self.ordering):
+            return self.queryset.order_by(*self.ordering)[:self.per_page + 1], True, False
+        keys, direction = decoded
+        forward = direction == NEXT
+        try:
+            queryset = self.queryset.filter(
+                keyset_filter(self.ordering, keys, forward, self.nullable),
+            )
+        except (ValidationError, ValueError, TypeError):
+            return self._plan(None)
+        if forward:
+            return queryset.order_by(*self.ordering)[:self.per_page + 1], True, True
+        return queryset.order_by(*_reverse(self.ordering))[:self.per_page + 1], False, None
+
+    def _build(self, rows, forward, has_previous) -> KeysetPage:
+        if forward:
+            return KeysetPage(
+                rows[:self.per_page],
+                self.ordering,
+                has_next=len(rows) > self.per_page,
+                has_previous=has_previous,
+            )
+        has_previous = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        rows.reverse()
+        return KeysetPage(rows, self.ordering, has_next=True, has_previous=has_previous)
+
+
+class KeysetPagination(BasePagination):
+    """REST API pagination built on KeysetPaginator.
+
+    Page size is read from ``?page_size=`` and capped by API_MAX_PAGE_SIZE setting,
+    ``?pagination=off`` returns the whole list.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return objects of the requested page.
+
+        Args:
+            queryset (QuerySet): objects to paginate.
+            request (Request): API request.
+            view: API view.
+
+        Returns:
+            list | None: page objects, None if pagination is turned off.
+        """
+        if request.query_params.get(config.PAGINATION) == config.OFF:
+            return None
+        self.request = request
+        paginator = KeysetPaginator(queryset, self.get_page_size(request))
+        self.page = paginator.get_page(request.query_params.get(config.CURSOR))
+        return list(self.page)
+
+    def get_page_size(self, request) -> int:
+        """Read page size, fall back to the default one if it is not a number.
+
+        Args:
+            request (Request): API request.
+
+        Returns:
+            int: page size between one and the maximal one.
+        """
+        try:
+            page_size = int(request.query_params.get(config.PAGE_SIZE, settings.API_PAGE_SIZE))
+        except ValueError:
+            page_size = settings.API_PAGE_SIZE
+        return min(max(page_size, 1), settings.API_MAX_PAGE_SIZE)
+
+    def get_paginated_response(self, serialized) -> Response:
+        """Wrap page data with links to the neighbour pages.
+
+        Args:
+            serialized (list): serialized page objects.
+
+        Returns:
+            Response: paginated response.
+        """
+        return Response({
+            NEXT: self._link(self.page.next_cursor),
+            'previous': self._link(self.page.previous_cursor),
+            'results': serialized,
+        })
+
+    def _link(self, cursor):
+        if cursor is None:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), config.CURSOR, cursor)
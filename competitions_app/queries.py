@@ -0,0 +1,70 @@
+"""Module for read queries used by page views."""
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+
+from competitions_app import config
+
+from .models import Stage
+from .pagination import get_keyset_ordering
+
+
+def get_upcoming_queryset(sport, limit=config.SPORT_STAGES_LIMIT):
+    """Build the joined query of upcoming stages of the sport.
+
+    The stages are cached, so they are read from the primary: a lagging replica
+    would put rows older than the cache generation under it.
+
+    Args:
+        sport (Sport): desired sport.
+        limit (int): maximum amount of stages.
+
+    Returns:
+        QuerySet: stages with their competitions in date order.
+    """
+    return Stage.objects.using(DEFAULT_DB_ALIAS).filter(
+        comp_sport__sport_id=sport,
+        stage_date__gte=timezone.localdate(),
+    ).select_related('comp_sport__competition_id').order_by(
+        *get_keyset_ordering(Stage),
+    )[:limit]
+
+
+def group_by_competition(stages) -> list[tuple]:
+    """Group stages by competition keeping their order.
+
+    Args:
+        stages (list[Stage]): stages with their competitions.
+
+    Returns:
+        list[tuple[Competition, list[Stage]]]: stages grouped by competition.
+    """
+    groups = {}
+    for stage in stages:
+        groups.setdefault(stage.comp_sport.competition_id, []).append(stage)
+    return list(groups.items())
+
+
+def get_upcoming_stages(sport, limit=config.SPORT_STAGES_LIMIT):
+    """Fetch upcoming stages of the sport with one joined query.
+
+    Args:
+        sport (Sport): desired sport.
+        limit (int): maximum amount of stages.
+
+    Returns:
+        list[tuple[Competition, list[Stage]]]: stages grouped by competition in date order.
+    """
+    return group_by_competition(get_upcoming_queryset(sport, limit))
+
+
+async def aget_upcoming_stages(sport, limit=config.SPORT_STAGES_LIMIT):
+    """Fetch upcoming stages of the sport with one joined query asynchronously.
+
+    Args:
+        sport (Sport): desired sport.
+        limit (int): maximum amount of stages.
+
+    Returns:
+        list[tuple[Competition, list[Stage]]]: stages grouped by competition in date order.
+    """
+    return group_by_competition([stage async for stage in get_upcoming_queryset(sport, limit)])
@@ -0,0 +1,68 @@
+"""Module for fast API renderers.
+
+orjson replaces the stdlib json encoder behind ``application/json``, MessagePack
+is served for ``application/msgpack``. Values the libraries do not know natively,
+like Decimal or lazy translations, fall back to the encoder of DRF, so both render
+the same values as JSONRenderer.
+"""
+import msgpack
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+encode_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer encoding with orjson.
+
+    Args:
+        JSONRenderer: DRF JSON renderer, its media type and format.
+    """
+
+    def render(self, serialized, accepted_media_type=None, renderer_context=None) -> bytes:
+        """Render serialized data into JSON, compact unless the client asks for indentation.
+
+        Args:
+            serialized: serialized data.
+            accepted_media_type (str): negotiated media type.
+            renderer_context (dict): view, request and response.
+
+        Returns:
+            bytes: JSON document.
+        """
+        if serialized is None:
+            return b''
+        renderer_context = renderer_context or {}
+        option = orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(serialized, default=encode_default, option=option)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """MessagePack renderer.
+
+    Args:
+        BaseRenderer: DRF base renderer.
+    """
+
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, serialized, accepted_media_type=None, renderer_context=None) -> bytes:
+        """Render serialized data into MessagePack.
+
+        Args:
+            serialized: serialized data.
+            accepted_media_type (str): negotiated media type.
+            renderer_context (dict): view, request and response.
+
+        Returns:
+            bytes: MessagePack document.
+        """
+        if serialized is None:
+            return b''
+        return msgpack.packb(serialized, default=encode_default, use_bin_type=True)
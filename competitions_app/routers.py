@@ -0,0 +1,118 @@
+"""Module for routing reads of requests to database replicas.
+
+Writes always go to the primary. Reads of a request go to one replica picked for
+the whole request, so they never jump between replicas of different lag. Reads
+stay on the primary when:
+
+- the request is not a GET, HEAD or OPTIONS one, e.g. an update validating and
+  saving back the row it has read;
+- the request follows a write of the same client within REPLICA_STICKY_SECONDS,
+  ReplicaMiddleware remembers the write with a short lived cookie;
+- the request itself has written, e.g. a view reading its own bet;
+- they run inside a transaction of the primary, e.g. before select_for_update;
+- they read sessions, users or tokens, which decide who the client is;
+- they run outside of a request, e.g. in management commands.
+
+Related objects are read from the database their instance was read from, so
+prefetches of an object loaded from the primary stay on the primary.
+"""
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PRIMARY_APP_LABELS = frozenset(('auth', 'authtoken', 'sessions'))
+
+read_alias = ContextVar('read_alias', default=DEFAULT_DB_ALIAS)
+has_written = ContextVar('has_written', default=False)
+
+
+def start_request(pinned) -> None:
+    """Pick the database for reads of a new request.
+
+    Args:
+        pinned (bool): whether the request writes or its client has written recently.
+    """
+    replicas = settings.DATABASE_REPLICAS
+    if replicas and not pinned:
+        read_alias.set(random.choice(replicas))  # noqa: S311
+    else:
+        read_alias.set(DEFAULT_DB_ALIAS)
+    has_written.set(False)
+
+
+def finish_request() -> bool:
+    """Forget the request state.
+
+    Returns:
+        bool: whether the request has written.
+    """
+    written = has_written.get()
+    read_alias.set(DEFAULT_DB_ALIAS)
+    has_written.set(False)
+    return written
+
+
+class ReplicaRouter:
+    """Router sending reads of requests to replicas and everything else to the primary."""
+
+    def db_for_read(self, model, **hints) -> str:
+        """Choose the database to read the model from.
+
+        Args:
+            model: model class.
+            hints: routing hints.
+
+        Returns:
+            str: database alias.
+        """
+        if has_written.get() or model._meta.app_label in PRIMARY_APP_LABELS:
+            return DEFAULT_DB_ALIAS
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return read_alias.get()
+
+    def db_for_write(self, model, **hints) -> str:
+        """Choose the primary and remember the request has written.
+
+        Args:
+            model: model class.
+            hints: routing hints.
+
+        Returns:
+            str: database alias.
+        """
+        has_written.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        """Allow relations between objects of the primary and its replicas.
+
+        Args:
+            obj1: model instance.
+            obj2: model instance.
+            hints: routing hints.
+
+        Returns:
+            bool: whether both objects come from the same data.
+        """
+        aliases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        return obj1._state.db in aliases and obj2._state.db in aliases
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> bool:
+        """Migrate the primary only, replicas follow it.
+
+        Args:
+            db (str): database alias.
+            app_label (str): application label.
+            model_name (str): model name.
+            hints: routing hints.
+
+        Returns:
+            bool: whether the database is the primary.
+        """
+        return db == DEFAULT_DB_ALIAS
@@ -1,18 +1,319 @@
-"""Module for API serializers."""
-from rest_framework.serializers import HyperlinkedModelSerializer
+"""Module for API serializers.
 
-from competitions_app import config
+Hyperlinked serializers are the default representation, they carry the primary
+key next to the URL, so ``?fields=id`` works in both modes. Flat serializers
+return primary keys instead of URLs and list their fields explicitly, they are
+chosen with ``?mode=flat``. Every serializer declares the related objects it reads, so
+the viewset loads them with a fixed amount of queries, trimmed to ``?fields=``
+and extended by ``?expand=`` of reads. Primary key relations of flat serializers
+are looked up in objects prefetched for a whole bulk request.
+"""
+from types import MappingProxyType
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Prefetch
+from django.db.models.constants import LOOKUP_SEP as LOOKUP_SEPARATOR
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+from rest_framework.validators import UniqueTogetherValidator
+
+from competitions_app import config, fieldsets
 
 from .models import Competition, CompetitionsSports, Sport, Stage
 
+ID = 'id'
+TIMESTAMP_FIELDS = ('created', 'modified')
+PREFETCHED = 'prefetched'
+COMP_SPORT = 'comp_sport'
+COMPETITION_BOUNDS = 'comp_sport__competition_id'
+COMPETITION_START = 'competition_start'
+COMPETITION_END = 'competition_end'
+
+
+def only_pk(model_class):
+    """Queryset loading primary keys of prefetched objects only.
+
+    Args:
+        model_class: prefetched model class.
+
+    Returns:
+        QuerySet: primary keys queryset.
+    """
+    return model_class.objects.only('pk')
+
+
+def to_pk(model_class, pk_value):
+    """Convert a primary key of the payload.
+
+    Args:
+        model_class: model class of the primary key.
+        pk_value: primary key of the payload.
+
+    Returns:
+        primary key or None if it is malformed.
+    """
+    try:
+        return model_class._meta.pk.to_python(pk_value)
+    except (DjangoValidationError, TypeError, ValueError):
+        return None
+
+
+class PrefetchedRelatedField(serializers.PrimaryKeyRelatedField):
+    """Primary key relation read from objects prefetched for the whole request.
+
+    Args:
+        PrimaryKeyRelatedField: primary key relation field.
+    """
+
+    def to_internal_value(self, pk_value):
+        """Find the related object without a query if the batch was prefetched.
+
+        Args:
+            pk_value: primary key of the payload.
+
+        Returns:
+            related object.
+        """
+        prefetched = self.context.get(PREFETCHED, {}).get(self.field_name)
+        if prefetched is None:
+            return super().to_internal_value(pk_value)
+        related = prefetched.get(to_pk(self.get_queryset().model, pk_value))
+        if related is None:
+            self.fail('does_not_exist', pk_value=pk_value)
+        return related
+
+
+def get_lookups(lookups, kept, expanded) -> list:
+    """Filter related lookups of a serializer by the fieldset.
+
+    Args:
+        lookups (tuple): lookup strings or Prefetch objects.
+        kept (tuple[str, ...]): serialized fields.
+        expanded (set[str]): expanded lookups, their fields load on their own.
+
+    Returns:
+        list: lookups of serialized and not expanded fields.
+    """
+    skipped = {lookup.split(LOOKUP_SEPARATOR)[0] for lookup in expanded}
+    filtered = []
+    for lookup in lookups:
+        name = getattr(lookup, 'prefetch_to', lookup).split(LOOKUP_SEPARATOR)[0]
+        if name in kept and name not in skipped:
+            filtered.append(lookup)
+    return filtered
+
+
+def get_nested_lookups(serializer_class, prefix, following) -> list:
+    """Prefix related lookups of a nested serializer with its path.
+
+    Args:
+        serializer_class: nested serializer class.
+        prefix (list[str]): relations leading to the nested serializer.
+        following (list[str]): relations expanded further down the path.
+
+    Returns:
+        list: prefetches of the nested related objects.
+    """
+    nested_lookups = []
+    for lookup in (*serializer_class.select_related, *serializer_class.prefetch_related):
+        through = getattr(lookup, 'prefetch_through', lookup)
+        if following and through.split(LOOKUP_SEPARATOR)[0] == following[0]:
+            continue
+        nested_lookups.append(Prefetch(
+            LOOKUP_SEPARATOR.join((*prefix, through)),
+            queryset=getattr(lookup, 'queryset', None),
+        ))
+    return nested_lookups
+
+
+def dedupe_nested(nested_lookups, expanded) -> list:
+    """Drop nested prefetches repeated or replaced by expansions.
+
+    Args:
+        nested_lookups: prefetches of nested related objects.
+        expanded (set[str]): expanded lookups.
+
+    Returns:
+        list: prefetches loading each path once.
+    """
+    unique = {}
+    for nested in nested_lookups:
+        path = nested.prefetch_to
+        replaced = any(
+            lookup == path or lookup.startswith(f'{path}{LOOKUP_SEPARATOR}')
+            for lookup in expanded
+        )
+        if not replaced:
+            unique.setdefault(path, nested)
+    return list(unique.values())
+
+
+class QueryPlanMixin:
+    """Serializer mixin applying its related objects loading to a queryset.
+
+    Reads trim the fields and expand relations requested by the query, nested
+    serializers get their expansion paths explicitly and keep all fields.
+    """
+
+    select_related = ()
+    prefetch_related = ()
+    write_related = ()
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the serializer with the fieldset of the request.
+
+        Args:
+            args: positional arguments of the serializer.
+            kwargs: keyword arguments of the serializer, expand of nested ones.
+        """
+        expand = kwargs.pop(fieldsets.EXPAND, None)
+        super().__init__(*args, **kwargs)
+        if expand is None:
+            request = self.context.get('request')
+            fields = fieldsets.get_names(request, fieldsets.FIELDS)
+            for trimmed in set(self.fields) - set(fields or self.fields):
+                self.fields.pop(trimmed)
+            expand = fieldsets.get_names(request, fieldsets.EXPAND)
+        paths = fieldsets.split_paths(expand)
+        for name in paths.keys() & self.fields.keys():
+            relation = fieldsets.get_relation(self.Meta.model, name)
+            self.fields[name] = self.get_nested_class(relation.related_model)(
+                many=relation.many_to_many or relation.one_to_many,
+                read_only=True,
+                expand=tuple(paths[name]),
+            )
+
+    @classmethod
+    def list_field_names(cls) -> tuple[str, ...]:
+        """Names of all fields of the serializer.
+
+        Returns:
+            tuple[str, ...]: field names.
+        """
+        return tuple(cls(expand=()).fields)
+
+    @classmethod
+    def get_nested_class(cls, model_class):
+        """Find the serializer of an expanded relation in the same representation.
+
+        Args:
+            model_class: related model class.
+
+        Returns:
+            serializer class or None if the model has no serializer.
+        """
+        if issubclass(cls, serializers.HyperlinkedModelSerializer):
+            return HYPERLINKED_SERIALIZERS.get(model_class)
+        return FLAT_SERIALIZERS.get(model_class)
+
+    @classmethod
+    def resolve_path(cls, path) -> tuple[str, bool, list]:
+        """Check an expansion path relation by relation.
+
+        Args:
+            path (str): dotted path of relations.
+
+        Raises:
+            ValidationError: if the path does not follow serialized relations.
+
+        Returns:
+            tuple[str, bool, list]: lookup, whether every relation is single-valued
+            and related lookups of the nested serializers.
+        """
+        serializer_class, single_valued, nested_lookups = cls, True, []
+        names = path.split(fieldsets.PATH_SEPARATOR)
+        for depth, name in enumerate(names, 1):
+            relation = fieldsets.get_relation(serializer_class.Meta.model, name)
+            nested_class = relation and serializer_class.get_nested_class(relation.related_model)
+            if nested_class is None or name not in serializer_class.list_field_names():
+                raise serializers.ValidationError({fieldsets.EXPAND: [f'Not expandable: {path}']})
+            single_valued = single_valued and (relation.many_to_one or relation.one_to_one)
+            serializer_class = nested_class
+            nested_lookups.extend(get_nested_lookups(nested_class, names[:depth], names[depth:]))
+        return LOOKUP_SEPARATOR.join(names), single_valued, nested_lookups
+
+    @classmethod
+    def get_expansion(cls, request, kept) -> tuple[list, list]:
+        """Collect related lookups of the kept fields and the expanded paths.
+
+        Args:
+            request: request with the fieldset, if any.
+            kept (tuple[str, ...]): serialized fields.
+
+        Returns:
+            tuple[list, list]: select_related and prefetch_related lookups.
+        """
+        expanded = [
+            cls.resolve_path(path)
+            for path in fieldsets.get_names(request, fieldsets.EXPAND)
+            if path.split(fieldsets.PATH_SEPARATOR)[0] in kept
+        ]
+        lookups = {path_lookups[0] for path_lookups in expanded}
+        select, prefetch = (
+            get_lookups(cls.select_related, kept, lookups),
+            get_lookups(cls.prefetch_related, kept, lookups),
+        )
+        nested = []
+        for lookup, single_valued, nested_lookups in expanded:
+            (select if single_valued else prefetch).append(lookup)
+            nested.extend(nested_lookups)
+        return select, [*prefetch, *dedupe_nested(nested, lookups)]
+
+    @classmethod
+    def plan(cls, queryset, request=None):
+        """Load related objects the serializer reads along with the queryset.
+
+        Args:
+            queryset (QuerySet): serialized queryset.
+            request: request with the fieldset, if any.
 
-class CompetitionSerializer(HyperlinkedModelSerializer):
+        Returns:
+            QuerySet: queryset with related objects loading.
+        """
+        fields = fieldsets.get_names(request, fieldsets.FIELDS)
+        fieldsets.check_names(fields, cls.list_field_names(), fieldsets.FIELDS)
+        select, prefetch = cls.get_expansion(request, fields or cls.list_field_names())
+        queryset = queryset.select_related(*select).prefetch_related(*prefetch)
+        if fields:
+            queryset = queryset.only(*fieldsets.get_columns(queryset.model, fields))
+        return queryset
+
+    @classmethod
+    def prefetch(cls, payload) -> dict:
+        """Load objects referred by primary key relations of a batch at once.
+
+        Args:
+            payload (list): payload records.
+
+        Returns:
+            dict: related objects by primary key for every relation field.
+        """
+        prefetched = {}
+        for name, field in cls().fields.items():
+            if not isinstance(field, PrefetchedRelatedField) or field.read_only:
+                continue
+            model_class = field.queryset.model
+            keys = {
+                to_pk(model_class, record.get(name))
+                for record in payload
+                if isinstance(record, dict)
+            }
+            keys.discard(None)
+            prefetched[name] = field.queryset.in_bulk(keys)
+        return prefetched
+
+
+class CompetitionSerializer(QueryPlanMixin, serializers.HyperlinkedModelSerializer):
     """Competition serializer.
 
     Args:
+        QueryPlanMixin: related objects loading.
         HyperlinkedModelSerializer: link to the model.
     """
 
+    id = serializers.UUIDField(read_only=True)
+    prefetch_related = (Prefetch('sports', queryset=only_pk(Sport)),)
+
     class Meta:
         """Meta data for competition serializer."""
 
@@ -20,13 +321,17 @@ class CompetitionSerializer(HyperlinkedModelSerializer):
         fields = config.ALL
 
 
-class SportSerializer(HyperlinkedModelSerializer):
+class SportSerializer(QueryPlanMixin, serializers.HyperlinkedModelSerializer):
     """Sport serializer.
 
     Args:
+        QueryPlanMixin: related objects loading.
         HyperlinkedModelSerializer: link to the model.
     """
 
+    id = serializers.UUIDField(read_only=True)
+    prefetch_related = (Prefetch('competitions', queryset=only_pk(Competition)),)
+
     class Meta:
         """Meta data for sport serializer."""
 
@@ -34,13 +339,17 @@ class SportSerializer(HyperlinkedModelSerializer):
         fields = config.ALL
 
 
-class StageSerializer(HyperlinkedModelSerializer):
+class StageSerializer(QueryPlanMixin, serializers.HyperlinkedModelSerializer):
     """Stage serializer.
 
     Args:
+        QueryPlanMixin: related objects loading.
         HyperlinkedModelSerializer: link to the model.
     """
 
+    id = serializers.UUIDField(read_only=True)
+    prefetch_related = ('clients',)
+
     class Meta:
         """Meta data for stage serializer."""
 
@@ -48,15 +357,172 @@ class StageSerializer(HyperlinkedModelSerializer):
         fields = config.ALL
 
 
-class CompetitionsSportsSerializer(HyperlinkedModelSerializer):
+class CompetitionsSportsSerializer(QueryPlanMixin, serializers.HyperlinkedModelSerializer):
     """Competition Sports serializer.
 
     Args:
+        QueryPlanMixin: related objects loading.
         HyperlinkedModelSerializer: link to the model.
     """
 
+    id = serializers.UUIDField(read_only=True)
+
     class Meta:
         """Meta data for competitions sports serializer."""
 
         model = CompetitionsSports
         fields = config.ALL
+
+
+class FlatCompetitionSerializer(QueryPlanMixin, serializers.ModelSerializer):
+    """Competition serializer with primary keys of sports.
+
+    Args:
+        QueryPlanMixin: related objects loading.
+        ModelSerializer: model serializer.
+    """
+
+    serializer_related_field = PrefetchedRelatedField
+    prefetch_related = CompetitionSerializer.prefetch_related
+
+    def validate(self, attrs):
+        """Check the competition ends after its start like the check_start_date constraint.
+
+        Args:
+            attrs (dict): validated fields.
+
+        Raises:
+            ValidationError: if the competition ends before or at its start.
+
+        Returns:
+            dict: validated fields.
+        """
+        start = attrs.get(COMPETITION_START, getattr(self.instance, COMPETITION_START, None))
+        end = attrs.get(COMPETITION_END, getattr(self.instance, COMPETITION_END, None))
+        if start is not None and end is not None and end <= start:
+            raise serializers.ValidationError(_('Competition cannot end before its start.'))
+        return attrs
+
+    class Meta:
+        """Meta data for flat competition serializer."""
+
+        model = Competition
+        fields = (
+            ID, 'name', COMPETITION_START, COMPETITION_END, 'sports', *TIMESTAMP_FIELDS,
+        )
+
+
+class FlatSportSerializer(QueryPlanMixin, serializers.ModelSerializer):
+    """Sport serializer with primary keys of competitions.
+
+    Args:
+        QueryPlanMixin: related objects loading.
+        ModelSerializer: model serializer.
+    """
+
+    serializer_related_field = PrefetchedRelatedField
+    prefetch_related = SportSerializer.prefetch_related
+
+    class Meta:
+        """Meta data for flat sport serializer."""
+
+        model = Sport
+        fields = (ID, 'name', 'description', 'competitions', *TIMESTAMP_FIELDS)
+
+
+class FlatStageSerializer(QueryPlanMixin, serializers.ModelSerializer):
+    """Stage serializer with the competition sport primary key, bettors are left out.
+
+    Args:
+        QueryPlanMixin: related objects loading.
+        ModelSerializer: model serializer.
+    """
+
+    write_related = (COMPETITION_BOUNDS,)
+    comp_sport = PrefetchedRelatedField(
+        queryset=CompetitionsSports.objects.select_related('competition_id'),
+        required=False,
+        allow_null=True,
+    )
+
+    def validate(self, attrs):
+        """Check the stage date against the competition bounds like Stage.clean.
+
+        Args:
+            attrs (dict): validated fields.
+
+        Raises:
+            ValidationError: if the stage is held out of the competition.
+
+        Returns:
+            dict: validated fields.
+        """
+        comp_sport = attrs.get(COMP_SPORT, getattr(self.instance, COMP_SPORT, None))
+        stage_date = attrs.get('stage_date', getattr(self.instance, 'stage_date', None))
+        competition = comp_sport and comp_sport.competition_id
+        if competition is None or stage_date is None:
+            return attrs
+        if stage_date < competition.competition_start:
+            raise serializers.ValidationError(
+                _('Stage cannot be held before the competition start.'),
+            )
+        if stage_date > competition.competition_end:
+            raise serializers.ValidationError(
+                _('Stage cannot be held after the competition end.'),
+            )
+        return attrs
+
+    class Meta:
+        """Meta data for flat stage serializer."""
+
+        model = Stage
+        fields = (
+            ID, 'name', 'stage_date', 'place', 'bet_coefficient', 'comp_sport',
+            *TIMESTAMP_FIELDS,
+        )
+
+
+class FlatCompetitionsSportsSerializer(QueryPlanMixin, serializers.ModelSerializer):
+    """Competition Sports serializer with primary keys.
+
+    Args:
+        QueryPlanMixin: related objects loading.
+        ModelSerializer: model serializer.
+    """
+
+    serializer_related_field = PrefetchedRelatedField
+
+    def get_validators(self):
+        """Leave the link uniqueness of bulk writes to one query for the whole batch.
+
+        Returns:
+            list: validators, without the per record unique query in bulk writes.
+        """
+        validators = super().get_validators()
+        if PREFETCHED not in self.context:
+            return validators
+        return [
+            validator
+            for validator in validators
+            if not isinstance(validator, UniqueTogetherValidator)
+        ]
+
+    class Meta:
+        """Meta data for flat competitions sports serializer."""
+
+        model = CompetitionsSports
+        fields = (ID, 'competition_id', 'sport_id', *TIMESTAMP_FIELDS)
+
+
+HYPERLINKED_SERIALIZERS = MappingProxyType({
+    Competition: CompetitionSerializer,
+    Sport: SportSerializer,
+    Stage: StageSerializer,
+    CompetitionsSports: CompetitionsSportsSerializer,
+})
+FLAT_SERIALIZERS = MappingProxyType({
+    Competition: FlatCompetitionSerializer,
+    Sport: FlatSportSerializer,
+    Stage: FlatStageSerializer,
+    CompetitionsSports: FlatCompetitionsSportsSerializer,
+})
@@ -1,9 +1,10 @@
 """Module for url routers."""
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from . import views
+from . import async_views, changes, export, monitoring, views
 
 router = DefaultRouter()
 router.register('competitions', views.competition_viewset)
@@ -11,7 +12,7 @@ router.register('sports', views.sport_viewset)
 router.register('stages', views.stage_viewset)
 router.register('competitionssports', views.competitionssports_viewset)
 
-urlpatterns = [
+sync_read_patterns = [
     path('', views.home_page, name='homepage'),
     path(
         'competitions/',
@@ -23,8 +24,24 @@ urlpatterns = [
     path('sport/', views.sport_view, name='sport'),
     path('stages/', login_required(views.stage_list_view.as_view()), name='stages'),
     path('stage/', views.stage_view, name='stage'),
+]
+
+async_read_patterns = [
+    path('', async_views.home_page, name='homepage'),
+    path('competitions/', async_views.competition_list_view, name='competitions'),
+    path('competition/', async_views.competition_view, name='competition'),
+    path('sports/', async_views.sport_list_view, name='sports'),
+    path('sport/', async_views.sport_view, name='sport'),
+    path('stages/', async_views.stage_list_view, name='stages'),
+    path('stage/', async_views.stage_view, name='stage'),
+]
+
+other_patterns = [
     path('register/', views.register, name='register'),
     path('accounts/', include('django.contrib.auth.urls')),
+    path('api/changes/', changes.changes_view, name='changes'),
+    path('api/pool/', monitoring.pool_stats_view, name='pool'),
+    path('api/export/<str:name>.<str:file_format>', export.export_view, name='export'),
     path('api/', include(router.urls), name='api'),
     path('api-auth/', include('rest_framework.urls'), name='rest_framework'),
     path('profile/', views.profile, name='profile'),
@@ -32,3 +49,8 @@ urlpatterns = [
     path('logout/', views.logout_view, name='logout'),
     path('bet/', views.make_bet, name='bet'),
 ]
+
+urlpatterns = [
+    *(async_read_patterns if settings.ASYNC_VIEWS else sync_read_patterns),
+    *other_patterns,
+]
@@ -1,17 +1,16 @@
 """Module for page views."""
 from typing import Any
 
-from django.contrib.auth import authenticate, decorators, login, logout
+from django.contrib.auth import decorators, login, logout
 from django.core import exceptions
-from django.core.paginator import Paginator
 from django.shortcuts import redirect, render
 from django.views.generic import ListView
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import BasePermission
 from rest_framework.viewsets import ModelViewSet
 
-from competitions_app import config, serializers
+from competitions_app import bets, caching, config, counters, serializers
 
+from . import authentication, bulk, conditional, fragments, pagination, wallet
 from .forms import AddFundsForm, LoginForm, MakeBetForm, Registration
 from .models import Client, Competition, CompetitionsSports, Sport, Stage
 
@@ -25,13 +24,14 @@ def home_page(request):
     Returns:
         HttpResponse: return an HttpResponse.
     """
+    counts = counters.get_counts()
     return render(
         request,
         'index.html',
         {
-            'competitions': Competition.objects.count(),
-            'sports': Sport.objects.count(),
-            config.STAGES: Stage.objects.count(),
+            'competitions': counts[Competition],
+            'sports': counts[Sport],
+            config.STAGES: counts[Stage],
         },
     )
 
@@ -59,16 +59,19 @@ def create_list_view(model_class, plural_name, template):
 
         model = model_class
         template_name = template
-        paginate_by = 10
         context_object_name = plural_name
 
         def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
             context = super().get_context_data(**kwargs)
-            books = model_class.objects.all()
-            paginator = Paginator(books, 10)
-            page = self.request.GET.get('page')
-            page_obj = paginator.get_page(page)
+            paginator = pagination.KeysetPaginator(
+                model_class.objects.all(),
+                config.CATALOG_PAGE_SIZE,
+            )
+            page_obj = paginator.get_page(self.request.GET.get(config.CURSOR))
             context[f'{plural_name}_list'] = page_obj
+            context['page_obj'] = page_obj
+            context.update(fragments.get_context(page_obj))
+            context['is_paginated'] = page_obj.has_next or page_obj.has_previous
             return context
     return CustomListView
 
@@ -100,20 +103,13 @@ def create_view(model_class, context_name, template):
             HttpResponse: return an HttpResponse.
         """
         id_ = request.GET.get('id', None)
-        target = model_class.objects.get(id=id_) if id_ else None
+        target = caching.get_object(model_class, id_) if id_ else None
         context = {context_name: target}
-        if model_class == Competition:
-            next_targets = Sport.objects.all().filter(competitions=target)
-            context['sports'] = next_targets
-        elif model_class == Sport:
-            comps_sport = CompetitionsSports.objects.all().filter(sport_id=target)
-            next_targets = [
-                Stage.objects.all().filter(comp_sport=comp_sport) for comp_sport in comps_sport
-            ]
-            context['query_stages'] = next_targets
-        elif model_class == Stage:
-            client = Client.objects.get(user=request.user)
-            context['client_placed_bet'] = target in client.stages.all()
+        if target is not None:
+            context.update(caching.get_page_lists(target))
+            context.update(fragments.get_entity_context(target, context))
+        if model_class == Stage and target is not None:
+            context['client_placed_bet'] = bets.has_bet(request.client.id, target.id)
         return render(
             request,
             template,
@@ -170,17 +166,10 @@ def login_view(request):
     error_message = None
 
     if request.method == config.POST:
-        form = LoginForm(request.POST)
+        form = LoginForm(request.POST, request=request)
         if form.is_valid():
-            login_data = form.cleaned_data
-            user = authenticate(
-                request,
-                username=login_data['username'],
-                password=login_data['password'],
-            )
-            if user is not None:
-                login(request, user)
-                return redirect('profile')
+            login(request, form.user)
+            return redirect(config.PROFILE)
         else:
             error_message = 'Форма неверно заполнена.'
     else:
@@ -239,37 +228,57 @@ class MyPermission(BasePermission):
         return False
 
 
-def create_viewset(model_class, serializer):
+def create_viewset(model_class, serializer, flat_serializer):
     """Create view set for route.
 
     Args:
         model_class: desired model class.
         serializer: hyperlink serializer.
+        flat_serializer: primary key serializer used with ?mode=flat.
 
     Returns:
         CustomViewSet: view set.
     """
-    class CustomViewSet(ModelViewSet):
+    class CustomViewSet(conditional.ConditionalMixin, bulk.BulkMixin, ModelViewSet):
         """CustomViewSet.
 
         Args:
+            ConditionalMixin: 304 answers of fresh lists and details.
+            BulkMixin: bulk create, update and delete route.
             ModelViewSet: model view set.
         """
 
         serializer_class = serializer
+        flat_serializer_class = flat_serializer
         queryset = model_class.objects.all()
         permission_classes = [MyPermission]
-        authentication_classes = [TokenAuthentication]
+        authentication_classes = [authentication.CachedTokenAuthentication]
+        pagination_class = pagination.KeysetPagination
+
+        def get_serializer_class(self):  # noqa: WPS615
+            if self.request.query_params.get(config.MODE) == config.FLAT:
+                return self.flat_serializer_class
+            return serializer
+
+        def get_queryset(self):  # noqa: WPS615
+            return self.get_serializer_class().plan(super().get_queryset(), self.request)
 
     return CustomViewSet
 
 
-competition_viewset = create_viewset(Competition, serializers.CompetitionSerializer)
-sport_viewset = create_viewset(Sport, serializers.SportSerializer)
-stage_viewset = create_viewset(Stage, serializers.StageSerializer)
+competition_viewset = create_viewset(
+    Competition, serializers.CompetitionSerializer, serializers.FlatCompetitionSerializer,
+)
+sport_viewset = create_viewset(
+    Sport, serializers.SportSerializer, serializers.FlatSportSerializer,
+)
+stage_viewset = create_viewset(
+    Stage, serializers.StageSerializer, serializers.FlatStageSerializer,
+)
 competitionssports_viewset = create_viewset(
     CompetitionsSports,
     serializers.CompetitionsSportsSerializer,
+    serializers.FlatCompetitionsSportsSerializer,
 )
 
 
@@ -283,15 +292,14 @@ def profile(request):
     Returns:
         HttpResponse: html page.
     """
-    client = Client.objects.get(user=request.user)
+    client = request.client
     form_errors = ''
     if request.method == config.POST:
         form = AddFundsForm(request.POST)
         if form.is_valid():
             amount = form.cleaned_data.get('amount', None)
             if amount:
-                client.money += amount
-                client.save()
+                wallet.deposit(client.id, amount)
             else:
                 form_errors = 'An error occured, money amount was not specified!'
     else:
@@ -310,11 +318,32 @@ def profile(request):
             'client_data': client_data,
             config.FORM: form,
             'form_errors': form_errors,
-            'client_stages': client.stages.all(),
+            'client_bets': client.stageclient_set.select_related('stages').order_by('-created'),
         },
     )
 
 
+def submit_bet(form, client_id, stage_id) -> bool:
+    """Place the bet from a valid bet form.
+
+    Args:
+        form (MakeBetForm): valid bet form.
+        client_id: client primary key.
+        stage_id: stage primary key.
+
+    Returns:
+        bool: True if the bet is placed, False if the error is added to the form.
+    """
+    try:
+        bets.place_bet(client_id, stage_id, form.cleaned_data.get('bet_amount'))
+    except (wallet.InsufficientFunds, bets.BettingClosed) as error:
+        form.add_error(None, error)
+        return False
+    except bets.BetAlreadyPlaced:
+        return True
+    return True
+
+
 @decorators.login_required
 def make_bet(request):
     """Return page to make a bet.
@@ -325,7 +354,7 @@ def make_bet(request):
     Returns:
         HttpResponse: html page.
     """
-    client = Client.objects.get(user=request.user)
+    client = request.client
     id_ = request.GET.get('id', None)
     form_error = ''
     if not id_:
@@ -336,19 +365,15 @@ def make_bet(request):
         return redirect(config.STAGES)
     if not stage:
         return redirect(config.STAGES)
-    if stage in client.stages.all():
-        return redirect('profile')
+    if bets.has_bet(client.id, stage.id):
+        return redirect(config.PROFILE)
 
-    if request.method == config.POST and client.money >= 100:
+    money = client.money
+    if request.method == config.POST and money >= 100:
         form = MakeBetForm(request.POST)
-        if form.is_valid():
-            bet_amount = form.cleaned_data.get('bet_amount')
-            client.stages.add(stage)
-            client.money -= bet_amount
-            client.save()
-            return redirect('profile')
-        else:
-            form_error = form.errors
+        if form.is_valid() and submit_bet(form, client.id, stage.id):
+            return redirect(config.PROFILE)
+        form_error = form.errors
     else:
         form = MakeBetForm()
 
@@ -356,7 +381,7 @@ def make_bet(request):
         request,
         'pages/bet.html',
         {
-            'money': client.money,
+            'money': money,
             config.STAGE: stage,
             config.FORM: form,
             'form_error': form_error,
@@ -0,0 +1,175 @@
+"""Module for the append-only client wallet ledger.
+
+A balance is the latest snapshot plus the sum of newer entries. Every entry insert
+locks its client row before the insert takes an id from the sequence: credits
+lock it FOR KEY SHARE, so they never block each other or debits, and debits lock
+it FOR NO KEY UPDATE, which serializes debits of the client only. Compaction locks
+clients FOR UPDATE, which conflicts with both, so it waits for every transaction
+already holding an entry id of the client and later inserts get higher ids. The
+foreign key check of the insert is not enough, it locks the client only at the
+end of the statement, after the id is drawn.
+"""
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.utils.translation import gettext_lazy as _
+
+from .models import Client, EntryKind, WalletEntry, WalletSnapshot
+
+COMPACTION_CANDIDATES_SQL = """
+    WITH latest AS (
+        SELECT DISTINCT ON (client_id) client_id, last_entry_id
+        FROM crud_api.wallet_snapshot
+        ORDER BY client_id, last_entry_id DESC
+    )
+    SELECT entry.client_id
+    FROM crud_api.wallet_entry AS entry
+    LEFT JOIN latest ON latest.client_id = entry.client_id
+    WHERE entry.id > COALESCE(latest.last_entry_id, 0)
+    GROUP BY entry.client_id
+    HAVING COUNT(*) >= %s
+    ORDER BY entry.client_id
+"""
+
+SHARE_CLIENT_SQL = """
+    SELECT id FROM crud_api.client WHERE id = %s FOR KEY SHARE
+"""
+
+LOCK_CLIENTS_SQL = """
+    SELECT id FROM crud_api.client WHERE id = ANY(%s) ORDER BY id FOR UPDATE
+"""
+
+INSERT_SNAPSHOTS_SQL = """
+    WITH latest AS (
+        SELECT DISTINCT ON (client_id) client_id, balance, last_entry_id
+        FROM crud_api.wallet_snapshot
+        WHERE client_id = ANY(%(clients)s)
+        ORDER BY client_id, last_entry_id DESC
+    )
+    INSERT INTO crud_api.wallet_snapshot (id, client_id, balance, last_entry_id, created)
+    SELECT
+        gen_random_uuid(),
+        entry.client_id,
+        COALESCE(latest.balance, 0) + SUM(entry.amount),
+        MAX(entry.id),
+        now()
+    FROM crud_api.wallet_entry AS entry
+    LEFT JOIN latest ON latest.client_id = entry.client_id
+    WHERE entry.client_id = ANY(%(clients)s) AND entry.id > COALESCE(latest.last_entry_id, 0)
+    GROUP BY entry.client_id, latest.balance
+"""
+
+
+class InsufficientFunds(ValidationError):
+    """Client balance is lower than the debited amount.
+
+    Args:
+        ValidationError: Django validation error.
+    """
+
+    def __init__(self):
+        """Initialize the error with its message."""
+        super().__init__(_('Not enough money on the balance.'), code='insufficient_funds')
+
+
+def deposit(client_id, amount, kind=EntryKind.DEPOSIT) -> WalletEntry:
+    """Credit the wallet with a single insert under a shared client lock.
+
+    Args:
+        client_id: client primary key.
+        amount (Decimal): positive amount.
+        kind (EntryKind): entry kind.
+
+    Returns:
+        WalletEntry: created entry.
+    """
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(SHARE_CLIENT_SQL, [client_id])
+        return WalletEntry.objects.create(client_id=client_id, amount=amount, kind=kind)
+
+
+def debit(client_id, amount, kind=EntryKind.BET) -> WalletEntry:
+    """Debit the wallet if the balance covers the amount.
+
+    Args:
+        client_id: client primary key.
+        amount (Decimal): positive amount.
+        kind (EntryKind): entry kind.
+
+    Raises:
+        InsufficientFunds: if the balance is lower than the amount.
+
+    Returns:
+        WalletEntry: created entry.
+    """
+    with transaction.atomic():
+        locked = Client.objects.select_for_update(no_key=True).filter(pk=client_id)
+        list(locked.values_list('pk', flat=True))
+        if WalletEntry.balance(client_id) < amount:
+            raise InsufficientFunds()
+        return WalletEntry.objects.create(client_id=client_id, amount=-amount, kind=kind)
+
+
+def _snapshot_batch(client_ids) -> int:
+    with connection.cursor() as cursor:
+        cursor.execute(LOCK_CLIENTS_SQL, [client_ids])
+        cursor.execute(INSERT_SNAPSHOTS_SQL, {'clients': client_ids})
+        return cursor.rowcount
+
+
+def compact(min_entries, batch_size) -> int:
+    """Roll entries newer than the latest snapshots up into new snapshots.
+
+    Entries are never deleted, so the history stays replayable.
+
+    Args:
+        min_entries (int): minimal amount of unrolled entries of a client.
+        batch_size (int): clients per transaction.
+
+    Returns:
+        int: amount of created snapshots.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(COMPACTION_CANDIDATES_SQL, [min_entries])
+        client_ids = [row[0] for row in cursor.fetchall()]
+    created = 0
+    for start in range(0, len(client_ids), batch_size):
+        batch = client_ids[start:start + batch_size]
+        with transaction.atomic():
+            created += _snapshot_batch(batch)
+    return created
+
+
+def replay(client_id):
+    """Replay the client history from the first entry.
+
+    Args:
+        client_id: client primary key.
+
+    Yields:
+        tuple[WalletEntry, Decimal]: entry and the balance after it.
+    """
+    balance = 0
+    for entry in WalletEntry.objects.filter(client_id=client_id).order_by('id').iterator():
+        balance += entry.amount
+        yield entry, balance
+
+
+def audit(client_id) -> list[tuple[WalletSnapshot, Decimal]]:
+    """Check every snapshot of the client against the replayed history.
+
+    Args:
+        client_id: client primary key.
+
+    Returns:
+        list[tuple[WalletSnapshot, Decimal]]: mismatching snapshots with replayed balances.
+    """
+    balances = {entry.id: balance for entry, balance in replay(client_id)}
+    mismatches = []
+    for snapshot in WalletSnapshot.objects.filter(client_id=client_id).order_by('last_entry_id'):
+        replayed = balances.get(snapshot.last_entry_id, 0)
+        if replayed != snapshot.balance:
+            mismatches.append((snapshot, replayed))
+    return mismatches
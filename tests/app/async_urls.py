@@ -0,0 +1,4 @@
+"""URLs with async read views regardless of the ASYNC_VIEWS setting."""
+from competitions_app import urls
+
+urlpatterns = [*urls.async_read_patterns, *urls.other_patterns]
@@ -0,0 +1,22 @@
+"""Testing cases module."""
+from django.apps import apps
+from django.core.management.color import no_style
+from django.db import connection
+from django.test import TransactionTestCase
+
+
+class CommittingTestCase(TransactionTestCase):
+    """Test case committing to the database, e.g. for concurrency tests.
+
+    Django flush does not see tables of the crud_api schema, so they are truncated
+    explicitly after every test.
+
+    Args:
+        TransactionTestCase: test case django class.
+    """
+
+    def _fixture_teardown(self):
+        tables = [model._meta.db_table for model in apps.get_models()]
+        with connection.cursor() as cursor:
+            for statement in connection.ops.sql_flush(no_style(), tables, allow_cascade=True):
+                cursor.execute(statement)
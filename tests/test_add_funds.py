@@ -23,7 +23,7 @@ class TestAddFunds(TestCase):
     def setUp(self):
         """Set up the user-client."""
         self.user = User.objects.create(username='user', password=config.TEST_USERNAME)
-        self.client = Client.objects.create(user=self.user, money=0)
+        self.client = Client.objects.create(user=self.user)
         self.api_client = DjangoTestClient()
         self.api_client.force_login(self.user)
 
@@ -2,13 +2,14 @@
 from datetime import date
 
 from django.contrib.auth.models import User
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 
-from competitions_app import config
-from competitions_app.models import Competition, Sport, Stage
+from competitions_app import config, models
 
 TEST_USERNAME = 'abcdef'
 TEST_SUPERUSERNAME = 'admin'
@@ -87,6 +88,76 @@ sport_attrs = {'name': 'def'}
 stage_attrs = {'name': 'ghi', 'stage_date': date(config.TEST_YEAR, 8, 4)}
 
 base_url = '/api/'
-CompetitionApiTest = create_api_test(Competition, f'{base_url}competitions/', competition_attrs)
-SportApiTest = create_api_test(Sport, f'{base_url}sports/', sport_attrs)
-StageApiTest = create_api_test(Stage, f'{base_url}stages/', stage_attrs)
+CompetitionApiTest = create_api_test(
+    models.Competition, f'{base_url}competitions/', competition_attrs,
+)
+SportApiTest = create_api_test(models.Sport, f'{base_url}sports/', sport_attrs)
+StageApiTest = create_api_test(models.Stage, f'{base_url}stages/', stage_attrs)
+
+
+class TestListQueries(TestCase):
+    """Test case for list responses cost.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create an authenticated API client."""
+        self.client = APIClient()
+        user = User.objects.create(username=TEST_USERNAME, password=config.TEST_PASSWORD)
+        self.client.force_authenticate(user=user)
+
+    def add_catalog(self, amount):
+        """Create competitions holding every sport, with a stage per link.
+
+        Args:
+            amount (int): competitions and sports amount.
+        """
+        sports = [models.Sport.objects.create(name=f'sport {index}') for index in range(amount)]
+        for index in range(amount):
+            competition = models.Competition.objects.create(
+                name=f'competition {index}',
+                competition_start=date(config.TEST_YEAR, 8, 1),
+                competition_end=date(config.TEST_YEAR, 8, 10),
+            )
+            for sport in sports:
+                link = models.CompetitionsSports.objects.create(
+                    competition_id=competition, sport_id=sport,
+                )
+                models.Stage.objects.create(name='stage', comp_sport=link)
+
+    def count_queries(self, url):
+        """Count queries of a list request.
+
+        Args:
+            url (str): list endpoint.
+
+        Returns:
+            int: amount of queries.
+        """
+        queries = CaptureQueriesContext(connection)
+        with queries:
+            self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        return len(queries)
+
+    def test_fixed_queries(self):
+        """Test list queries do not grow with rows and related objects."""
+        urls = [
+            f'{base_url}{name}/{mode}'
+            for name in ('competitions', 'sports', 'stages', 'competitionssports')
+            for mode in ('', '?mode=flat')
+        ]
+        self.add_catalog(2)
+        counts = [self.count_queries(url) for url in urls]
+        self.add_catalog(3)
+        self.assertEqual([self.count_queries(url) for url in urls], counts)
+
+    def test_flat(self):
+        """Test flat representation holds primary keys."""
+        self.add_catalog(1)
+        competition = self.client.get(f'{base_url}competitions/?mode=flat').json()['results'][0]
+        self.assertEqual(competition['sports'], [str(models.Sport.objects.get().id)])
+        stage = self.client.get(f'{base_url}stages/?mode=flat').json()['results'][0]
+        self.assertEqual(stage['comp_sport'], str(models.CompetitionsSports.objects.get().id))
+        self.assertNotIn('clients', stage)
@@ -0,0 +1,98 @@
+"""Module for testing async read views."""
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.test.client import AsyncClient
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from competitions_app import async_views, config, models
+
+ASYNC_URLS = 'tests.app.async_urls'
+ID = 'id'
+LOGIN = 'login'
+
+
+@override_settings(ROOT_URLCONF=ASYNC_URLS)
+class TestAsyncViews(TestCase):
+    """Test case for pages served by async views.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create a catalog and a logged in client."""
+        cache.clear()
+        self.user = User.objects.create(username=config.TEST_USERNAME)
+        self.client_model = models.Client.objects.create(user=self.user)
+        self.competition = models.Competition.objects.create(
+            name='competition',
+            competition_start=timezone.localdate(),
+            competition_end=timezone.localdate() + timedelta(days=1),
+        )
+        self.sport = models.Sport.objects.create(name='sport')
+        link = models.CompetitionsSports.objects.create(
+            competition_id=self.competition, sport_id=self.sport,
+        )
+        self.stage = models.Stage.objects.create(
+            name='stage', stage_date=timezone.localdate(), comp_sport=link,
+        )
+        self.async_client = AsyncClient()
+        self.async_client.force_login(self.user)
+
+    async def test_routes_async(self):
+        """Test read pages resolve to the async views."""
+        response = await self.async_client.get(reverse(config.STAGE), {ID: self.stage.id})
+        self.assertIs(response.resolver_match.func, async_views.stage_view)
+
+    async def test_home(self):
+        """Test home page shows the counts."""
+        response = await self.async_client.get(reverse('homepage'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.context['competitions'], 1)
+        self.assertEqual(response.context[config.STAGES], 1)
+        self.assertEqual(response.context['user'], self.user)
+
+    async def test_catalogs(self):
+        """Test catalog pages list their entities."""
+        catalogs = (
+            ('competitions', self.competition),
+            ('sports', self.sport),
+            (config.STAGES, self.stage),
+        )
+        for name, instance in catalogs:
+            response = await self.async_client.get(reverse(name))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(list(response.context['page_obj']), [instance])
+
+    async def test_entities(self):
+        """Test entity pages show the entity with its lists."""
+        response = await self.async_client.get(reverse('sport'), {ID: self.sport.id})
+        self.assertEqual(response.context['sport'], self.sport)
+        self.assertEqual(response.context['query_stages'], [(self.competition, [self.stage])])
+        response = await self.async_client.get(
+            reverse('competition'), {ID: self.competition.id},
+        )
+        self.assertEqual(list(response.context['sports']), [self.sport])
+
+    async def test_stage_bet(self):
+        """Test stage page tells whether the client placed a bet."""
+        url = reverse(config.STAGE)
+        response = await self.async_client.get(url, {ID: self.stage.id})
+        self.assertFalse(response.context['client_placed_bet'])
+        await models.StageClient.objects.acreate(
+            client=self.client_model, stages=self.stage, stake=1, odds=1,
+        )
+        response = await self.async_client.get(url, {ID: self.stage.id})
+        self.assertTrue(response.context['client_placed_bet'])
+
+    async def test_anonymous_redirect(self):
+        """Test anonymous users are sent to the login page."""
+        await self.async_client.alogout()
+        response = await self.async_client.get(reverse('sports'))
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertIn(reverse(LOGIN), response.url)
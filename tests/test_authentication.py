@@ -0,0 +1,74 @@
+"""Module for testing the cached token authentication."""
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from competitions_app import authentication, config
+
+URL = '/api/sports/'
+
+
+class TestCachedTokenAuthentication(TestCase):
+    """Test case for token caching and revocation.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create a user with a token and an API client using it."""
+        cache.clear()
+        self.user = User.objects.create(username=config.TEST_USERNAME)
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def count_token_queries(self, expected_status=status.HTTP_200_OK) -> int:
+        """Request the endpoint and count token lookups.
+
+        Args:
+            expected_status (int): expected response status.
+
+        Returns:
+            int: amount of queries reading the token table.
+        """
+        queries = CaptureQueriesContext(connection)
+        with queries:
+            response = self.client.get(URL)
+        self.assertEqual(response.status_code, expected_status)
+        return sum('authtoken_token' in query['sql'] for query in queries.captured_queries)
+
+    def test_cached(self):
+        """Test only the first request reads the token."""
+        self.assertEqual(self.count_token_queries(), 1)
+        self.assertEqual(self.count_token_queries(), 0)
+
+    def test_password_not_cached(self):
+        """Test cached user comes without the password hash."""
+        self.count_token_queries()
+        user, _ = cache.get(authentication.get_cache_key(self.token.key))
+        self.assertIn('password', user.get_deferred_fields())
+
+    def test_token_delete(self):
+        """Test deleted token is revoked."""
+        self.count_token_queries()
+        self.token.delete()
+        self.count_token_queries(status.HTTP_401_UNAUTHORIZED)
+
+    def test_user_deactivation(self):
+        """Test tokens of a deactivated user are revoked."""
+        self.count_token_queries()
+        self.user.is_active = False
+        self.user.save()
+        self.count_token_queries(status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(TOKEN_CACHE_TTL=0)
+    def test_disabled(self):
+        """Test zero TTL reads the token on every request."""
+        self.count_token_queries()
+        self.assertEqual(self.count_token_queries(), 1)
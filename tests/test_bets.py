@@ -0,0 +1,235 @@
+"""Module for testing bet placement."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.client import Client as DjangoTestClient
+
+from competitions_app import bets, config, models, odds, wallet
+from tests.app.cases import CommittingTestCase
+
+STAKE = Decimal(100)
+STAGES_AMOUNT = 1000
+AFFORDABLE_BETS = 600
+THREADS = 16
+WAIT_SECONDS = 10
+BLOCKED_SECONDS = 0.5
+ODDS = Decimal('2.50')
+BETTORS = 3
+
+
+def create_client(money, username=config.TEST_USERNAME):
+    """Create user with a client.
+
+    Args:
+        money (Decimal): initial balance.
+        username (str): user name.
+
+    Returns:
+        Client: created client.
+    """
+    user = User.objects.create(username=username, password=config.TEST_PASSWORD)
+    client = models.Client.objects.create(user=user)
+    wallet.deposit(client.id, money)
+    return client
+
+
+class TestPlaceBet(TestCase):
+    """Test case for bet placement service.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create client and stage."""
+        self.bettor = create_client(STAKE)
+        self.stage = models.Stage.objects.create(
+            name='ghi',
+            stage_date=date(config.TEST_YEAR, 8, 4),
+        )
+
+    def test_successful(self):
+        """Test stake is debited and the bet is stored with the stage odds."""
+        bet = bets.place_bet(self.bettor.id, self.stage.id, STAKE)
+        self.assertEqual(self.bettor.money, 0)
+        self.assertTrue(bets.has_bet(self.bettor.id, self.stage.id))
+        bet.refresh_from_db()
+        self.stage.refresh_from_db()
+        self.assertEqual((bet.stake, bet.odds), (STAKE, self.stage.bet_coefficient))
+
+    def test_duplicate(self):
+        """Test second bet on the stage is rejected without debiting."""
+        wallet.deposit(self.bettor.id, STAKE)
+        bets.place_bet(self.bettor.id, self.stage.id, STAKE)
+        with self.assertRaises(bets.BetAlreadyPlaced):
+            bets.place_bet(self.bettor.id, self.stage.id, STAKE)
+        self.assertEqual(self.bettor.money, STAKE)
+
+    def test_insufficient_funds(self):
+        """Test bet over the balance is rolled back."""
+        with self.assertRaises(wallet.InsufficientFunds):
+            bets.place_bet(self.bettor.id, self.stage.id, STAKE + 1)
+        self.assertEqual(self.bettor.money, STAKE)
+        self.assertFalse(bets.has_bet(self.bettor.id, self.stage.id))
+
+    def test_view(self):
+        """Test bet page places the bet."""
+        web_client = DjangoTestClient()
+        web_client.force_login(self.bettor.user)
+        response = web_client.post(f'/bet/?id={self.stage.id}', {'bet_amount': STAKE})
+        self.assertRedirects(response, '/profile/')
+        self.assertEqual(self.bettor.money, 0)
+
+
+class TestSettlement(TestCase):
+    """Test case for bulk bet settlement.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create a stage with bets of several clients."""
+        self.stage = models.Stage.objects.create(
+            name='ghi',
+            stage_date=date(config.TEST_YEAR, 8, 4),
+            bet_coefficient=ODDS,
+        )
+        self.bettors = [create_client(STAKE, f'bettor {index}') for index in range(BETTORS)]
+        for bettor in self.bettors:
+            bets.place_bet(bettor.id, self.stage.id, STAKE)
+
+    def assert_balances(self, balance):
+        """Assert balance of every bettor.
+
+        Args:
+            balance (Decimal): expected balance.
+        """
+        for bettor in self.bettors:
+            self.assertEqual(bettor.money, balance)
+
+    def test_won(self):
+        """Test winning bets are paid stake times odds with one entry per client."""
+        self.assertEqual(bets.settle_stage(self.stage.id, models.StageOutcome.WON), (3, 3))
+        self.assert_balances(STAKE * ODDS)
+        statuses = set(models.StageClient.objects.values_list('status', flat=True))
+        self.assertEqual(statuses, {models.BetStatus.WON})
+        payouts = models.WalletEntry.objects.filter(kind=models.EntryKind.PAYOUT)
+        self.assertEqual(payouts.count(), BETTORS)
+
+    def test_lost(self):
+        """Test losing bets are not credited."""
+        self.assertEqual(bets.settle_stage(self.stage.id, models.StageOutcome.LOST), (3, 0))
+        self.assert_balances(0)
+
+    def test_void(self):
+        """Test void stage refunds the stakes."""
+        bets.settle_stage(self.stage.id, models.StageOutcome.VOID)
+        self.assert_balances(STAKE)
+
+    def test_repeated(self):
+        """Test repeated settlement pays nothing twice and keeps the outcome."""
+        bets.settle_stage(self.stage.id, models.StageOutcome.WON)
+        self.assertEqual(bets.settle_stage(self.stage.id, models.StageOutcome.WON), (0, 0))
+        with self.assertRaises(bets.StageAlreadySettled):
+            bets.settle_stage(self.stage.id, models.StageOutcome.VOID)
+        self.assert_balances(STAKE * ODDS)
+
+    def test_closed(self):
+        """Test settled stage takes no bets."""
+        bets.settle_stage(self.stage.id, models.StageOutcome.LOST)
+        late = create_client(STAKE, 'late')
+        with self.assertRaises(bets.BettingClosed):
+            bets.place_bet(late.id, self.stage.id, STAKE)
+        self.assertEqual(late.money, STAKE)
+
+    def test_command(self):
+        """Test settlement command."""
+        out = StringIO()
+        call_command('settle_stage', str(self.stage.id), models.StageOutcome.VOID, stdout=out)
+        self.assertIn('Bets settled: 3', out.getvalue())
+        self.assert_balances(STAKE)
+
+    def test_profile(self):
+        """Test profile shows stake, odds and payout."""
+        bets.settle_stage(self.stage.id, models.StageOutcome.WON)
+        web_client = DjangoTestClient()
+        web_client.force_login(self.bettors[0].user)
+        response = web_client.get('/profile/')
+        bet = response.context['client_bets'][0]
+        self.assertEqual((bet.stake, bet.odds, bet.payout), (STAKE, ODDS, STAKE * ODDS))
+        self.assertContains(response, 'payout:')
+
+
+class TestConcurrentBets(CommittingTestCase):
+    """Stress test firing concurrent bets at one client.
+
+    Args:
+        CommittingTestCase: TestCase committing to the database.
+    """
+
+    def test_exact_balance(self):
+        """Test only affordable bets pass, each stage once, balance ends exact."""
+        client = create_client(STAKE * AFFORDABLE_BETS)
+        stages = models.Stage.objects.bulk_create([
+            models.Stage(name=f'stage {index}', stage_date=date(config.TEST_YEAR, 8, 4))
+            for index in range(STAGES_AMOUNT)
+        ])
+        attempts = [stage.id for stage in stages for _ in range(2)]
+
+        def bet(stage_id):
+            try:
+                bets.place_bet(client.id, stage_id, STAKE)
+            except (bets.BetAlreadyPlaced, wallet.InsufficientFunds):
+                return False
+            finally:
+                connection.close()
+            return True
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            placed = sum(executor.map(bet, attempts))
+
+        self.assertEqual(placed, AFFORDABLE_BETS)
+        self.assertEqual(client.money, 0)
+        self.assertEqual(models.StageClient.objects.filter(client=client).count(), placed)
+
+    def test_reprice_during_bet(self):
+        """Test a bet placed during an uncommitted reprice records the new odds."""
+        client = create_client(STAKE)
+        stage = models.Stage.objects.create(name='stage', stage_date=date(config.TEST_YEAR, 8, 4))
+        repriced, release = threading.Event(), threading.Event()
+
+        def reprice_and_wait():
+            try:
+                with transaction.atomic():
+                    odds.reprice(models.Stage.objects.filter(pk=stage.pk))
+                    repriced.set()
+                    release.wait(WAIT_SECONDS)
+            finally:
+                connection.close()
+
+        def bet():
+            try:
+                return bets.place_bet(client.id, stage.id, STAKE)
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            reprice = executor.submit(reprice_and_wait)
+            repriced.wait(WAIT_SECONDS)
+            placed = executor.submit(bet)
+            with self.assertRaises(TimeoutError):
+                placed.result(timeout=BLOCKED_SECONDS)
+            release.set()
+            reprice.result()
+            placed_bet = placed.result()
+
+        stage.refresh_from_db()
+        self.assertEqual(placed_bet.odds, stage.bet_coefficient)
@@ -0,0 +1,202 @@
+"""Module for testing bulk API writes."""
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from competitions_app import config, models
+
+BULK_URL = '/api/stages/bulk/'
+STAGES_AMOUNT = 50
+MAX_QUERIES = 8
+ID = 'id'
+JSON = 'json'
+START = date(config.TEST_YEAR, 1, 1)
+END = date(config.TEST_YEAR + 1, 1, 1)
+NAME = 'name'
+STAGE_DATE = 'stage_date'
+COMP_SPORT = 'comp_sport'
+COMPETITION_START = 'competition_start'
+COMPETITION_END = 'competition_end'
+LINKS_AMOUNT = 20
+
+
+class TestStagesBulk(TestCase):
+    """Test case for bulk stage writes.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create a competition sport and authenticate a superuser."""
+        competition = models.Competition.objects.create(
+            name='cup',
+            competition_start=START,
+            competition_end=END,
+        )
+        sport = models.Sport.objects.create(name='chess')
+        self.link = models.CompetitionsSports.objects.create(
+            competition_id=competition, sport_id=sport,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(
+            username='admin', password=config.TEST_SUPERUSERPASSWORD, is_superuser=True,
+        ))
+
+    def get_records(self, amount, month=6):
+        """Build stage payloads.
+
+        Args:
+            amount (int): amount of stages.
+            month (int): month of the stage dates.
+
+        Returns:
+            list[dict]: payload records.
+        """
+        return [
+            {
+                NAME: f'stage {index}',
+                STAGE_DATE: date(config.TEST_YEAR, month, 1).isoformat(),
+                COMP_SPORT: str(self.link.id),
+            }
+            for index in range(amount)
+        ]
+
+    def test_create(self):
+        """Test stages are validated and inserted with a fixed amount of queries."""
+        queries = CaptureQueriesContext(connection)
+        with queries:
+            response = self.client.post(BULK_URL, self.get_records(STAGES_AMOUNT), format=JSON)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), STAGES_AMOUNT)
+        self.assertEqual(models.Stage.objects.filter(comp_sport=self.link).count(), STAGES_AMOUNT)
+        self.assertLessEqual(len(queries), MAX_QUERIES)
+
+    def test_errors_per_item(self):
+        """Test invalid records are reported by position and nothing is written."""
+        records = self.get_records(3)
+        records[1][STAGE_DATE] = date(config.TEST_YEAR + 1, 2, 1).isoformat()
+        records[2][COMP_SPORT] = str(self.missing_link_id())
+        response = self.client.post(BULK_URL, records, format=JSON)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data
+        self.assertEqual(errors[0], {})
+        self.assertIn('non_field_errors', errors[1])
+        self.assertIn(COMP_SPORT, errors[2])
+        self.assertFalse(models.Stage.objects.exists())
+
+    def test_update(self):
+        """Test partial updates keyed by id are written with one update."""
+        self.client.post(BULK_URL, self.get_records(STAGES_AMOUNT), format=JSON)
+        stages = list(models.Stage.objects.values_list(ID, flat=True))
+        records = [{ID: str(stage), 'place': 'hall'} for stage in stages]
+        queries = CaptureQueriesContext(connection)
+        with queries:
+            response = self.client.patch(BULK_URL, records, format=JSON)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(models.Stage.objects.filter(place='hall').count(), STAGES_AMOUNT)
+        self.assertLessEqual(len(queries), MAX_QUERIES)
+
+    def test_update_out_of_bounds(self):
+        """Test dates are checked against the competition of the stored stage."""
+        self.client.post(BULK_URL, self.get_records(1), format=JSON)
+        stage = models.Stage.objects.get()
+        response = self.client.patch(
+            BULK_URL,
+            [{ID: str(stage.id), STAGE_DATE: date(config.TEST_YEAR - 1, 1, 1).isoformat()}],
+            format=JSON,
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_delete(self):
+        """Test listed ids are deleted and unknown ids reject the request."""
+        self.client.post(BULK_URL, self.get_records(3), format=JSON)
+        stages = [str(stage) for stage in models.Stage.objects.values_list(ID, flat=True)]
+        response = self.client.delete(BULK_URL, [*stages, 'missing'], format=JSON)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(response.data[3]), [ID])
+        response = self.client.delete(BULK_URL, stages, format=JSON)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(models.Stage.objects.exists())
+
+    def test_user_forbidden(self):
+        """Test regular users cannot create in bulk."""
+        self.client.force_authenticate(User.objects.create(username='abcdef'))
+        response = self.client.post(BULK_URL, self.get_records(1), format=JSON)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def missing_link_id(self):
+        """Primary key of a missing competition sport.
+
+        Returns:
+            UUID: primary key of the competition, not of a link.
+        """
+        return self.link.competition_id_id
+
+
+class TestCatalogBulk(TestCase):
+    """Test case for model constraints of bulk catalog writes.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create a competition with two sports and authenticate a superuser."""
+        self.competition = models.Competition.objects.create(
+            name='cup', competition_start=START, competition_end=END,
+        )
+        self.sports = [
+            models.Sport.objects.create(name=f'sport {index}') for index in range(LINKS_AMOUNT)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(
+            username='admin', password=config.TEST_SUPERUSERPASSWORD, is_superuser=True,
+        ))
+
+    def link(self, sport):
+        """Build a competition sport payload.
+
+        Args:
+            sport (Sport): linked sport.
+
+        Returns:
+            dict: payload record.
+        """
+        return {'competition_id': str(self.competition.id), 'sport_id': str(sport.id)}
+
+    def test_duplicate_links(self):
+        """Test links repeated in the batch or stored are reported per item."""
+        models.CompetitionsSports.objects.create(
+            competition_id=self.competition, sport_id=self.sports[0],
+        )
+        records = [self.link(self.sports[0]), self.link(self.sports[1]), self.link(self.sports[1])]
+        response = self.client.post('/api/competitionssports/bulk/', records, format=JSON)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([bool(error) for error in response.data], [True, False, True])
+        self.assertEqual(models.CompetitionsSports.objects.count(), 1)
+
+    def test_unique_check_queries(self):
+        """Test stored links are checked with one query for the whole batch."""
+        records = [self.link(sport) for sport in self.sports]
+        queries = CaptureQueriesContext(connection)
+        with queries:
+            response = self.client.post('/api/competitionssports/bulk/', records, format=JSON)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertLessEqual(len(queries), MAX_QUERIES)
+
+    def test_competition_dates(self):
+        """Test a competition ending at its start is reported instead of failing the insert."""
+        records = [
+            {NAME: 'open', COMPETITION_START: START.isoformat(), COMPETITION_END: END.isoformat()},
+            {NAME: 'flash', COMPETITION_START: START.isoformat(), COMPETITION_END: str(START)},
+        ]
+        response = self.client.post('/api/competitions/bulk/', records, format=JSON)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('non_field_errors', response.data[1])
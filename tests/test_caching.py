@@ -0,0 +1,169 @@
+"""Module for testing the read-through cache of entity pages."""
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from competitions_app import caching, models, odds
+from tests.app.cases import CommittingTestCase
+
+HITS = caching.HITS
+MISSES = caching.MISSES
+SPORT = 'sport'
+GO = 'go'
+FINAL = 'final'
+DAYS = 30
+UNPRICED_ODDS = Decimal('99.99')
+
+
+class TestCaching(CommittingTestCase):
+    """Test case for the cache, values are stored outside transactions only.
+
+    Args:
+        CommittingTestCase: TestCase committing to the database.
+    """
+
+    def setUp(self):
+        """Create a sport with an upcoming stage and reset the cache."""
+        cache.clear()
+        caching.stats.clear()
+        self.competition = models.Competition.objects.create(
+            name='olympics',
+            competition_start=timezone.localdate(),
+            competition_end=timezone.localdate() + timedelta(days=DAYS),
+        )
+        self.sport = models.Sport.objects.create(name='chess')
+        self.link = models.CompetitionsSports.objects.create(
+            competition_id=self.competition, sport_id=self.sport,
+        )
+        self.stage = models.Stage.objects.create(
+            name=FINAL,
+            comp_sport=self.link,
+            stage_date=timezone.localdate() + timedelta(days=1),
+        )
+
+    def stage_names(self, sport):
+        """Read names of upcoming stages of the sport through the cache.
+
+        Args:
+            sport (Sport): sport.
+
+        Returns:
+            list[str]: stage names.
+        """
+        return [
+            stage.name
+            for _, stages in caching.get_sport_stages(sport)
+            for stage in stages
+        ]
+
+    def test_hit_after_miss(self):
+        """Test second read comes from the cache without queries."""
+        caching.get_object(models.Sport, self.sport.pk)
+        queries = CaptureQueriesContext(connection)
+        with queries:
+            cached = caching.get_object(models.Sport, self.sport.pk)
+        self.assertEqual(cached, self.sport)
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(caching.get_stats()[SPORT], {HITS: 1, MISSES: 1})
+
+    def test_object_after_save(self):
+        """Test saved object is read in its new state."""
+        caching.get_object(models.Sport, self.sport.pk)
+        self.sport.name = GO
+        self.sport.save()
+        self.assertEqual(caching.get_object(models.Sport, self.sport.pk).name, GO)
+
+    def test_object_after_reprice(self):
+        """Test repriced stage is read with its new coefficient."""
+        stages = models.Stage.objects.filter(pk=self.stage.pk)
+        stages.update(bet_coefficient=UNPRICED_ODDS)
+        cached = caching.get_object(models.Stage, self.stage.pk)
+        self.assertEqual(cached.bet_coefficient, UNPRICED_ODDS)
+        odds.reprice(stages)
+        cached = caching.get_object(models.Stage, self.stage.pk)
+        self.assertNotEqual(cached.bet_coefficient, UNPRICED_ODDS)
+        self.assertEqual(cached.bet_coefficient, stages.get().bet_coefficient)
+
+    def test_object_after_delete(self):
+        """Test deleted object is not read from the cache."""
+        caching.get_object(models.Stage, self.stage.pk)
+        self.competition.delete()
+        with self.assertRaises(models.Stage.DoesNotExist):
+            caching.get_object(models.Stage, self.stage.pk)
+
+    def test_sport_stages_after_writes(self):
+        """Test stages of a sport follow creation, renames and moves of stages."""
+        other_sport = models.Sport.objects.create(name=GO)
+        other_link = models.CompetitionsSports.objects.create(
+            competition_id=self.competition, sport_id=other_sport,
+        )
+        self.assertEqual(self.stage_names(self.sport), [FINAL])
+        self.assertEqual(self.stage_names(other_sport), [])
+        models.Stage.objects.create(
+            name='semifinal', comp_sport=self.link, stage_date=timezone.localdate(),
+        )
+        self.assertEqual(self.stage_names(self.sport), ['semifinal', FINAL])
+        self.stage.comp_sport = other_link
+        self.stage.save()
+        self.assertEqual(self.stage_names(self.sport), ['semifinal'])
+        self.assertEqual(self.stage_names(other_sport), [FINAL])
+
+    def test_sport_stages_after_competition_rename(self):
+        """Test competitions grouping the stages are read in their new state."""
+        caching.get_sport_stages(self.sport)
+        self.competition.name = 'paralympics'
+        self.competition.save()
+        groups = caching.get_sport_stages(self.sport)
+        self.assertEqual(groups[0][0].name, 'paralympics')
+
+    def test_competition_sports_after_links(self):
+        """Test sports of a competition follow many to many changes and sport renames."""
+        other_sport = models.Sport.objects.create(name=GO)
+        self.assertEqual(caching.get_competition_sports(self.competition), [self.sport])
+        self.competition.sports.add(other_sport)
+        self.assertEqual(len(caching.get_competition_sports(self.competition)), 2)
+        other_sport.competitions.clear()
+        self.sport.name = 'checkers'
+        self.sport.save()
+        sports = caching.get_competition_sports(self.competition)
+        self.assertEqual([sport.name for sport in sports], ['checkers'])
+
+    def test_write_during_load(self):
+        """Test value loaded before a concurrent commit is not read afterwards."""
+        def load():
+            stale = models.Sport.objects.get(pk=self.sport.pk)
+            self.sport.name = GO
+            self.sport.save()
+            return stale
+
+        caching.read_through(SPORT, self.sport.pk, load)
+        self.assertEqual(caching.get_object(models.Sport, self.sport.pk).name, GO)
+
+    def test_not_stored_in_transaction(self):
+        """Test values read inside a transaction are not stored."""
+        with transaction.atomic():
+            self.sport.name = GO
+            self.sport.save()
+            caching.get_object(models.Sport, self.sport.pk)
+            transaction.set_rollback(True)
+        self.assertEqual(caching.get_object(models.Sport, self.sport.pk).name, 'chess')
+
+    def test_sport_page(self):
+        """Test sport page shows renamed stages."""
+        user = User.objects.create(username='abcdef')
+        models.Client.objects.create(user=user)
+        client = Client()
+        client.force_login(user)
+        url = f'{reverse(SPORT)}?id={self.sport.pk}'
+        self.assertContains(client.get(url), FINAL)
+        self.stage.name = 'grand final'
+        self.stage.save()
+        self.assertContains(client.get(url), 'grand final')
+        self.assertEqual(caching.get_stats()[caching.SPORT_STAGES], {HITS: 0, MISSES: 2})
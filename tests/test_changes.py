@@ -0,0 +1,97 @@
+"""Module for testing the catalog change feed."""
+from django.contrib.auth.models import User
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from competitions_app import models
+from tests.app.cases import CommittingTestCase
+
+CHANGES_URL = '/api/changes/'
+CHANGES = 'changes'
+CURSOR = 'cursor'
+OPERATION = 'operation'
+UPSERT = 'upsert'
+
+
+class TestChangeFeed(CommittingTestCase):
+    """Test case for the change feed, changes must be committed to be listed.
+
+    Args:
+        CommittingTestCase: TestCase committing to the database.
+    """
+
+    def setUp(self):
+        """Authenticate a user and skip changes made before the test."""
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(username='abcdef'))
+        self.cursor = ''
+        self.cursor = self.read()[CURSOR]
+
+    def read(self, **query):
+        """Read the feed after the current cursor.
+
+        Args:
+            query: query parameters.
+
+        Returns:
+            dict: feed page.
+        """
+        response = self.client.get(CHANGES_URL, {'since': self.cursor, **query})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_upserts_collapsed(self):
+        """Test created and updated object is listed once with its current state."""
+        sport = models.Sport.objects.create(name='chess')
+        sport.name = 'go'
+        sport.save()
+        changes = self.read()[CHANGES]
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0][OPERATION], UPSERT)
+        self.assertEqual(changes[0]['object']['name'], 'go')
+
+    def test_tombstones(self):
+        """Test deleted objects are listed as tombstones."""
+        sport = models.Sport.objects.create(name='chess')
+        self.cursor = self.read()[CURSOR]
+        models.Sport.objects.filter(pk=sport.pk).delete()
+        changes = self.read()[CHANGES]
+        self.assertEqual(
+            [(change['entity'], change['id'], change[OPERATION]) for change in changes],
+            [('sports', sport.pk, 'delete')],
+        )
+
+    def test_pages(self):
+        """Test the cursor walks the feed page by page without repeats."""
+        models.Sport.objects.bulk_create(
+            models.Sport(name=f'sport {index}') for index in range(5)
+        )
+        first = self.read(page_size=3)
+        self.assertTrue(first['has_more'])
+        self.cursor = first[CURSOR]
+        second = self.read(page_size=3)
+        self.assertFalse(second['has_more'])
+        names = {change['object']['name'] for change in first[CHANGES] + second[CHANGES]}
+        self.assertEqual(len(names), 5)
+        self.cursor = second[CURSOR]
+        self.assertEqual(self.read()[CHANGES], [])
+
+    def test_bad_cursor(self):
+        """Test malformed cursor is rejected."""
+        response = self.client.get(CHANGES_URL, {'since': 'abc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(DATABASE_REPLICAS=('replica',))
+    def test_replica_request(self):
+        """Test objects are loaded from the primary, the replica alias does not exist."""
+        sport = models.Sport.objects.create(name='chess')
+        competition = models.Competition.objects.create(
+            name='cup', competition_start='2030-01-01', competition_end='2030-01-02',
+        )
+        competition.sports.add(sport)
+        changes = self.read()[CHANGES]
+        self.assertEqual(
+            {(change['entity'], change[OPERATION]) for change in changes},
+            {('sports', UPSERT), ('competitions', UPSERT), ('competitionssports', UPSERT)},
+        )
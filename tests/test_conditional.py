@@ -0,0 +1,83 @@
+"""Module for testing conditional GET of the API."""
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from competitions_app import conditional, models
+
+SPORTS_URL = '/api/sports/'
+ETAG = 'ETag'
+LAST_MODIFIED = 'Last-Modified'
+
+
+class TestConditionalGet(TestCase):
+    """Test case for ETag and Last-Modified validators.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create a sport and authenticate a user."""
+        self.sport = models.Sport.objects.create(name='chess')
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(username='abcdef'))
+
+    def test_list_not_modified(self):
+        """Test fresh list copy is answered with 304 without a body."""
+        response = self.client.get(SPORTS_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        again = self.client.get(SPORTS_URL, HTTP_IF_NONE_MATCH=response[ETAG])
+        self.assertEqual(again.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse(again.content)
+
+    def test_list_changed(self):
+        """Test saved or created rows change the list ETag."""
+        etag = self.client.get(SPORTS_URL)[ETAG]
+        self.sport.save()
+        changed = self.client.get(SPORTS_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        models.Sport.objects.create(name='go')
+        created = self.client.get(SPORTS_URL, HTTP_IF_NONE_MATCH=changed[ETAG])
+        self.assertEqual(created.status_code, status.HTTP_200_OK)
+
+    def test_links_changed(self):
+        """Test linking a sport changes ETags of the competition list and detail."""
+        competition = models.Competition.objects.create(
+            name='cup', competition_start='2030-01-01', competition_end='2030-01-02',
+        )
+        urls = ('/api/competitions/', f'/api/competitions/{competition.id}/')
+        etags = [self.client.get(url)[ETAG] for url in urls]
+        models.CompetitionsSports.objects.create(competition_id=competition, sport_id=self.sport)
+        for url, etag in zip(urls, etags):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_bet_changed(self):
+        """Test placing a bet changes the validators of the stage."""
+        stage = models.Stage.objects.create(name='final')
+        stages = models.Stage.objects.filter(pk=stage.pk)
+        totals, _ = conditional.aggregate(stages)
+        client = models.Client.objects.create(user=User.objects.create(username='ghijkl'))
+        bet = models.StageClient.objects.create(stages=stage, client=client)
+        self.assertEqual(conditional.aggregate(stages), ([1, totals[1] + 1], bet.modified))
+
+    def test_detail_if_modified_since(self):
+        """Test detail is answered with 304 since its Last-Modified."""
+        url = f'{SPORTS_URL}{self.sport.id}/'
+        response = self.client.get(url)
+        again = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response[LAST_MODIFIED])
+        self.assertEqual(again.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_detail_missing(self):
+        """Test missing detail is still 404."""
+        response = self.client.get(f'{SPORTS_URL}missing/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_save_bumps_modified(self):
+        """Test save updates the modification time, also with update_fields."""
+        modified = self.sport.modified
+        self.sport.save(update_fields=['name'])
+        self.sport.refresh_from_db()
+        self.assertGreater(self.sport.modified, modified)
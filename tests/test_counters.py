@@ -0,0 +1,89 @@
+"""Module for testing maintained entity counters."""
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.deletion import Collector
+from django.test import TestCase, override_settings
+from django.test.client import Client
+
+from competitions_app import config, counters, models
+
+BULK_AMOUNT = 5
+
+
+class TestEntityCounters(TestCase):
+    """Test case for entity counters maintenance.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def assert_counts(self):
+        """Assert maintained counters equal actual rows amounts."""
+        for model_class, rows_amount in counters.get_exact_counts().items():
+            with self.subTest(model_class.__name__):
+                self.assertEqual(rows_amount, model_class.objects.count())
+
+    def test_save_and_delete(self):
+        """Test counters follow creation and cascade deletion."""
+        competition = models.Competition.objects.create(
+            name='abc',
+            competition_start=date(config.TEST_YEAR, 8, 1),
+            competition_end=date(config.TEST_YEAR, 8, config.SIXTEEN),
+        )
+        sport = models.Sport.objects.create(name='def')
+        link = models.CompetitionsSports.objects.create(competition_id=competition, sport_id=sport)
+        models.Stage.objects.create(name='ghi', comp_sport=link)
+        self.assert_counts()
+
+        competition.delete()
+        self.assert_counts()
+        self.assertEqual(counters.get_exact_counts()[models.Stage], 0)
+
+    def test_fast_delete(self):
+        """Test receivers leave uncounted models to fast deletion."""
+        collector = Collector(using=DEFAULT_DB_ALIAS)
+        for model_class in (models.WalletEntry, models.StageClient):
+            with self.subTest(model_class.__name__):
+                self.assertTrue(collector.can_fast_delete(model_class.objects.all()))
+        self.assertFalse(collector.can_fast_delete(models.Stage.objects.all()))
+
+    def test_bulk_create(self):
+        """Test counters follow bulk creation and queryset deletion."""
+        models.Sport.objects.bulk_create([
+            models.Sport(name=f'sport {index}') for index in range(BULK_AMOUNT)
+        ])
+        self.assert_counts()
+        models.Sport.objects.filter(name='sport 0').delete()
+        self.assert_counts()
+
+    def test_reconcile(self):
+        """Test reconciliation command repairs drifted counters."""
+        models.Sport.objects.create(name='def')
+        models.EntityCounter.objects.update(amount=config.TWELVE)
+        call_command('reconcile_counters', stdout=StringIO())
+        self.assert_counts()
+
+    def test_missing_counter(self):
+        """Test missing counter row is recounted."""
+        models.Sport.objects.create(name='def')
+        models.EntityCounter.objects.all().delete()
+        self.assertEqual(counters.get_exact_counts()[models.Sport], 1)
+        models.Sport.objects.create(name='ghi')
+        self.assert_counts()
+
+    def test_home_page_single_query(self):
+        """Test home page reads all counters with one query."""
+        with self.assertNumQueries(1):
+            response = Client().get('/')
+        self.assertEqual(response.context['sports'], 0)
+
+    @override_settings(ENTITY_COUNTS_ESTIMATED=True)
+    def test_estimated(self):
+        """Test estimated mode reads pg_class."""
+        estimated = counters.get_counts()
+        self.assertEqual(set(estimated), set(counters.COUNTED_MODELS))
+        for rows_amount in estimated.values():
+            self.assertGreaterEqual(rows_amount, 0)
@@ -0,0 +1,79 @@
+"""Module for testing catalog exports."""
+import csv
+import json
+from datetime import date, datetime, timedelta, timezone
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from competitions_app import config
+from competitions_app.models import Sport, Stage
+
+STAGES_AMOUNT = 5
+URL = '/api/export/stages.'
+
+
+class TestExport(TestCase):
+    """Test case for streaming exports.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create stages and an authenticated API client."""
+        self.client = APIClient()
+        user = User.objects.create(username=config.TEST_USERNAME, password=config.TEST_PASSWORD)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=user)}')
+        Stage.objects.bulk_create([
+            Stage(name=f'stage {index}', stage_date=date(config.TEST_YEAR, 8, 4))
+            for index in range(STAGES_AMOUNT)
+        ])
+
+    def read(self, url):
+        """Read a streamed response.
+
+        Args:
+            url (str): export URL.
+
+        Returns:
+            list[str]: response lines.
+        """
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode().splitlines()
+
+    def test_ndjson(self):
+        """Test every stage is exported as a JSON line."""
+        rows = [json.loads(line) for line in self.read(f'{URL}ndjson')]
+        self.assertEqual(len(rows), STAGES_AMOUNT)
+        self.assertEqual(rows[0]['stage_date'], '1936-08-04')
+
+    def test_csv(self):
+        """Test CSV export has a header and a line per sport."""
+        Sport.objects.create(name='chess', description='board, game')
+        rows = list(csv.reader(self.read('/api/export/sports.csv')))
+        self.assertEqual(rows[0], ['id', 'name', 'description', 'created', 'modified'])
+        self.assertEqual(rows[1][1:3], ['chess', 'board, game'])
+
+    def test_modified_since(self):
+        """Test modification time filter."""
+        future = datetime.now(timezone.utc) + timedelta(days=1)
+        Stage.objects.filter(name='stage 0').update(modified=future)
+        since = future.isoformat().replace('+00:00', 'Z')
+        self.assertEqual(len(self.read(f'{URL}ndjson?modified__gte={since}')), 1)
+        response = self.client.get(f'{URL}csv?modified__gte=yesterday')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unknown(self):
+        """Test unknown tables, formats and anonymous requests are rejected."""
+        self.assertEqual(self.client.get(f'{URL}xml').status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get('/api/export/clients.csv')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.client.credentials()
+        response = self.client.get(f'{URL}csv')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,102 @@
+"""Module for testing sparse fieldsets and expansion of API responses."""
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from competitions_app import config, models
+
+STAGES_URL = '/api/stages/'
+PAGE = 'results'
+NAME = 'name'
+FIELDS = 'fields'
+EXPAND = 'expand'
+COMP_SPORT = 'comp_sport'
+STAGES_AMOUNT = 5
+
+
+class TestFieldsets(TestCase):
+    """Test case for ?fields= and ?expand=.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create stages of a competition sport and authenticate a user."""
+        self.competition = models.Competition.objects.create(
+            name='cup',
+            competition_start=date(config.TEST_YEAR, 1, 1),
+            competition_end=date(config.TEST_YEAR + 1, 1, 1),
+        )
+        sport = models.Sport.objects.create(name='chess')
+        self.competition.sports.add(sport)
+        link = models.CompetitionsSports.objects.get()
+        models.Stage.objects.bulk_create(
+            models.Stage(
+                name=f'stage {index}', stage_date=date(config.TEST_YEAR, 6, 1), comp_sport=link,
+            )
+            for index in range(STAGES_AMOUNT)
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(username='abcdef'))
+
+    def get(self, url, **query):
+        """Read an API page capturing its queries.
+
+        Args:
+            url (str): API endpoint.
+            query: query parameters.
+
+        Returns:
+            tuple: response and captured queries.
+        """
+        queries = CaptureQueriesContext(connection)
+        with queries:
+            response = self.client.get(url, query)
+        return response, queries
+
+    def test_sparse(self):
+        """Test output and selected columns are trimmed to the fields in both modes."""
+        for mode in (config.FLAT, 'hyperlinked'):
+            with self.subTest(mode=mode):
+                response, queries = self.get(
+                    STAGES_URL, mode=mode, fields='id,name,stage_date,bet_coefficient',
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    set(response.data[PAGE][0]), {'id', NAME, 'stage_date', 'bet_coefficient'},
+                )
+                select = [
+                    query['sql']
+                    for query in queries.captured_queries
+                    if 'crud_api' in query['sql']
+                ]
+                self.assertNotIn('place', select[-1])
+
+    def test_expand_nested(self):
+        """Test path expansion nests objects loaded with a join."""
+        response, queries = self.get(STAGES_URL, expand='comp_sport.competition_id')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stage = response.data[PAGE][0]
+        competition = stage[COMP_SPORT]['competition_id']
+        self.assertEqual(competition[NAME], self.competition.name)
+        _, fewer = self.get(STAGES_URL, expand='comp_sport.competition_id', page_size=1)
+        self.assertEqual(len(queries), len(fewer))
+
+    def test_expand_many(self):
+        """Test to-many relations are expanded into lists."""
+        response, _ = self.get('/api/competitions/', mode=config.FLAT, expand='sports')
+        sports = response.data[PAGE][0]['sports']
+        self.assertEqual(sports[0][NAME], 'chess')
+
+    def test_unknown(self):
+        """Test unknown fields and paths are rejected."""
+        response, _ = self.get(STAGES_URL, fields='missing')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response, _ = self.get(STAGES_URL, expand=NAME)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,156 @@
+"""Module for testing the fixtures importer."""
+import json
+import tempfile
+from datetime import date
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from competitions_app import counters, models
+
+COMPETITIONS_CSV = """name,competition_start,competition_end
+Olympics,2030-07-01,2030-07-20
+Cup,2030-09-01,2030-09-10
+"""
+INVALID_COMPETITIONS_CSV = """name,competition_start,competition_end
+,2030-07-01,2030-07-20
+Derby,2030-13-01,2030-07-20
+Flash,2030-07-01,2030-07-01
+Olympics,2030-07-01,2030-07-20
+"""
+SPORTS_JSONL = '{"name": "Chess"}\n\n{"name": "Rowing", "description": "Boats"}\n'
+OLYMPICS = 'Olympics'
+CUP = 'Cup'
+CHESS = 'Chess'
+YEAR = 2030
+PRICED_ODDS = 4.2
+OPENING_DATE = '2030-07-10'
+
+
+def stage(name, stage_date, competition, sport=CHESS, **fields):
+    """Build a stage record.
+
+    Args:
+        name (str): stage name.
+        stage_date (str): stage date in ISO format.
+        competition (str): competition name.
+        sport (str): sport name.
+        fields: other record fields.
+
+    Returns:
+        dict: stage record.
+    """
+    return {
+        'name': name, 'stage_date': stage_date, 'competition': competition, 'sport': sport,
+        **fields,
+    }
+
+
+STAGES = (
+    stage('Final', OPENING_DATE, OLYMPICS),
+    stage('Heat', '2030-07-11', OLYMPICS, 'Rowing'),
+    stage('Semi', '2030-09-02', CUP),
+    stage('Early', '2030-06-30', OLYMPICS),
+    stage('Late', '2030-09-11', CUP),
+    stage('Lost', OPENING_DATE, 'Unknown'),
+    stage('Priced', '2030-07-12', OLYMPICS, bet_coefficient=PRICED_ODDS),
+)
+VALID_STAGES = 4
+INVALID_STAGES = (
+    {'stage_date': OPENING_DATE, 'competition': OLYMPICS, 'sport': CHESS},
+    stage(' ', OPENING_DATE, OLYMPICS),
+    stage('N' * (models.MAX_LENGTH_NAME + 1), OPENING_DATE, OLYMPICS),
+    stage('Huge', OPENING_DATE, OLYMPICS, bet_coefficient=1000),
+    stage('Missing', OPENING_DATE, OLYMPICS, bet_coefficient='nan'),
+    stage('Word', OPENING_DATE, OLYMPICS, bet_coefficient='high'),
+)
+
+
+class TestImportFixtures(TestCase):
+    """Test case for import_fixtures command.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Write fixture files."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.paths = {
+            'competitions': Path(directory.name, 'competitions.csv'),
+            'sports': Path(directory.name, 'sports.jsonl'),
+            'stages': Path(directory.name, 'stages.ndjson'),
+        }
+        self.paths['competitions'].write_text(COMPETITIONS_CSV)
+        self.paths['sports'].write_text(SPORTS_JSONL)
+        self.paths['stages'].write_text(
+            ''.join(f'{json.dumps(stage)}\n' for stage in STAGES),
+        )
+
+    def import_fixtures(self):
+        """Run the command with small chunks.
+
+        Returns:
+            tuple[str, str]: command output and errors.
+        """
+        out, err = StringIO(), StringIO()
+        call_command(
+            'import_fixtures',
+            *(f'--{name}={path}' for name, path in self.paths.items()),
+            '--chunk-size=2',
+            '--seed=1',
+            stdout=out,
+            stderr=err,
+        )
+        return out.getvalue(), err.getvalue()
+
+    def test_import(self):
+        """Test valid rows are imported, links are shared and invalid rows are reported."""
+        out, err = self.import_fixtures()
+        self.assertIn(f'Stages imported: {VALID_STAGES}, skipped: 3', out)
+        self.assertIn('Record 4: Stage cannot be held before the competition start.', err)
+        self.assertIn('Unknown competition', err)
+        self.assertEqual(models.Competition.objects.count(), 2)
+        self.assertEqual(models.Sport.objects.get(name='Rowing').description, 'Boats')
+        self.assertEqual(models.CompetitionsSports.objects.count(), 3)
+        final = models.Stage.objects.select_related('comp_sport__competition_id').get(name='Final')
+        self.assertEqual(final.stage_date, date(YEAR, 7, 10))
+        self.assertEqual(final.comp_sport.competition_id.name, OLYMPICS)
+        self.assertEqual(str(models.Stage.objects.get(name='Priced').bet_coefficient), '4.20')
+        self.assertEqual(counters.get_exact_counts()[models.Stage], VALID_STAGES)
+
+    def test_repeated(self):
+        """Test catalog rows are matched by name on a second run."""
+        self.import_fixtures()
+        out, _ = self.import_fixtures()
+        self.assertIn('Competitions created: 0', out)
+        self.assertEqual(models.Sport.objects.count(), 2)
+        self.assertEqual(models.CompetitionsSports.objects.count(), 3)
+
+    def test_invalid_fields(self):
+        """Test bad names and coefficients are reported per record and the rest is imported."""
+        self.paths['stages'].write_text(
+            ''.join(f'{json.dumps(stage)}\n' for stage in (*INVALID_STAGES, STAGES[0])),
+        )
+        out, err = self.import_fixtures()
+        self.assertIn(f'Stages imported: 1, skipped: {len(INVALID_STAGES)}', out)
+        self.assertIn('Record 1: Field name is required.', err)
+        self.assertIn('Record 2: Field name is required.', err)
+        self.assertIn('Record 3: Field name is longer than', err)
+        self.assertIn('Record 4: Bet coefficient must be less than 1000.', err)
+        self.assertIn('Record 5: Bet coefficient must be a number.', err)
+        self.assertIn('Record 6: Bet coefficient must be a number.', err)
+        self.assertEqual(models.Stage.objects.get().name, 'Final')
+
+    def test_invalid_competitions(self):
+        """Test bad competition records are reported per record and the rest is imported."""
+        self.paths['competitions'].write_text(INVALID_COMPETITIONS_CSV)
+        out, err = self.import_fixtures()
+        self.assertIn('Competitions created: 1, skipped: 3', out)
+        self.assertIn('Record 1: Field name is required.', err)
+        self.assertIn('Record 2: ', err)
+        self.assertIn('Record 3: Competition cannot end before its start.', err)
+        self.assertEqual(models.Competition.objects.get().name, OLYMPICS)
@@ -0,0 +1,66 @@
+"""Module for testing versioned template fragments."""
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.client import Client
+from django.urls import reverse
+
+from competitions_app import fragments, models
+
+CHESS = 'chess'
+STAGE = 'stage'
+BET_OFFER = 'Хотите сделать ставку на игру?'
+
+
+class TestFragments(TestCase):
+    """Test case for fragments of catalog and entity pages.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Reset the cache and log in a client."""
+        cache.clear()
+        self.user = User.objects.create(username='abcdef')
+        self.client_model = models.Client.objects.create(user=self.user)
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def test_version(self):
+        """Test version follows modification time and membership of the objects."""
+        sport = models.Sport.objects.create(name=CHESS)
+        other_sport = models.Sport.objects.create(name='go')
+        version = fragments.get_version([sport])
+        self.assertEqual(fragments.get_version([sport]), version)
+        self.assertNotEqual(fragments.get_version([sport, other_sport]), version)
+        sport.save()
+        self.assertNotEqual(fragments.get_version([sport]), version)
+
+    def test_catalog_fragment(self):
+        """Test catalog markup is reused until a shown object is saved."""
+        sport = models.Sport.objects.create(name=CHESS)
+        url = reverse('sports')
+        self.assertContains(self.client.get(url), CHESS)
+        models.Sport.objects.filter(pk=sport.pk).update(name='checkers')
+        self.assertContains(self.client.get(url), CHESS)
+        sport.refresh_from_db()
+        sport.save()
+        self.assertContains(self.client.get(url), 'checkers')
+        models.Sport.objects.create(name='go')
+        self.assertContains(self.client.get(url), 'go')
+
+    def test_stage_user_part(self):
+        """Test bet flag of the stage page renders per user around the shared fragment."""
+        stage = models.Stage.objects.create(name='final')
+        url = f'{reverse(STAGE)}?id={stage.pk}'
+        self.assertContains(self.client.get(url), BET_OFFER)
+        other_user = User.objects.create(username='ghijkl')
+        models.StageClient.objects.create(
+            stages=stage, client=models.Client.objects.create(user=other_user),
+        )
+        other_client = Client()
+        other_client.force_login(other_user)
+        response = other_client.get(url)
+        self.assertContains(response, 'final')
+        self.assertNotContains(response, BET_OFFER)
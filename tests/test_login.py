@@ -0,0 +1,73 @@
+"""Module for testing the login flow."""
+from unittest import mock
+
+from django.contrib.auth import base_user
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from competitions_app import config
+
+LOGIN = 'login'
+
+
+class TestLogin(TestCase):
+    """Test case for the single hash login.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create a user with a password."""
+        self.user = User.objects.create_user(config.TEST_USERNAME, password=config.TEST_PASSWORD)
+        self.client = Client()
+
+    def log_in(self, password=config.TEST_PASSWORD):
+        """Post the login form and capture queries.
+
+        Args:
+            password (str): entered password.
+
+        Returns:
+            tuple: response and captured SQL statements.
+        """
+        queries = CaptureQueriesContext(connection)
+        with queries:
+            response = self.client.post(
+                reverse(LOGIN), {'username': config.TEST_USERNAME, 'password': password},
+            )
+        return response, [query['sql'] for query in queries.captured_queries]
+
+    def test_single_hash(self):
+        """Test password is hashed once per login."""
+        patcher = mock.patch.object(base_user, 'check_password', wraps=base_user.check_password)
+        check_password = patcher.start()
+        self.addCleanup(patcher.stop)
+        response, _ = self.log_in()
+        self.assertRedirects(response, reverse(config.PROFILE), fetch_redirect_response=False)
+        self.assertEqual(check_password.call_count, 1)
+
+    def test_targeted_writes(self):
+        """Test token is created on the first login only and users get last_login only."""
+        _, statements = self.log_in()
+        self.assertEqual(Token.objects.filter(user=self.user).count(), 1)
+        self.client.logout()
+        _, statements = self.log_in()
+        user_updates = [sql for sql in statements if sql.startswith('UPDATE "auth_user"')]
+        self.assertEqual(len(user_updates), 1)
+        self.assertIn('SET "last_login"', user_updates[0])
+        self.assertNotIn('"password"', user_updates[0])
+        self.assertFalse(any('INSERT INTO "authtoken_token"' in sql for sql in statements))
+
+    def test_wrong_password(self):
+        """Test wrong password keeps the user on the login page."""
+        response, _ = self.log_in('wrong password')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(Token.objects.exists())
+        self.assertNotIn('_auth_user_id', self.client.session)
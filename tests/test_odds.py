@@ -0,0 +1,89 @@
+"""Module for testing the odds generator."""
+from datetime import date
+
+import numpy as np
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.test.client import Client as DjangoTestClient
+from rest_framework import status
+
+from competitions_app import config, odds
+from competitions_app.models import Stage
+
+SEED = 42
+SAMPLE = 100000
+STAGES_AMOUNT = 20
+TOLERANCE = 0.01
+
+
+def constant(generator, size):
+    """Distribution returning the same coefficient.
+
+    Args:
+        generator (Generator): NumPy random generator.
+        size (int): amount of coefficients.
+
+    Returns:
+        ndarray: coefficients.
+    """
+    return np.full(size, 2)
+
+
+class TestOddsGenerator(TestCase):
+    """Test case for the vectorized odds generator.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def test_seeded(self):
+        """Test seeded generators draw the same coefficients."""
+        first = odds.OddsGenerator(SEED).generate(STAGES_AMOUNT)
+        self.assertEqual(first, odds.OddsGenerator(SEED).generate(STAGES_AMOUNT))
+        self.assertEqual(first, [round(coefficient, 2) for coefficient in first])
+
+    def test_distribution(self):
+        """Test 70% of coefficients fall into 1-3 and the rest into 3-12."""
+        coefficients = np.array(odds.OddsGenerator(SEED).generate(SAMPLE))
+        self.assertGreaterEqual(coefficients.min(), 1)
+        self.assertLessEqual(coefficients.max(), config.TWELVE)
+        low_share = (coefficients < odds.LOW_ODDS[1]).mean()
+        self.assertAlmostEqual(low_share, config.POINT_SEVEN, delta=TOLERANCE)
+
+    def test_pluggable(self):
+        """Test custom distribution is used."""
+        generator = odds.OddsGenerator(distribution=constant)
+        self.assertEqual(generator.generate(3), [2, 2, 2])
+        self.assertEqual(generator.draw(), 2)
+
+    def test_bulk_create(self):
+        """Test bulk creation prices the batch reproducibly."""
+        stages = Stage.objects.bulk_create(
+            [
+                Stage(name=f'stage {index}', stage_date=date(config.TEST_YEAR, 8, 4))
+                for index in range(STAGES_AMOUNT)
+            ],
+            odds_generator=odds.OddsGenerator(SEED),
+        )
+        expected = odds.OddsGenerator(SEED).generate(STAGES_AMOUNT)
+        self.assertEqual([float(stage.bet_coefficient) for stage in stages], expected)
+
+    def test_admin_reprice(self):
+        """Test admin action repricing stages with one update."""
+        Stage.objects.bulk_create(
+            [Stage(name='a', stage_date=date(config.TEST_YEAR, 8, 4))],
+            odds_generator=odds.OddsGenerator(distribution=constant),
+        )
+        admin = User.objects.create_superuser(
+            username=config.TEST_USERNAME, password=config.TEST_SUPERUSERPASSWORD,
+        )
+        web_client = DjangoTestClient()
+        web_client.force_login(admin)
+        stage = Stage.objects.get()
+        response = web_client.post('/admin/competitions_app/stage/', {
+            'action': 'reprice',
+            '_selected_action': [str(stage.id)],
+        })
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        stage.refresh_from_db()
+        self.assertTrue(1 <= stage.bet_coefficient <= config.TWELVE)
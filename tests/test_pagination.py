@@ -0,0 +1,196 @@
+"""Module for testing keyset pagination."""
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.test.client import Client as DjangoTestClient
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from competitions_app import config, models
+from competitions_app.pagination import KeysetPaginator, get_keyset_ordering
+
+PAGE_SIZE = 4
+STAGES_AMOUNT = 11
+SAME_DATE_STAGES = 3
+SPORTS_URL = '/api/sports/'
+PAGE_RESULTS = 'results'
+NAME = 'name'
+ID = 'id'
+NEXT = 'next'
+
+
+class TestKeysetPaginator(TestCase):
+    """Test case for KeysetPaginator.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create stages, some of them share the date and the name."""
+        start = date(config.TEST_YEAR, 8, 1)
+        for index in range(STAGES_AMOUNT):
+            models.Stage.objects.create(
+                name='same' if index < SAME_DATE_STAGES else f'stage {index:02}',
+                stage_date=start + timedelta(days=max(index - SAME_DATE_STAGES, 0)),
+            )
+        self.expected = list(models.Stage.objects.order_by('stage_date', NAME, ID))
+        self.paginator = KeysetPaginator(models.Stage.objects.all(), PAGE_SIZE)
+
+    def test_ordering(self):
+        """Test primary key is appended as a tiebreaker."""
+        self.assertEqual(get_keyset_ordering(models.Stage), ['stage_date', NAME, ID])
+        self.assertEqual(get_keyset_ordering(models.Sport), [NAME, ID])
+        self.assertEqual(
+            get_keyset_ordering(models.CompetitionsSports),
+            ['competition_id_id', 'sport_id_id', ID],
+        )
+
+    def test_walk_forward_and_back(self):
+        """Test walking through all pages in both directions."""
+        page = self.paginator.get_page()
+        self.assertFalse(page.has_previous)
+        forward = list(page)
+        while page.has_next:
+            page = self.paginator.get_page(page.next_cursor)
+            forward.extend(page)
+        self.assertEqual(forward, self.expected)
+
+        backward = list(page)
+        while page.has_previous:
+            page = self.paginator.get_page(page.previous_cursor)
+            backward = list(page) + backward
+        self.assertEqual(backward, self.expected)
+
+    def test_single_query(self):
+        """Test any page costs one query."""
+        cursor = self.paginator.get_page().next_cursor
+        with self.assertNumQueries(1):
+            page = self.paginator.get_page(cursor)
+        self.assertEqual(list(page), self.expected[PAGE_SIZE:PAGE_SIZE * 2])
+
+    def test_invalid_cursor(self):
+        """Test invalid cursor falls back to the first page."""
+        for cursor in ('abc', 'eyJ2IjogMX0=', 'eyJ2IjogWzEsIDIsIDNdLCAiZCI6ICJuZXh0In0='):
+            with self.subTest(cursor):
+                page = self.paginator.get_page(cursor)
+                self.assertEqual(list(page), self.expected[:PAGE_SIZE])
+
+    def test_nullable_ordering(self):
+        """Test NULL ordering values are paginated as PostgreSQL sorts them."""
+        for index in range(STAGES_AMOUNT):
+            start = date(config.TEST_YEAR, 8, index + 1) if index % 2 else None
+            models.Competition.objects.create(
+                name=f'competition {index}', competition_start=start, competition_end=None,
+            )
+        expected = list(models.Competition.objects.order_by(
+            *get_keyset_ordering(models.Competition),
+        ))
+        paginator = KeysetPaginator(models.Competition.objects.all(), PAGE_SIZE)
+        page = paginator.get_page()
+        collected = list(page)
+        while page.has_next:
+            page = paginator.get_page(page.next_cursor)
+            collected.extend(page)
+        self.assertEqual(collected, expected)
+
+
+class TestCatalogPagination(TestCase):
+    """Test case for keyset pagination in catalog views.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def test_cursor_in_context(self):
+        """Test catalog exposes cursors and follows them."""
+        for index in range(config.CATALOG_PAGE_SIZE + 1):
+            models.Sport.objects.create(name=f'sport {index:02}')
+        user = User.objects.create(username=config.TEST_USERNAME, password=config.TEST_PASSWORD)
+        client = DjangoTestClient()
+        client.force_login(user)
+
+        page = client.get('/sports/').context['sports_list']
+        self.assertEqual(len(page), config.CATALOG_PAGE_SIZE)
+        self.assertTrue(page.has_next)
+
+        page = client.get('/sports/', {config.CURSOR: page.next_cursor}).context['sports_list']
+        self.assertEqual([sport.name for sport in page], ['sport 10'])
+        self.assertFalse(page.has_next)
+        self.assertTrue(page.has_previous)
+
+
+class TestApiPagination(TestCase):
+    """Test case for the REST API pagination.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create sports and an authenticated API client."""
+        models.Sport.objects.bulk_create([
+            models.Sport(name=f'sport {index:02}') for index in range(STAGES_AMOUNT)
+        ])
+        self.api_client = APIClient()
+        self.api_client.force_authenticate(
+            User.objects.create(username=config.TEST_USERNAME, password=config.TEST_PASSWORD),
+        )
+
+    def get(self, url):
+        """Request a list.
+
+        Args:
+            url (str): list URL.
+
+        Returns:
+            dict | list: response data.
+        """
+        response = self.api_client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_walk(self):
+        """Test following next links returns every sport once in order."""
+        page = self.get(f'{SPORTS_URL}?page_size={PAGE_SIZE}')
+        self.assertIsNone(page['previous'])
+        names = [sport[NAME] for sport in page[PAGE_RESULTS]]
+        while page[NEXT]:
+            page = self.get(page[NEXT])
+            names.extend(sport[NAME] for sport in page[PAGE_RESULTS])
+        expected = list(models.Sport.objects.order_by(NAME).values_list(NAME, flat=True))
+        self.assertEqual(names, expected)
+        self.assertIsNotNone(page['previous'])
+
+    def test_walk_links(self):
+        """Test following next links returns every competition sport link once."""
+        start = date(config.TEST_YEAR, 8, 1)
+        for index in range(SAME_DATE_STAGES):
+            competition = models.Competition.objects.create(
+                name=f'competition {index}',
+                competition_start=start - timedelta(days=index),
+                competition_end=start + timedelta(days=1),
+            )
+            competition.sports.set(models.Sport.objects.all())
+        page = self.get(f'/api/competitionssports/?mode=flat&page_size={PAGE_SIZE + 1}')
+        ids = [link[ID] for link in page[PAGE_RESULTS]]
+        while page[NEXT]:
+            page = self.get(page[NEXT])
+            ids.extend(link[ID] for link in page[PAGE_RESULTS])
+        expected = models.CompetitionsSports.objects.order_by(
+            'competition_id_id', 'sport_id_id', ID,
+        ).values_list(ID, flat=True)
+        self.assertEqual(ids, [str(pk) for pk in expected])
+        self.assertEqual(len(ids), SAME_DATE_STAGES * STAGES_AMOUNT)
+
+    @override_settings(API_PAGE_SIZE=2, API_MAX_PAGE_SIZE=PAGE_SIZE)
+    def test_page_size(self):
+        """Test default page size, the limit and invalid sizes."""
+        self.assertEqual(len(self.get(SPORTS_URL)[PAGE_RESULTS]), 2)
+        self.assertEqual(len(self.get(f'{SPORTS_URL}?page_size=100')[PAGE_RESULTS]), PAGE_SIZE)
+        self.assertEqual(len(self.get(f'{SPORTS_URL}?page_size=many')[PAGE_RESULTS]), 2)
+
+    def test_opt_out(self):
+        """Test explicit opt out returns the whole list."""
+        self.assertEqual(len(self.get(f'{SPORTS_URL}?pagination=off')), STAGES_AMOUNT)
@@ -0,0 +1,104 @@
+"""Module for testing the pooled database backend."""
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from competitions_app import config
+from competitions_app.db.base import get_pool_stats
+from tests.app.cases import CommittingTestCase
+
+CONNECTIONS = 'connections_num'
+CYCLES = 20
+TERMINATE_OTHERS_SQL = """
+    SELECT pg_terminate_backend(pid) FROM pg_stat_activity
+    WHERE datname = current_database() AND pid <> pg_backend_pid()
+"""
+
+
+def run_query(sql) -> list:
+    """Run a statement on the default connection.
+
+    Args:
+        sql (str): statement.
+
+    Returns:
+        list: fetched rows.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
+        return cursor.fetchall()
+
+
+class TestPool(CommittingTestCase):
+    """Test case for checkouts of pooled connections.
+
+    Args:
+        CommittingTestCase: TestCase committing to the database.
+    """
+
+    def cycle(self) -> None:
+        """Check a connection out, use it and return it to the pool."""
+        run_query('SELECT 1')
+        connection.close()
+
+    def test_reuse(self):
+        """Test reconnecting reuses physical connections."""
+        self.cycle()
+        opened = get_pool_stats()[CONNECTIONS]
+        for _ in range(CYCLES):
+            self.cycle()
+        self.assertEqual(get_pool_stats()[CONNECTIONS], opened)
+
+    def test_search_path(self):
+        """Test pooled connections keep the search path of the startup options."""
+        for _ in range(CYCLES):
+            self.assertEqual(run_query('SHOW search_path'), [('public,crud_api',)])
+            connection.close()
+
+    def test_health_check(self):
+        """Test broken idle connections are replaced on checkout."""
+        connection.close_pool()
+        self.cycle()
+        connection.pool.wait()
+        run_query(TERMINATE_OTHERS_SQL)
+        connection.close()
+        run_query(TERMINATE_OTHERS_SQL)
+        for _ in range(CYCLES):
+            self.cycle()
+        self.assertGreater(get_pool_stats()['connections_lost'], 0)
+
+
+class TestPoolStats(TestCase):
+    """Test case for the pool statistics endpoint.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def request_stats(self, is_staff) -> object:
+        """Request pool statistics with a token of a user.
+
+        Args:
+            is_staff (bool): whether the user is an admin.
+
+        Returns:
+            object: response.
+        """
+        user = User.objects.create(username=config.TEST_USERNAME, is_staff=is_staff)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=user).key}')
+        return client.get(reverse('pool'))
+
+    def test_admin(self):
+        """Test admins read statistics of the default pool."""
+        response = self.request_stats(is_staff=True)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('pool_max', response.json()['default'])
+
+    def test_forbidden(self):
+        """Test other users are forbidden."""
+        self.assertEqual(self.request_stats(is_staff=False).status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,71 @@
+"""Module for testing API renderers and response compression."""
+import gzip
+import json
+from datetime import date
+
+import brotli
+import msgpack
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from competitions_app import config, models
+
+STAGES_URL = '/api/stages/?mode=flat'
+STAGES_AMOUNT = 50
+CONTENT_ENCODING = 'Content-Encoding'
+
+
+class TestRenderers(TestCase):
+    """Test case for content negotiation and compression.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create stages and authenticate a user."""
+        models.Stage.objects.bulk_create(
+            models.Stage(name=f'stage {index}', stage_date=date(config.TEST_YEAR, 6, 1))
+            for index in range(STAGES_AMOUNT)
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(username='abcdef'))
+        self.expected = json.loads(self.client.get(STAGES_URL).content)
+
+    def test_json(self):
+        """Test orjson output keeps decimals and ids as strings."""
+        stage = self.expected['results'][0]
+        self.assertIsInstance(stage['bet_coefficient'], str)
+        self.assertEqual(str(models.Stage.objects.get(id=stage['id']).id), stage['id'])
+
+    def test_msgpack(self):
+        """Test MessagePack is chosen by the Accept header and holds the same data."""
+        response = self.client.get(STAGES_URL, HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        self.assertEqual(msgpack.unpackb(response.content), self.expected)
+
+    def test_brotli(self):
+        """Test large responses are compressed with brotli when accepted."""
+        response = self.client.get(STAGES_URL, HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response[CONTENT_ENCODING], 'br')
+        self.assertEqual(json.loads(brotli.decompress(response.content)), self.expected)
+        self.assertTrue(response['ETag'].startswith('W/'))
+
+    def test_gzip(self):
+        """Test gzip is used for clients without brotli."""
+        response = self.client.get(STAGES_URL, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response[CONTENT_ENCODING], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(response.content)), self.expected)
+
+    def test_small_uncompressed(self):
+        """Test small responses are left as they are."""
+        response = self.client.get('/api/sports/', HTTP_ACCEPT_ENCODING='br')
+        self.assertFalse(response.has_header(CONTENT_ENCODING))
+
+    def test_html_gzip(self):
+        """Test HTML pages keep gzip with BREACH padding even if brotli is accepted."""
+        self.client.force_login(User.objects.get())
+        response = self.client.get('/stages/', HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response[CONTENT_ENCODING], 'gzip')
+        self.assertIn(b'stage 0', gzip.decompress(response.content))
@@ -0,0 +1,211 @@
+"""Module for testing the replica router."""
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.http import HttpResponse
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.client import Client, RequestFactory
+from django.utils import timezone
+
+from competitions_app import async_caching, caching, config, models, routers
+from competitions_app.middleware import PRIMARY_COOKIE, ReplicaMiddleware
+from tests.app.cases import CommittingTestCase
+
+REPLICA = 'replica'
+STAKE = Decimal(100)
+
+
+@override_settings(DATABASE_REPLICAS=(REPLICA,))
+class TestReplicaRouter(SimpleTestCase):
+    """Test case for read routing decisions.
+
+    Args:
+        SimpleTestCase: SimpleTestCase from Django.
+    """
+
+    def setUp(self):
+        """Create a router and forget request state afterwards."""
+        self.router = routers.ReplicaRouter()
+        self.addCleanup(routers.finish_request)
+
+    def test_request_reads(self):
+        """Test reads of a request go to the replica, writes to the primary."""
+        routers.start_request(pinned=False)
+        self.assertEqual(self.router.db_for_read(models.Sport), REPLICA)
+        self.assertEqual(self.router.db_for_write(models.Sport), DEFAULT_DB_ALIAS)
+
+    def test_outside_request(self):
+        """Test reads outside of requests go to the primary."""
+        self.assertEqual(self.router.db_for_read(models.Sport), DEFAULT_DB_ALIAS)
+
+    def test_pinned(self):
+        """Test reads of a client which has recently written go to the primary."""
+        routers.start_request(pinned=True)
+        self.assertEqual(self.router.db_for_read(models.Sport), DEFAULT_DB_ALIAS)
+
+    def test_own_write(self):
+        """Test reads after a write of the same request go to the primary."""
+        routers.start_request(pinned=False)
+        self.router.db_for_write(models.StageClient)
+        self.assertEqual(self.router.db_for_read(models.StageClient), DEFAULT_DB_ALIAS)
+        self.assertTrue(routers.finish_request())
+
+    def test_identity(self):
+        """Test users are read from the primary."""
+        routers.start_request(pinned=False)
+        self.assertEqual(self.router.db_for_read(User), DEFAULT_DB_ALIAS)
+
+    def test_migrate(self):
+        """Test only the primary is migrated."""
+        self.assertTrue(self.router.allow_migrate(DEFAULT_DB_ALIAS, 'competitions_app'))
+        self.assertFalse(self.router.allow_migrate(REPLICA, 'competitions_app'))
+
+
+@override_settings(DATABASE_REPLICAS=(REPLICA,))
+class TestReplicaMiddleware(SimpleTestCase):
+    """Test case for the sticky cookie.
+
+    Args:
+        SimpleTestCase: SimpleTestCase from Django.
+    """
+
+    def respond(self, write=False, cookies=None, method='get') -> tuple:
+        """Pass a request through the middleware.
+
+        Args:
+            write (bool): whether the view writes.
+            cookies (dict): request cookies.
+            method (str): request method.
+
+        Returns:
+            tuple: response and the alias the view reads from.
+        """
+        aliases = []
+
+        def view(request):
+            if write:
+                routers.ReplicaRouter().db_for_write(models.Sport)
+            aliases.append(routers.ReplicaRouter().db_for_read(models.Sport))
+            return HttpResponse()
+
+        request = getattr(RequestFactory(), method)('/')
+        request.COOKIES.update(cookies or {})
+        return ReplicaMiddleware(view)(request), aliases[0]
+
+    def test_read(self):
+        """Test reading requests use the replica and set no cookie."""
+        response, alias = self.respond()
+        self.assertEqual(alias, REPLICA)
+        self.assertNotIn(PRIMARY_COOKIE, response.cookies)
+
+    def test_write(self):
+        """Test writing requests set the sticky cookie."""
+        response, _ = self.respond(write=True)
+        self.assertEqual(response.cookies[PRIMARY_COOKIE]['max-age'], 5)
+
+    def test_sticky(self):
+        """Test requests with the sticky cookie read from the primary."""
+        _, alias = self.respond(cookies={PRIMARY_COOKIE: '1'})
+        self.assertEqual(alias, DEFAULT_DB_ALIAS)
+
+    def test_unsafe_method(self):
+        """Test writing methods read from the primary before their first write."""
+        for method in ('post', 'put', 'patch', 'delete'):
+            with self.subTest(method=method):
+                _, alias = self.respond(method=method)
+                self.assertEqual(alias, DEFAULT_DB_ALIAS)
+
+    @override_settings(REPLICA_STICKY_SECONDS=0)
+    def test_disabled(self):
+        """Test a zero window sets no cookie."""
+        response, _ = self.respond(write=True)
+        self.assertNotIn(PRIMARY_COOKIE, response.cookies)
+
+
+@override_settings(DATABASE_REPLICAS=(REPLICA,))
+class TestTransactionReads(CommittingTestCase):
+    """Test case for reads inside transactions of the primary.
+
+    Args:
+        CommittingTestCase: TestCase committing to the database.
+    """
+
+    def test_atomic(self):
+        """Test reads inside a transaction go to the primary."""
+        router = routers.ReplicaRouter()
+        routers.start_request(pinned=False)
+        self.addCleanup(routers.finish_request)
+        with transaction.atomic():
+            self.assertEqual(router.db_for_read(models.Sport), DEFAULT_DB_ALIAS)
+        self.assertEqual(router.db_for_read(models.Sport), REPLICA)
+
+
+@override_settings(DATABASE_REPLICAS=(REPLICA,))
+class TestCacheLoads(CommittingTestCase):
+    """Test case for cache misses of requests reading from replicas.
+
+    Loads must go to the primary, the replica alias does not exist in tests.
+
+    Args:
+        CommittingTestCase: TestCase committing to the database.
+    """
+
+    def setUp(self):
+        """Create a competition with a sport and an upcoming stage."""
+        cache.clear()
+        today = timezone.localdate()
+        self.competition = models.Competition.objects.create(
+            name='competition', competition_start=today, competition_end=today + timedelta(days=1),
+        )
+        self.sport = models.Sport.objects.create(name='sport')
+        link = models.CompetitionsSports.objects.create(
+            competition_id=self.competition, sport_id=self.sport,
+        )
+        self.stage = models.Stage.objects.create(name='stage', stage_date=today, comp_sport=link)
+        self.addCleanup(routers.finish_request)
+
+    def test_sync(self):
+        """Test sync cache loads read from the primary."""
+        routers.start_request(pinned=False)
+        self.assertEqual(caching.get_object(models.Sport, self.sport.pk), self.sport)
+        self.assertEqual(caching.get_competition_sports(self.competition), [self.sport])
+        self.assertEqual(
+            caching.get_sport_stages(self.sport), [(self.competition, [self.stage])],
+        )
+
+    async def test_async(self):
+        """Test async cache loads read from the primary."""
+        routers.start_request(pinned=False)
+        self.assertEqual(await async_caching.aget_object(models.Sport, self.sport.pk), self.sport)
+        self.assertEqual(
+            await async_caching.aget_competition_sports(self.competition), [self.sport],
+        )
+        self.assertEqual(
+            await async_caching.aget_sport_stages(self.sport), [(self.competition, [self.stage])],
+        )
+
+
+class TestBetStickiness(TestCase):
+    """Test case for the sticky cookie after placing a bet.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def test_bet(self):
+        """Test placing a bet sets the sticky cookie."""
+        user = User.objects.create(username=config.TEST_USERNAME)
+        bettor = models.Client.objects.create(user=user)
+        models.WalletEntry.objects.create(
+            client_id=bettor.id, amount=STAKE, kind=models.EntryKind.DEPOSIT,
+        )
+        stage = models.Stage.objects.create(name='stage', stage_date=date(config.TEST_YEAR, 8, 4))
+        web_client = Client()
+        web_client.force_login(user)
+        response = web_client.post(f'/bet/?id={stage.id}', {'bet_amount': STAKE})
+        self.assertIn(PRIMARY_COOKIE, response.cookies)
+        response = web_client.get('/stages/')
+        self.assertNotIn(PRIMARY_COOKIE, response.cookies)
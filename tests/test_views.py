@@ -1,10 +1,14 @@
 """Moduel for testing views."""
-from datetime import date
+from datetime import date, timedelta
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
 from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 
 from competitions_app import config, models
@@ -97,3 +101,118 @@ no_auth_pages_methods = {
     f'test_{page}': create_redirect_page_test(page) for _, page, _ in auth_pages
 }
 TestNoAuthPages = type('TestNoAuthPages', (TestCase,), no_auth_pages_methods)
+
+
+class TestSportView(TestCase):
+    """Test case for sport page queries.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create the sport and log in."""
+        self.sport = models.Sport.objects.create(name='football')
+        user = User.objects.create(username=config.TEST_USERNAME, password=config.TEST_PASSWORD)
+        self.client = Client()
+        self.client.force_login(user)
+        self.today = timezone.localdate()
+
+    def add_competitions(self, amount):
+        """Add competitions with a past and an upcoming stage of the sport.
+
+        Args:
+            amount (int): amount of competitions.
+        """
+        for index in range(amount):
+            competition = models.Competition.objects.create(
+                name=f'competition {index}',
+                competition_start=self.today - timedelta(days=1),
+                competition_end=self.today + timedelta(days=config.FIFTEEN),
+            )
+            link = models.CompetitionsSports.objects.create(
+                competition_id=competition,
+                sport_id=self.sport,
+            )
+            models.Stage.objects.create(
+                name='past', stage_date=self.today - timedelta(days=1), comp_sport=link,
+            )
+            models.Stage.objects.create(
+                name=f'upcoming {index}', stage_date=self.today, comp_sport=link,
+            )
+
+    def get_page(self):
+        """Request the sport page.
+
+        Returns:
+            tuple[HttpResponse, int]: response and amount of executed queries.
+        """
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse('sport'), {'id': self.sport.id})
+            query_count = len(captured)
+        return response, query_count
+
+    def test_constant_queries(self):
+        """Test query count does not depend on competitions amount."""
+        self.add_competitions(1)
+        _, single_queries = self.get_page()
+        self.add_competitions(config.TWELVE)
+        response, many_queries = self.get_page()
+        self.assertEqual(single_queries, many_queries)
+
+        groups = response.context['query_stages']
+        self.assertEqual(len(groups), config.TWELVE + 1)
+        for _, stages in groups:
+            self.assertEqual([stage.stage_date for stage in stages], [self.today])
+
+
+class TestClientResolution(TestCase):
+    """Test case for the client resolved once per request and cached per session.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create a client with a stage and log in."""
+        cache.clear()
+        user = User.objects.create(username=config.TEST_USERNAME, password=config.TEST_PASSWORD)
+        self.client_model = models.Client.objects.create(user=user)
+        self.stage = models.Stage.objects.create(name='name', stage_date=timezone.localdate())
+        self.client = Client()
+        self.client.force_login(user)
+
+    def count_queries(self, url, object_id=None) -> tuple[int, int]:
+        """Request the page and count all queries and client queries.
+
+        Args:
+            url (str): page URL.
+            object_id: id of the shown object.
+
+        Returns:
+            tuple[int, int]: amount of queries and of queries reading the client table.
+        """
+        queries = CaptureQueriesContext(connection)
+        with queries:
+            response = self.client.get(url, {'id': object_id} if object_id else {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        client_queries = sum(
+            'FROM "crud_api"."client"' in query['sql'] for query in queries.captured_queries
+        )
+        return len(queries), client_queries
+
+    def test_profile(self):
+        """Test profile resolves the client once, then reads it from the session cache."""
+        self.assertEqual(self.count_queries(reverse(config.PROFILE)), (6, 1))
+        self.assertEqual(self.count_queries(reverse(config.PROFILE)), (5, 0))
+
+    def test_stage(self):
+        """Test stage page checks the bet without loading the client stages."""
+        url = reverse(config.STAGE)
+        self.assertEqual(self.count_queries(url, self.stage.id), (5, 1))
+        self.assertEqual(self.count_queries(url, self.stage.id), (4, 0))
+
+    def test_bet(self):
+        """Test bet page reads the client from the session cache."""
+        self.count_queries(reverse(config.PROFILE))
+        self.assertEqual(self.count_queries(reverse('bet'), self.stage.id), (6, 0))
@@ -0,0 +1,155 @@
+"""Module for testing the wallet ledger."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase
+
+from competitions_app import config, wallet
+from competitions_app.models import Client, WalletEntry, WalletSnapshot
+from tests.app.cases import CommittingTestCase
+
+AMOUNT = Decimal(10)
+DEPOSITS = 200
+THREADS = 16
+WAIT_SECONDS = 10
+BLOCKED_SECONDS = 0.5
+
+
+def in_connection(function, *args):
+    """Call the function and close the connection of the thread.
+
+    Args:
+        function: callable using the database.
+        args: positional arguments.
+
+    Returns:
+        object: result of the function.
+    """
+    try:
+        return function(*args)
+    finally:
+        connection.close()
+
+
+def create_client():
+    """Create user with a client.
+
+    Returns:
+        Client: created client.
+    """
+    user = User.objects.create(username=config.TEST_USERNAME, password=config.TEST_PASSWORD)
+    return Client.objects.create(user=user)
+
+
+class TestWallet(TestCase):
+    """Test case for wallet operations.
+
+    Args:
+        TestCase: TestCase from Django.
+    """
+
+    def setUp(self):
+        """Create client."""
+        self.owner = create_client()
+
+    def test_deposit_and_debit(self):
+        """Test balance follows credits and debits."""
+        wallet.deposit(self.owner.id, AMOUNT)
+        wallet.debit(self.owner.id, AMOUNT - 1)
+        self.assertEqual(self.owner.money, 1)
+        with self.assertRaises(wallet.InsufficientFunds):
+            wallet.debit(self.owner.id, AMOUNT)
+        self.assertEqual(WalletEntry.objects.filter(client=self.owner).count(), 2)
+
+    def test_compaction(self):
+        """Test snapshots keep the balance and only the tail is summed afterwards."""
+        for _ in range(3):
+            wallet.deposit(self.owner.id, AMOUNT)
+        self.assertEqual(wallet.compact(min_entries=3, batch_size=1), 1)
+        self.assertEqual(wallet.compact(min_entries=1, batch_size=1), 0)
+        wallet.debit(self.owner.id, AMOUNT)
+        snapshot = WalletSnapshot.objects.get(client=self.owner)
+        self.assertEqual(snapshot.balance, AMOUNT * 3)
+        self.assertEqual(self.owner.money, AMOUNT * 2)
+        self.assertEqual(WalletEntry.objects.filter(client=self.owner).count(), 4)
+
+    def test_replay_and_audit(self):
+        """Test history replays to every balance and corrupted snapshots are found."""
+        wallet.deposit(self.owner.id, AMOUNT)
+        wallet.debit(self.owner.id, AMOUNT)
+        balances = [balance for _, balance in wallet.replay(self.owner.id)]
+        self.assertEqual(balances, [AMOUNT, 0])
+        wallet.compact(min_entries=1, batch_size=1)
+        self.assertEqual(wallet.audit(self.owner.id), [])
+        WalletSnapshot.objects.update(balance=AMOUNT)
+        self.assertEqual(len(wallet.audit(self.owner.id)), 1)
+
+    def test_commands(self):
+        """Test compaction and audit commands."""
+        wallet.deposit(self.owner.id, AMOUNT)
+        out = StringIO()
+        call_command('compact_wallets', '--min-entries=1', stdout=out)
+        self.assertIn('Snapshots created: 1', out.getvalue())
+        out = StringIO()
+        call_command('audit_wallet', config.TEST_USERNAME, stdout=out)
+        self.assertIn(str(AMOUNT), out.getvalue())
+
+
+class TestConcurrentCredits(CommittingTestCase):
+    """Stress test mixing concurrent credits, debits and compaction.
+
+    Args:
+        CommittingTestCase: TestCase committing to the database.
+    """
+
+    def test_no_lost_credits(self):
+        """Test every credit is counted and snapshots agree with the history."""
+        owner = create_client()
+
+        def operate(index):
+            wallet.deposit(owner.id, AMOUNT)
+            wallet.debit(owner.id, 1)
+            if not index % THREADS:
+                wallet.compact(min_entries=1, batch_size=1)
+
+        def credit(index):
+            try:
+                operate(index)
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            list(executor.map(credit, range(DEPOSITS)))
+
+        self.assertEqual(owner.money, (AMOUNT - 1) * DEPOSITS)
+        self.assertEqual(wallet.audit(owner.id), [])
+
+    def test_open_credit(self):
+        """Test compaction waits for an open credit with a lower entry id."""
+        owner = create_client()
+        inserted, release = threading.Event(), threading.Event()
+
+        def credit_and_wait():
+            with transaction.atomic():
+                wallet.deposit(owner.id, AMOUNT)
+                inserted.set()
+                release.wait(WAIT_SECONDS)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            open_credit = executor.submit(in_connection, credit_and_wait)
+            inserted.wait(WAIT_SECONDS)
+            executor.submit(in_connection, wallet.deposit, owner.id, AMOUNT).result()
+            compaction = executor.submit(in_connection, wallet.compact, 1, 1)
+            with self.assertRaises(TimeoutError):
+                compaction.result(timeout=BLOCKED_SECONDS)
+            release.set()
+            open_credit.result()
+            self.assertEqual(compaction.result(), 1)
+
+        self.assertEqual(owner.money, AMOUNT * 2)
+        self.assertEqual(wallet.audit(owner.id), [])